@@ -1,5 +1,13 @@
 import { apiFetch } from './client'
-import type { AlertDelivery, AlertSettings, AlertTestResult, Paginated } from '../types/api'
+import type {
+  AlertDeadLetter,
+  AlertDelivery,
+  AlertDestination,
+  AlertSettings,
+  AlertState,
+  AlertTestResult,
+  Paginated,
+} from '../types/api'
 
 export interface AlertSettingsUpdate {
   webhook_url?: string | null
@@ -8,6 +16,13 @@ export interface AlertSettingsUpdate {
   recovery_notifications_enabled?: boolean
 }
 
+export interface AlertDestinationCreate {
+  name: string
+  url: string
+  secret?: string | null
+  rate_limit?: number | null
+}
+
 export function fetchAlertSettings(): Promise<AlertSettings> {
   return apiFetch<AlertSettings>('/api/v1/admin/alerts/settings')
 }
@@ -30,3 +45,32 @@ export function fetchAlertDeliveries(page = 1, pageSize = 20): Promise<Paginated
 export function sendAlertTest(): Promise<AlertTestResult> {
   return apiFetch<AlertTestResult>('/api/v1/admin/alerts/test', { method: 'POST' })
 }
+
+export function fetchAlertDestinations(): Promise<AlertDestination[]> {
+  return apiFetch<AlertDestination[]>('/api/v1/admin/alerts/destinations')
+}
+
+export function createAlertDestination(payload: AlertDestinationCreate): Promise<AlertDestination> {
+  return apiFetch<AlertDestination>('/api/v1/admin/alerts/destinations', {
+    method: 'POST',
+    body: JSON.stringify(payload),
+  })
+}
+
+export function deleteAlertDestination(id: string): Promise<null> {
+  return apiFetch<null>(`/api/v1/admin/alerts/destinations/${id}`, { method: 'DELETE' })
+}
+
+export function fetchAlertDeadLetters(limit = 50): Promise<AlertDeadLetter[]> {
+  return apiFetch<AlertDeadLetter[]>(`/api/v1/admin/alerts/dead-letters?limit=${limit}`)
+}
+
+export function retryAlertDeadLetter(dispatchId: string): Promise<null> {
+  return apiFetch<null>(`/api/v1/admin/alerts/dead-letters/${dispatchId}/retry`, {
+    method: 'POST',
+  })
+}
+
+export function fetchAlertState(historyLimit = 50): Promise<AlertState> {
+  return apiFetch<AlertState>(`/api/v1/admin/alerts/state?history_limit=${historyLimit}`)
+}
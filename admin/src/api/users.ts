@@ -20,6 +20,16 @@ export function fetchUsers(params: UserListParams = {}): Promise<Paginated<UserP
   return apiFetch<Paginated<UserPublic>>(`/api/v1/admin/users${qs ? `?${qs}` : ''}`)
 }
 
+export function searchUsers(
+  q: string,
+  options: { limit?: number; prefix?: boolean } = {},
+): Promise<UserPublic[]> {
+  const search = new URLSearchParams({ q })
+  if (options.limit) search.set('limit', String(options.limit))
+  if (options.prefix) search.set('prefix', 'true')
+  return apiFetch<UserPublic[]>(`/api/v1/admin/users/search?${search.toString()}`)
+}
+
 export function fetchUser(id: string): Promise<UserPublic> {
   return apiFetch<UserPublic>(`/api/v1/admin/users/${id}`)
 }
@@ -23,6 +23,8 @@ const deliveryColumns: Column<AlertDelivery>[] = [
     render: (d) => new Date(d.created_at).toLocaleString('zh-CN'),
   },
   { key: 'event', header: '事件', render: (d) => d.event_type },
+  { key: 'destination', header: '目标', render: (d) => d.destination ?? '—' },
+  { key: 'attempt', header: '尝试', mono: true, render: (d) => String(d.attempt) },
   {
     key: 'status',
     header: '结果',
@@ -4,7 +4,13 @@ import { DataTable, TABLE_SCROLL_MAX_HEIGHT, type Column } from '../components/D
 import { LoadingBlock } from '../components/LoadingBlock'
 import { PageHeader } from '../components/PageHeader'
 import { StatusBadge } from '../components/StatusBadge'
-import type { BeatScheduleEntry, CeleryTaskInfo, CeleryWorkerInfo } from '../types/api'
+import type {
+  BeatScheduleEntry,
+  CeleryQueueInfo,
+  CeleryTaskInfo,
+  CeleryTaskTiming,
+  CeleryWorkerInfo,
+} from '../types/api'
 import shared from '../styles/shared.module.css'
 import styles from './CeleryPage.module.css'
 
@@ -21,6 +27,24 @@ const beatColumns: Column<BeatScheduleEntry>[] = [
   { key: 'schedule', header: '调度', mono: true, render: (e) => e.schedule },
 ]
 
+function seconds(value: number | null): string {
+  return value == null ? '—' : `${value.toFixed(2)}s`
+}
+
+const queueColumns: Column<CeleryQueueInfo>[] = [
+  { key: 'name', header: '队列', mono: true, render: (q) => q.name },
+  { key: 'length', header: '待处理消息', render: (q) => q.length },
+]
+
+const timingColumns: Column<CeleryTaskTiming>[] = [
+  { key: 'name', header: '任务名', mono: true, render: (t) => t.name },
+  { key: 'count', header: '执行次数', render: (t) => t.count },
+  { key: 'wait_avg', header: '平均排队', render: (t) => seconds(t.wait_avg_seconds) },
+  { key: 'wait_p95', header: '排队 P95', render: (t) => seconds(t.wait_p95_seconds) },
+  { key: 'runtime_avg', header: '平均耗时', render: (t) => seconds(t.runtime_avg_seconds) },
+  { key: 'runtime_p95', header: '耗时 P95', render: (t) => seconds(t.runtime_p95_seconds) },
+]
+
 const taskColumns: Column<CeleryTaskInfo>[] = [
   { key: 'worker', header: 'Worker', mono: true, render: (t) => t.worker },
   { key: 'id', header: '任务 ID', mono: true, render: (t) => t.task_id },
@@ -101,6 +125,27 @@ export function CeleryPage() {
         />
       </section>
 
+      <section className={shared.section}>
+        <h3 className={shared.sectionTitle}>队列</h3>
+        <DataTable
+          columns={queueColumns}
+          rows={data.queues ?? []}
+          rowKey={(q) => q.name}
+          emptyMessage="无队列数据"
+        />
+      </section>
+
+      <section className={shared.section}>
+        <h3 className={shared.sectionTitle}>任务耗时</h3>
+        <DataTable
+          columns={timingColumns}
+          rows={data.task_timings ?? []}
+          rowKey={(t) => t.name}
+          emptyMessage="暂无任务耗时数据"
+          scrollMaxHeight={TABLE_SCROLL_MAX_HEIGHT}
+        />
+      </section>
+
       <section className={shared.section}>
         <h3 className={shared.sectionTitle}>活跃任务</h3>
         <DataTable
@@ -7,8 +7,12 @@ export interface ApiResponse<T> {
 export interface Paginated<T> {
   items: T[]
   total: number
+  /** True when `total` is a planner estimate rather than an exact count. */
+  total_estimated?: boolean
   page: number
   page_size: number
+  /** Opaque keyset cursor for the next page; pass back as `cursor` to skip OFFSET and COUNT. */
+  next_cursor?: string | null
 }
 
 export interface UserPublic {
@@ -67,6 +71,20 @@ export interface CeleryTaskInfo {
   args: unknown[]
 }
 
+export interface CeleryQueueInfo {
+  name: string
+  length: number
+}
+
+export interface CeleryTaskTiming {
+  name: string
+  count: number
+  wait_avg_seconds: number | null
+  wait_p95_seconds: number | null
+  runtime_avg_seconds: number | null
+  runtime_p95_seconds: number | null
+}
+
 export interface BeatScheduleEntry {
   name: string
   task: string
@@ -80,6 +98,8 @@ export interface CeleryOverview {
   scheduled_tasks: CeleryTaskInfo[]
   reserved_tasks: CeleryTaskInfo[]
   beat_schedule: BeatScheduleEntry[]
+  queues: CeleryQueueInfo[]
+  task_timings: CeleryTaskTiming[]
   flower_url: string | null
   message: string | null
 }
@@ -113,9 +133,53 @@ export interface AlertDelivery {
   event_type: string
   success: boolean
   http_status: number | null
+  dispatch_id: string | null
+  destination: string | null
+  attempt: number
+  error: string | null
+  created_at: string
+}
+
+export interface AlertDestination {
+  id: string
+  name: string
+  url: string
+  secret_configured: boolean
+  rate_limit: number | null
   created_at: string
 }
 
+export interface AlertDeadLetter {
+  dispatch_id: string
+  destination: string
+  destination_name: string
+  event_type: string
+  payload: Record<string, unknown>
+  attempts: number
+  http_status: number | null
+  error: string | null
+  failed_at: string
+}
+
+export interface AlertCheckState {
+  check: string
+  status: string | null
+  since: string | null
+}
+
+export interface AlertStateChange {
+  check: string
+  previous: string | null
+  current: string
+  at: string
+  details: Record<string, unknown>
+}
+
+export interface AlertState {
+  checks: AlertCheckState[]
+  history: AlertStateChange[]
+}
+
 export interface AlertTestResult {
   sent: boolean
   http_status: number | null
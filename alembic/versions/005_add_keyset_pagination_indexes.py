@@ -0,0 +1,43 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], unique=False)
+    op.create_index("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"], unique=False)
+    op.create_index(
+        "ix_alert_deliveries_created_at_id",
+        "alert_deliveries",
+        ["created_at", "id"],
+        unique=False,
+    )
+    # The composite indexes lead with created_at, so the single-column ones are redundant.
+    op.drop_index(op.f("ix_audit_logs_created_at"), table_name="audit_logs")
+    op.drop_index(op.f("ix_alert_deliveries_created_at"), table_name="alert_deliveries")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_alert_deliveries_created_at"),
+        "alert_deliveries",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_audit_logs_created_at"), "audit_logs", ["created_at"], unique=False)
+    op.drop_index("ix_alert_deliveries_created_at_id", table_name="alert_deliveries")
+    op.drop_index("ix_audit_logs_created_at_id", table_name="audit_logs")
+    op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,117 @@
+"""partition audit_logs by month on created_at
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    "id, actor_id, action, resource_type, resource_id, detail, ip, user_agent, request_id,"
+    " created_at"
+)
+
+# One partition per month from the oldest row through three months ahead; later months
+# come from the nightly_maintenance task (app.db.partitions).
+_CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    bucket timestamptz;
+    last_month timestamptz := date_trunc('month', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+        + interval '3 months';
+BEGIN
+    SELECT date_trunc('month', min(created_at) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+    INTO bucket FROM audit_logs_legacy;
+    bucket := least(coalesce(bucket, last_month), last_month - interval '3 months');
+    WHILE bucket <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            'audit_logs_p' || to_char(bucket AT TIME ZONE 'UTC', 'YYYY_MM'),
+            bucket,
+            bucket + interval '1 month'
+        );
+        bucket := bucket + interval '1 month';
+    END LOOP;
+END $$;
+"""
+
+
+def _columns() -> list[sa.Column[object]]:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("actor_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("action", sa.String(length=100), nullable=False),
+        sa.Column("resource_type", sa.String(length=100), nullable=False),
+        sa.Column("resource_id", sa.String(length=255), nullable=True),
+        sa.Column("detail", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("ip", sa.String(length=45), nullable=True),
+        sa.Column("user_agent", sa.Text(), nullable=True),
+        sa.Column("request_id", sa.String(length=64), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["actor_id"], ["users.id"], ondelete="SET NULL"),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index(op.f("ix_audit_logs_action"), "audit_logs", ["action"], unique=False)
+    op.create_index(op.f("ix_audit_logs_actor_id"), "audit_logs", ["actor_id"], unique=False)
+    op.create_index(
+        op.f("ix_audit_logs_resource_type"), "audit_logs", ["resource_type"], unique=False
+    )
+    op.create_index("ix_audit_logs_created_at_id", "audit_logs", ["created_at", "id"], unique=False)
+
+
+def _set_aside(new_name: str) -> None:
+    """Rename the current table and free its index names for the replacement."""
+    op.drop_index("ix_audit_logs_created_at_id", table_name="audit_logs")
+    op.drop_index(op.f("ix_audit_logs_resource_type"), table_name="audit_logs")
+    op.drop_index(op.f("ix_audit_logs_actor_id"), table_name="audit_logs")
+    op.drop_index(op.f("ix_audit_logs_action"), table_name="audit_logs")
+    op.rename_table("audit_logs", new_name)
+    op.execute(f"ALTER TABLE {new_name} RENAME CONSTRAINT audit_logs_pkey TO {new_name}_pkey")
+
+
+def upgrade() -> None:
+    _set_aside("audit_logs_legacy")
+    op.create_table(
+        "audit_logs",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at", name="audit_logs_pkey"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    op.execute(_CREATE_MONTHLY_PARTITIONS)
+    op.execute(f"INSERT INTO audit_logs ({_COLUMNS}) SELECT {_COLUMNS} FROM audit_logs_legacy")
+    op.drop_table("audit_logs_legacy")
+    # Built after the copy; indexes on the parent cascade to every partition.
+    _create_indexes()
+
+
+def downgrade() -> None:
+    # Partitions detached by retention are independent tables and are left in place.
+    _set_aside("audit_logs_partitioned")
+    op.create_table(
+        "audit_logs",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", name="audit_logs_pkey"),
+    )
+    op.execute(f"INSERT INTO audit_logs ({_COLUMNS}) SELECT {_COLUMNS} FROM audit_logs_partitioned")
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+    _create_indexes()
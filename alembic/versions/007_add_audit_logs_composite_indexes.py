@@ -0,0 +1,54 @@
+"""replace single-column audit_logs indexes with (filter, created_at, id) composites
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_ORDER = [sa.text("created_at DESC"), sa.text("id DESC")]
+
+
+def upgrade() -> None:
+    # Admin filters are equality on one column plus newest-first ordering, so each
+    # filter column leads an index that already holds rows in page order.
+    for column in ("action", "actor_id", "resource_type"):
+        op.create_index(
+            f"ix_audit_logs_{column}_created_at_id",
+            "audit_logs",
+            [column, *_ORDER],
+            unique=False,
+        )
+    op.create_index(
+        "ix_audit_logs_user_resource_created_at_id",
+        "audit_logs",
+        ["resource_id", *_ORDER],
+        unique=False,
+        postgresql_where=sa.text("resource_type = 'user'"),
+    )
+    # The composites lead with the same columns, so these add nothing but write cost.
+    op.drop_index(op.f("ix_audit_logs_action"), table_name="audit_logs")
+    op.drop_index(op.f("ix_audit_logs_actor_id"), table_name="audit_logs")
+    op.drop_index(op.f("ix_audit_logs_resource_type"), table_name="audit_logs")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_audit_logs_action"), "audit_logs", ["action"], unique=False)
+    op.create_index(op.f("ix_audit_logs_actor_id"), "audit_logs", ["actor_id"], unique=False)
+    op.create_index(
+        op.f("ix_audit_logs_resource_type"), "audit_logs", ["resource_type"], unique=False
+    )
+    op.drop_index("ix_audit_logs_user_resource_created_at_id", table_name="audit_logs")
+    for column in ("resource_type", "actor_id", "action"):
+        op.drop_index(f"ix_audit_logs_{column}_created_at_id", table_name="audit_logs")
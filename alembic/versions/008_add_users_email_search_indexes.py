@@ -0,0 +1,39 @@
+"""add trigram and prefix indexes for admin email search
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_users_email_trgm",
+        "users",
+        [sa.text("lower(email) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    # LIKE 'abc%' can only use a btree in the C collation; ix_users_email is not.
+    op.create_index(
+        "ix_users_email_prefix", "users", [sa.text('(lower(email) COLLATE "C")')], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_prefix", table_name="users")
+    op.drop_index("ix_users_email_trgm", table_name="users")
+    # The extension is left installed; other objects may depend on it.
@@ -0,0 +1,57 @@
+"""add alert_destinations and per-attempt columns on alert_deliveries
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alert_destinations",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("secret", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.add_column(
+        "alert_deliveries",
+        sa.Column("dispatch_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "alert_deliveries", sa.Column("destination", sa.String(length=100), nullable=True)
+    )
+    op.add_column(
+        "alert_deliveries",
+        sa.Column("attempt", sa.Integer(), server_default=sa.text("1"), nullable=False),
+    )
+    op.add_column("alert_deliveries", sa.Column("error", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("alert_deliveries", "error")
+    op.drop_column("alert_deliveries", "attempt")
+    op.drop_column("alert_deliveries", "destination")
+    op.drop_column("alert_deliveries", "dispatch_id")
+    op.drop_table("alert_destinations")
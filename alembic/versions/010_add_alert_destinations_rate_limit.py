@@ -0,0 +1,26 @@
+"""add rate_limit to alert_destinations
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("alert_destinations", sa.Column("rate_limit", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("alert_destinations", "rate_limit")
@@ -7,14 +7,15 @@ from jose import JWTError
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.principal import Principal, get_principal_cache
 from app.cache.redis import get_redis_client
 from app.core.config import Settings, get_settings
 from app.core.exceptions import AppException
 from app.core.roles import ADMIN
 from app.core.security import get_subject_from_token
-from app.db.session import get_db
-from app.models.user import User
+from app.db.session import get_db, get_read_db
 from app.repositories.user import UserRepository
+from app.services.health_probes import HealthProbes
 
 security_scheme = HTTPBearer(auto_error=False)
 
@@ -28,15 +29,26 @@ async def get_settings_dep() -> Settings:
 
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
 RedisClient = Annotated[Redis, Depends(get_redis)]
 SettingsDep = Annotated[Settings, Depends(get_settings_dep)]
 
 
+async def get_health_probes(
+    db: DbSession, redis: RedisClient, settings: SettingsDep
+) -> HealthProbes:
+    # FastAPI caches dependencies per request, so every consumer shares one probe round.
+    return HealthProbes(db, redis, settings)
+
+
+HealthProbesDep = Annotated[HealthProbes, Depends(get_health_probes)]
+
+
 async def get_current_user(
     db: DbSession,
     settings: SettingsDep,
     credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
-) -> User:
+) -> Principal:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise AppException(
             "Not authenticated",
@@ -50,16 +62,24 @@ async def get_current_user(
     except (JWTError, ValueError) as exc:
         raise AppException("Invalid access token", code=40105, status_code=401) from exc
 
-    user = await UserRepository(db).get_by_id(user_id)
-    if not user or not user.is_active:
+    cache = get_principal_cache(settings)
+    principal = await cache.get(user_id)
+    if principal is None:
+        user = await UserRepository(db).get_by_id(user_id)
+        if not user:
+            raise AppException("User not found", code=40401, status_code=404)
+        principal = Principal.from_user(user)
+        await cache.set(principal)
+
+    if not principal.is_active:
         raise AppException("User not found", code=40401, status_code=404)
-    return user
+    return principal
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
-async def require_admin(current_user: CurrentUser) -> User:
+async def require_admin(current_user: CurrentUser) -> Principal:
     if current_user.role != ADMIN:
         raise AppException(
             "Admin access required",
@@ -69,4 +89,4 @@ async def require_admin(current_user: CurrentUser) -> User:
     return current_user
 
 
-AdminUser = Annotated[User, Depends(require_admin)]
+AdminUser = Annotated[Principal, Depends(require_admin)]
@@ -1,12 +1,19 @@
+import uuid
+
 from fastapi import APIRouter, Query, Request
 
-from app.api.deps import AdminUser, DbSession, SettingsDep
+from app.api.deps import AdminUser, DbSession, ReadDbSession, RedisClient, SettingsDep
 from app.middleware.client_ip import get_client_ip
 from app.middleware.request_id import get_request_id
+from app.repositories.counting import RowCounter
 from app.schemas.admin_alerts import (
+    AlertDeadLetterPublic,
     AlertDeliveryPublic,
+    AlertDestinationCreate,
+    AlertDestinationPublic,
     AlertSettingsPublic,
     AlertSettingsUpdate,
+    AlertStatePublic,
     AlertTestResult,
 )
 from app.schemas.common import ApiResponse
@@ -47,29 +54,123 @@ async def update_alert_settings(
 @router.get("/deliveries", response_model=ApiResponse[PaginatedResponse[AlertDeliveryPublic]])
 async def list_alert_deliveries(
     _admin: AdminUser,
-    db: DbSession,
+    db: ReadDbSession,
+    redis: RedisClient,
     settings: SettingsDep,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
 ) -> ApiResponse[PaginatedResponse[AlertDeliveryPublic]]:
     data = await AdminAlertsService(db, settings).list_deliveries(
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        counter=RowCounter.from_settings(db, settings, redis),
     )
     return ApiResponse(data=data)
 
 
+@router.get("/state", response_model=ApiResponse[AlertStatePublic])
+async def get_alert_state(
+    _admin: AdminUser,
+    db: DbSession,
+    redis: RedisClient,
+    settings: SettingsDep,
+    history_limit: int = Query(50, ge=1, le=500),
+) -> ApiResponse[AlertStatePublic]:
+    data = await AdminAlertsService(db, settings, redis).get_state(history_limit=history_limit)
+    return ApiResponse(data=data)
+
+
 @router.post("/test", response_model=ApiResponse[AlertTestResult])
 async def test_alert_webhook(
     admin: AdminUser,
     db: DbSession,
+    redis: RedisClient,
     settings: SettingsDep,
     request: Request,
 ) -> ApiResponse[AlertTestResult]:
-    data = await AdminAlertsService(db, settings).send_test(
+    data = await AdminAlertsService(db, settings, redis).send_test(
+        actor_id=admin.id,
+        ip=get_client_ip(request, trust_proxy_headers=settings.trust_proxy_headers),
+        user_agent=request.headers.get("user-agent"),
+        request_id=get_request_id(),
+    )
+    return ApiResponse(data=data)
+
+
+@router.get("/destinations", response_model=ApiResponse[list[AlertDestinationPublic]])
+async def list_alert_destinations(
+    _admin: AdminUser,
+    db: DbSession,
+    settings: SettingsDep,
+) -> ApiResponse[list[AlertDestinationPublic]]:
+    data = await AdminAlertsService(db, settings).list_destinations()
+    return ApiResponse(data=data)
+
+
+@router.post("/destinations", response_model=ApiResponse[AlertDestinationPublic])
+async def create_alert_destination(
+    payload: AlertDestinationCreate,
+    admin: AdminUser,
+    db: DbSession,
+    settings: SettingsDep,
+    request: Request,
+) -> ApiResponse[AlertDestinationPublic]:
+    data = await AdminAlertsService(db, settings).create_destination(
+        payload,
         actor_id=admin.id,
         ip=get_client_ip(request, trust_proxy_headers=settings.trust_proxy_headers),
         user_agent=request.headers.get("user-agent"),
         request_id=get_request_id(),
     )
     return ApiResponse(data=data)
+
+
+@router.delete("/destinations/{destination_id}", response_model=ApiResponse[None])
+async def delete_alert_destination(
+    destination_id: uuid.UUID,
+    admin: AdminUser,
+    db: DbSession,
+    settings: SettingsDep,
+    request: Request,
+) -> ApiResponse[None]:
+    await AdminAlertsService(db, settings).delete_destination(
+        destination_id,
+        actor_id=admin.id,
+        ip=get_client_ip(request, trust_proxy_headers=settings.trust_proxy_headers),
+        user_agent=request.headers.get("user-agent"),
+        request_id=get_request_id(),
+    )
+    return ApiResponse(data=None)
+
+
+@router.get("/dead-letters", response_model=ApiResponse[list[AlertDeadLetterPublic]])
+async def list_alert_dead_letters(
+    _admin: AdminUser,
+    db: DbSession,
+    redis: RedisClient,
+    settings: SettingsDep,
+    limit: int = Query(50, ge=1, le=500),
+) -> ApiResponse[list[AlertDeadLetterPublic]]:
+    data = await AdminAlertsService(db, settings, redis).list_dead_letters(limit=limit)
+    return ApiResponse(data=data)
+
+
+@router.post("/dead-letters/{dispatch_id}/retry", response_model=ApiResponse[None])
+async def retry_alert_dead_letter(
+    dispatch_id: str,
+    admin: AdminUser,
+    db: DbSession,
+    redis: RedisClient,
+    settings: SettingsDep,
+    request: Request,
+) -> ApiResponse[None]:
+    await AdminAlertsService(db, settings, redis).retry_dead_letter(
+        dispatch_id,
+        actor_id=admin.id,
+        ip=get_client_ip(request, trust_proxy_headers=settings.trust_proxy_headers),
+        user_agent=request.headers.get("user-agent"),
+        request_id=get_request_id(),
+    )
+    return ApiResponse(data=None)
@@ -1,16 +1,22 @@
 import uuid
-from collections.abc import AsyncIterator
 from datetime import datetime
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Request, status
 from starlette.responses import StreamingResponse
 
-from app.api.deps import AdminUser, DbSession, SettingsDep
+from app.api.deps import AdminUser, ReadDbSession, RedisClient, SettingsDep
+from app.core.exceptions import AppException
 from app.repositories.audit_log import AuditLogRepository
-from app.schemas.admin import AuditLogPublic
+from app.repositories.counting import RowCounter
+from app.repositories.pagination import Cursor
+from app.schemas.admin import AuditLogPublic, ExportJobCreate, ExportJobPublic
 from app.schemas.common import ApiResponse
 from app.schemas.pagination import PaginatedResponse
 from app.services.admin_audit import AdminAuditService
+from app.services.audit_export import EXPORT_FORMATS, ExportFormat
+from app.services.export_jobs import ExportJob, ExportJobService
+from app.services.export_storage import RangeNotSatisfiable, get_export_storage, parse_byte_range
+from app.tasks.exports import run_audit_export
 
 router = APIRouter()
 
@@ -18,7 +24,9 @@ router = APIRouter()
 @router.get("/audit-logs", response_model=ApiResponse[PaginatedResponse[AuditLogPublic]])
 async def list_audit_logs(
     _admin: AdminUser,
-    db: DbSession,
+    db: ReadDbSession,
+    redis: RedisClient,
+    settings: SettingsDep,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     action: str | None = None,
@@ -26,22 +34,38 @@ async def list_audit_logs(
     resource_type: str | None = None,
     since: datetime | None = None,
     until: datetime | None = None,
+    cursor: str | None = None,
 ) -> ApiResponse[PaginatedResponse[AuditLogPublic]]:
-    items, total = await AuditLogRepository(db).list_paginated(
-        page=page,
-        page_size=page_size,
-        action=action,
-        actor_id=actor_id,
-        resource_type=resource_type,
-        since=since,
-        until=until,
-    )
+    repo = AuditLogRepository(db)
+    if cursor is not None:
+        result = await repo.list_after(
+            cursor=Cursor.decode(cursor),
+            page_size=page_size,
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
+        )
+    else:
+        result = await repo.list_paginated(
+            page=page,
+            page_size=page_size,
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
+            counter=RowCounter.from_settings(db, settings, redis),
+        )
     return ApiResponse(
         data=PaginatedResponse(
-            items=[AuditLogPublic.model_validate(log) for log in items],
-            total=total,
-            page=page,
+            items=[AuditLogPublic.model_validate(log) for log in result.items],
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=page if cursor is None else None,
             page_size=page_size,
+            next_cursor=result.next_cursor,
         )
     )
 
@@ -49,28 +73,145 @@ async def list_audit_logs(
 @router.get("/audit-logs/export")
 async def export_audit_logs(
     _admin: AdminUser,
-    db: DbSession,
+    db: ReadDbSession,
     settings: SettingsDep,
+    format: ExportFormat = "csv",
+    gzip: bool = False,
     action: str | None = None,
     actor_id: uuid.UUID | None = None,
     resource_type: str | None = None,
     since: datetime | None = None,
     until: datetime | None = None,
 ) -> StreamingResponse:
-    service = AdminAuditService(db, settings)
+    stream = AdminAuditService(db, settings).export(
+        fmt=format,
+        gzip=gzip,
+        action=action,
+        actor_id=actor_id,
+        resource_type=resource_type,
+        since=since,
+        until=until,
+    )
+    info = EXPORT_FORMATS[format]
+    filename = f"audit-logs.{info.extension}"
+    headers = {}
+    if gzip:
+        # Served as a .gz file rather than Content-Encoding so clients keep it compressed.
+        filename += ".gz"
+    if settings.admin_audit_export_max_rows is not None:
+        headers["X-Export-Row-Limit"] = str(settings.admin_audit_export_max_rows)
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(
+        stream,
+        media_type="application/gzip" if gzip else info.media_type,
+        headers=headers,
+    )
 
-    async def stream() -> AsyncIterator[str]:
-        async for chunk in service.iter_export_rows(
-            action=action,
-            actor_id=actor_id,
-            resource_type=resource_type,
-            since=since,
-            until=until,
-        ):
-            yield chunk
 
+def _job_public(request: Request, job: ExportJob, *, reused: bool = False) -> ExportJobPublic:
+    download_url = None
+    if job.status == "succeeded":
+        download_url = request.app.url_path_for("download_export_job", job_id=job.id)
+    return ExportJobPublic(
+        id=job.id,
+        status=job.status,
+        format=job.format,
+        gzip=job.gzip,
+        filters=job.filters,
+        rows=job.rows,
+        bytes=job.bytes,
+        total_estimate=job.total_estimate,
+        progress=job.progress,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        reused=reused,
+        download_url=download_url,
+    )
+
+
+@router.post(
+    "/audit-logs/export-jobs",
+    response_model=ApiResponse[ExportJobPublic],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_export_job(
+    payload: ExportJobCreate,
+    request: Request,
+    _admin: AdminUser,
+    redis: RedisClient,
+    settings: SettingsDep,
+) -> ApiResponse[ExportJobPublic]:
+    job, reused = await ExportJobService(redis, settings).create(
+        fmt=payload.format,
+        gzip=payload.gzip,
+        filters=payload.model_dump(exclude={"format", "gzip"}),
+    )
+    if not reused:
+        run_audit_export.delay(job.id)
+    return ApiResponse(data=_job_public(request, job, reused=reused))
+
+
+@router.get("/audit-logs/export-jobs/{job_id}", response_model=ApiResponse[ExportJobPublic])
+async def get_export_job(
+    job_id: str,
+    request: Request,
+    _admin: AdminUser,
+    redis: RedisClient,
+    settings: SettingsDep,
+) -> ApiResponse[ExportJobPublic]:
+    job = await ExportJobService(redis, settings).require(job_id)
+    return ApiResponse(data=_job_public(request, job))
+
+
+@router.get("/audit-logs/export-jobs/{job_id}/download", name="download_export_job")
+async def download_export_job(
+    job_id: str,
+    _admin: AdminUser,
+    redis: RedisClient,
+    settings: SettingsDep,
+    range_header: str | None = Header(None, alias="Range"),
+    if_range: str | None = Header(None),
+) -> StreamingResponse:
+    """Serve a finished artifact; a single ``Range`` lets interrupted downloads resume."""
+    job = await ExportJobService(redis, settings).require(job_id)
+    if job.status != "succeeded":
+        raise AppException(
+            f"Export job is {job.status}", code=40901, status_code=status.HTTP_409_CONFLICT
+        )
+    storage = get_export_storage(settings)
+    size = await storage.size(job.artifact_key)
+    if size is None:
+        raise AppException(
+            "Export artifact has expired", code=41001, status_code=status.HTTP_410_GONE
+        )
+
+    etag = f'"{job.id}-{size}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f'attachment; filename="{job.filename}"',
+    }
+    # A stale If-Range means the client's partial copy is of something else: send it all.
+    byte_range = None
+    if if_range is None or if_range == etag:
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except RangeNotSatisfiable as exc:
+            raise AppException(
+                f"Range not satisfiable for {size} bytes",
+                code=41601,
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}"},
+            ) from exc
+
+    start, end = byte_range if byte_range is not None else (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1 if size else 0)
+    if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
     return StreamingResponse(
-        stream(),
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": 'attachment; filename="audit-logs.csv"'},
+        storage.read(job.artifact_key, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+        media_type=job.media_type,
+        headers=headers,
     )
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.deps import AdminUser
+from app.api.deps import AdminUser, RedisClient, SettingsDep
 from app.schemas.admin import CeleryOverview
 from app.schemas.common import ApiResponse
 from app.services.admin_celery import AdminCeleryService
@@ -9,6 +9,8 @@ router = APIRouter()
 
 
 @router.get("/celery/overview", response_model=ApiResponse[CeleryOverview])
-async def celery_overview(_admin: AdminUser) -> ApiResponse[CeleryOverview]:
-    result = await AdminCeleryService().get_overview()
+async def celery_overview(
+    _admin: AdminUser, redis: RedisClient, settings: SettingsDep
+) -> ApiResponse[CeleryOverview]:
+    result = await AdminCeleryService(settings, redis).get_overview()
     return ApiResponse(data=result)
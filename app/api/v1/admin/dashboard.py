@@ -1,9 +1,17 @@
 from fastapi import APIRouter
 
-from app.api.deps import AdminUser, DbSession, RedisClient, SettingsDep
+from app.api.deps import (
+    AdminUser,
+    DbSession,
+    HealthProbesDep,
+    ReadDbSession,
+    RedisClient,
+    SettingsDep,
+)
 from app.schemas.admin import DashboardStats
 from app.schemas.common import ApiResponse
 from app.services.admin_dashboard import AdminDashboardService
+from app.services.dashboard_snapshot import DashboardSnapshot
 
 router = APIRouter()
 
@@ -12,10 +20,13 @@ router = APIRouter()
 async def dashboard(
     _admin: AdminUser,
     db: DbSession,
+    read_db: ReadDbSession,
     redis: RedisClient,
     settings: SettingsDep,
+    probes: HealthProbesDep,
 ) -> ApiResponse[DashboardStats]:
-    result = await AdminDashboardService(db, redis, settings).get_stats()
+    service = AdminDashboardService(db, redis, settings, read_session=read_db, probes=probes)
+    result = await DashboardSnapshot(redis, settings).get_stats(service)
     return ApiResponse(data=result)
 
 
@@ -23,8 +34,10 @@ async def dashboard(
 async def metrics_summary(
     _admin: AdminUser,
     db: DbSession,
+    read_db: ReadDbSession,
     redis: RedisClient,
     settings: SettingsDep,
 ) -> ApiResponse[dict[str, float]]:
-    stats = await AdminDashboardService(db, redis, settings).get_stats()
-    return ApiResponse(data=stats.metrics_summary)
+    service = AdminDashboardService(db, redis, settings, read_session=read_db)
+    summary = await DashboardSnapshot(redis, settings).get_metrics_summary(service)
+    return ApiResponse(data=summary)
@@ -2,9 +2,10 @@ import uuid
 
 from fastapi import APIRouter, Query, Request
 
-from app.api.deps import AdminUser, DbSession, SettingsDep
+from app.api.deps import AdminUser, DbSession, ReadDbSession, RedisClient, SettingsDep
 from app.middleware.client_ip import get_client_ip
 from app.middleware.request_id import get_request_id
+from app.repositories.counting import RowCounter
 from app.schemas.admin import AuditLogPublic, PasswordResetResult, UserAdmin, UserUpdate
 from app.schemas.common import ApiResponse
 from app.schemas.pagination import PaginatedResponse
@@ -16,12 +17,15 @@ router = APIRouter()
 @router.get("/users", response_model=ApiResponse[PaginatedResponse[UserAdmin]])
 async def list_users(
     _admin: AdminUser,
-    db: DbSession,
+    db: ReadDbSession,
+    redis: RedisClient,
+    settings: SettingsDep,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     email: str | None = None,
     is_active: bool | None = None,
     role: str | None = None,
+    cursor: str | None = None,
 ) -> ApiResponse[PaginatedResponse[UserAdmin]]:
     result = await AdminUserService(db).list_users(
         page=page,
@@ -29,15 +33,34 @@ async def list_users(
         email=email,
         is_active=is_active,
         role=role,
+        cursor=cursor,
+        counter=RowCounter.from_settings(db, settings, redis),
     )
     return ApiResponse(data=result)
 
 
+@router.get("/users/search", response_model=ApiResponse[list[UserAdmin]])
+async def search_users(
+    _admin: AdminUser,
+    db: ReadDbSession,
+    q: str = Query(..., max_length=255),
+    limit: int = Query(20, ge=1, le=100),
+    prefix: bool = False,
+    is_active: bool | None = None,
+    role: str | None = None,
+) -> ApiResponse[list[UserAdmin]]:
+    """Email search ranked by similarity; ``prefix`` matches from the start only."""
+    items = await AdminUserService(db).search_users(
+        q, limit=limit, prefix=prefix, is_active=is_active, role=role
+    )
+    return ApiResponse(data=items)
+
+
 @router.get("/users/{user_id}", response_model=ApiResponse[UserAdmin])
 async def get_user(
     user_id: uuid.UUID,
     _admin: AdminUser,
-    db: DbSession,
+    db: ReadDbSession,
 ) -> ApiResponse[UserAdmin]:
     result = await AdminUserService(db).get_user(user_id)
     return ApiResponse(data=result)
@@ -72,7 +95,7 @@ async def update_user(
 async def list_user_audit_logs(
     user_id: uuid.UUID,
     _admin: AdminUser,
-    db: DbSession,
+    db: ReadDbSession,
     limit: int = Query(20, ge=1, le=100),
 ) -> ApiResponse[list[AuditLogPublic]]:
     items = await AdminUserService(db).list_user_audit_logs(user_id, limit=limit)
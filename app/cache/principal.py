@@ -0,0 +1,252 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.cache.redis import cache_get, cache_set, get_redis_client
+from app.core.auth_keys import PRINCIPAL_CACHE_PREFIX
+from app.core.config import Settings, get_settings
+from app.core.logging import get_logger
+from app.models.user import User
+
+logger = get_logger(__name__)
+
+PENDING_INVALIDATIONS_KEY = "pending_principal_invalidations"
+
+PRINCIPAL_CACHE_LOOKUPS = Counter(
+    "principal_cache_lookups_total",
+    "Authenticated principal cache lookups",
+    ["tier", "result"],
+)
+PRINCIPAL_CACHE_EVICTIONS = Counter(
+    "principal_cache_evictions_total",
+    "Entries dropped from the in-process principal cache",
+    ["reason"],
+)
+PRINCIPAL_CACHE_INVALIDATIONS = Counter(
+    "principal_cache_invalidations_total",
+    "Explicit principal cache invalidations",
+)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The subset of a user row needed to authenticate and authorize a request."""
+
+    id: uuid.UUID
+    email: str
+    is_active: bool
+    role: str
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_active=user.is_active,
+            role=user.role,
+            created_at=user.created_at,
+        )
+
+    def to_cache(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "email": self.email,
+            "is_active": self.is_active,
+            "role": self.role,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_cache(cls, raw: dict[str, Any]) -> "Principal":
+        return cls(
+            id=uuid.UUID(raw["id"]),
+            email=str(raw["email"]),
+            is_active=bool(raw["is_active"]),
+            role=str(raw["role"]),
+            created_at=datetime.fromisoformat(raw["created_at"]),
+        )
+
+
+class PrincipalCache:
+    """Two-tier principal cache: per-process TTL/LRU in front of an optional Redis tier.
+
+    The local tier is not invalidated across replicas, so keep its TTL short; explicit
+    invalidation clears this process and the shared Redis entry.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        max_entries: int = 10_000,
+        local_ttl_seconds: float = 5.0,
+        redis_enabled: bool = True,
+        redis_ttl_seconds: int = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.local_ttl_seconds = local_ttl_seconds
+        self.redis_enabled = redis_enabled
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[uuid.UUID, tuple[float, Principal]] = OrderedDict()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "PrincipalCache":
+        return cls(
+            enabled=settings.principal_cache_enabled,
+            max_entries=settings.principal_cache_max_entries,
+            local_ttl_seconds=settings.principal_cache_local_ttl_seconds,
+            redis_enabled=settings.principal_cache_redis_enabled,
+            redis_ttl_seconds=settings.principal_cache_redis_ttl_seconds,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, user_id: uuid.UUID) -> Principal | None:
+        if not self.enabled:
+            return None
+
+        principal = self._get_local(user_id)
+        if principal is not None:
+            PRINCIPAL_CACHE_LOOKUPS.labels(tier="local", result="hit").inc()
+            return principal
+        PRINCIPAL_CACHE_LOOKUPS.labels(tier="local", result="miss").inc()
+
+        if not self.redis_enabled:
+            return None
+
+        try:
+            raw = await cache_get(get_redis_client(), _redis_key(user_id))
+            principal = Principal.from_cache(raw) if isinstance(raw, dict) else None
+        except Exception:
+            logger.warning("principal_cache_redis_get_failed", user_id=str(user_id))
+            principal = None
+
+        if principal is None:
+            PRINCIPAL_CACHE_LOOKUPS.labels(tier="redis", result="miss").inc()
+            return None
+        PRINCIPAL_CACHE_LOOKUPS.labels(tier="redis", result="hit").inc()
+        self._set_local(principal)
+        return principal
+
+    async def set(self, principal: Principal) -> None:
+        if not self.enabled:
+            return
+        self._set_local(principal)
+        if not self.redis_enabled:
+            return
+        try:
+            await cache_set(
+                get_redis_client(),
+                _redis_key(principal.id),
+                principal.to_cache(),
+                ttl_seconds=self.redis_ttl_seconds,
+            )
+        except Exception:
+            logger.warning("principal_cache_redis_set_failed", user_id=str(principal.id))
+
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        PRINCIPAL_CACHE_INVALIDATIONS.inc()
+        self._entries.pop(user_id, None)
+        if not self.redis_enabled:
+            return
+        try:
+            await get_redis_client().delete(_redis_key(user_id))
+        except Exception:
+            logger.warning("principal_cache_redis_delete_failed", user_id=str(user_id))
+
+    async def invalidate_on_commit(self, session: AsyncSession, user_id: uuid.UUID) -> None:
+        """Invalidate now and again once ``session`` commits.
+
+        A request that misses the cache between this write and its commit still reads the
+        old row and caches it; the second invalidation drops that stale principal.
+        """
+        await self.invalidate(user_id)
+        session.info.setdefault(PENDING_INVALIDATIONS_KEY, []).append((self, user_id))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _get_local(self, user_id: uuid.UUID) -> Principal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= self._clock():
+            del self._entries[user_id]
+            PRINCIPAL_CACHE_EVICTIONS.labels(reason="expired").inc()
+            return None
+        self._entries.move_to_end(user_id)
+        return principal
+
+    def _set_local(self, principal: Principal) -> None:
+        if self.max_entries <= 0 or self.local_ttl_seconds <= 0:
+            return
+        self._entries[principal.id] = (self._clock() + self.local_ttl_seconds, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            PRINCIPAL_CACHE_EVICTIONS.labels(reason="capacity").inc()
+
+
+def _redis_key(user_id: uuid.UUID) -> str:
+    return f"{PRINCIPAL_CACHE_PREFIX}{user_id}"
+
+
+# Keeps post-commit invalidations referenced until they finish.
+_invalidation_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _invalidate_all(pending: list[tuple[PrincipalCache, uuid.UUID]]) -> None:
+    for cache, user_id in pending:
+        await cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    pending = session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+    if not pending:
+        return
+    # The local tier is cleared before control returns to the committing coroutine; the
+    # Redis delete runs on the loop right after.
+    for cache, user_id in pending:
+        cache._entries.pop(user_id, None)
+    task = asyncio.get_running_loop().create_task(_invalidate_all(pending))
+    _invalidation_tasks.add(task)
+    task.add_done_callback(_invalidation_tasks.discard)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_invalidations(session: Session, transaction: SessionTransaction) -> None:
+    # Reached without after_commit only when the outer transaction rolled back.
+    if transaction.parent is None:
+        session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+
+
+_principal_cache: PrincipalCache | None = None
+
+
+def get_principal_cache(settings: Settings | None = None) -> PrincipalCache:
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache.from_settings(settings or get_settings())
+    return _principal_cache
+
+
+def reset_principal_cache() -> None:
+    global _principal_cache
+    _principal_cache = None
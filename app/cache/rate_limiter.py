@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from app.core.config import RateLimitAlgorithm
+
+# Each script takes KEYS[1] and ARGV = (limit, window_ms) and returns
+# {allowed, remaining, retry_after_ms, reset_ms}. Time comes from the Redis server so
+# every API replica shares one clock.
+
+_FIXED_WINDOW = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local count = redis.call('INCR', KEYS[1])
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+  redis.call('PEXPIRE', KEYS[1], window_ms)
+  ttl = window_ms
+end
+if count > limit then
+  return {0, 0, ttl, ttl}
+end
+return {1, limit - count, 0, ttl}
+"""
+
+_SLIDING_WINDOW = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = math.floor(now / window_ms)
+local elapsed = now - window * window_ms
+
+local state = redis.call('HMGET', KEYS[1], 'w', 'c', 'p')
+local w = tonumber(state[1])
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if w == nil or w < window - 1 then
+  current = 0
+  previous = 0
+elseif w == window - 1 then
+  previous = current
+  current = 0
+end
+
+local weight = (window_ms - elapsed) / window_ms
+local estimated = previous * weight + current
+local reset = window_ms - elapsed
+if estimated + 1 > limit then
+  local retry = reset
+  local room = limit - current - 1
+  if previous > 0 and room >= 0 then
+    retry = math.max(math.ceil(window_ms * (1 - room / previous)) - elapsed, 1)
+  elseif current > 0 then
+    retry = reset + math.ceil(window_ms * (1 - (limit - 1) / current))
+  end
+  redis.call('HSET', KEYS[1], 'w', window, 'c', current, 'p', previous)
+  redis.call('PEXPIRE', KEYS[1], window_ms * 2)
+  return {0, 0, retry, reset}
+end
+
+current = current + 1
+redis.call('HSET', KEYS[1], 'w', window, 'c', current, 'p', previous)
+redis.call('PEXPIRE', KEYS[1], window_ms * 2)
+return {1, math.max(math.floor(limit - estimated - 1), 0), 0, reset}
+"""
+
+_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local rate = capacity / window_ms
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+
+local allowed = 0
+local retry = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  retry = math.ceil((1 - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window_ms + 1000)
+return {allowed, math.floor(tokens), retry, math.ceil((capacity - tokens) / rate)}
+"""
+
+_SCRIPTS: dict[RateLimitAlgorithm, str] = {
+    "fixed_window": _FIXED_WINDOW,
+    "sliding_window": _SLIDING_WINDOW,
+    "token_bucket": _TOKEN_BUCKET,
+}
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after_ms: int
+    reset_ms: int
+
+
+class RedisRateLimiter:
+    """Applies a rate limit in one atomic ``EVALSHA`` round trip per request."""
+
+    def __init__(self) -> None:
+        self._client: Redis | None = None
+        self._scripts: dict[RateLimitAlgorithm, AsyncScript] = {}
+
+    def _script(self, redis: Redis, algorithm: RateLimitAlgorithm) -> AsyncScript:
+        if redis is not self._client:
+            self._client = redis
+            self._scripts = {}
+        script = self._scripts.get(algorithm)
+        if script is None:
+            script = redis.register_script(_SCRIPTS[algorithm])
+            self._scripts[algorithm] = script
+        return script
+
+    async def hit(
+        self,
+        redis: Redis,
+        key: str,
+        *,
+        algorithm: RateLimitAlgorithm,
+        limit: int,
+        window_seconds: int,
+    ) -> RateLimitResult:
+        script = self._script(redis, algorithm)
+        allowed, remaining, retry_after_ms, reset_ms = await script(
+            keys=[key],
+            args=[limit, window_seconds * 1000],
+        )
+        return RateLimitResult(
+            allowed=bool(int(allowed)),
+            limit=limit,
+            remaining=int(remaining),
+            retry_after_ms=int(retry_after_ms),
+            reset_ms=int(reset_ms),
+        )
@@ -1,4 +1,13 @@
-ALERT_DEDUPE_PREFIX = "alert:dedupe:"
-ALERT_STATE_READY = "alert:state:ready"
-ALERT_STATE_BEAT = "alert:state:beat"
-ALERT_WORKER_ZERO_SINCE = "alert:worker_zero_since"
+ALERT_STATE_KEY = "alert:state"
+ALERT_STATE_HISTORY_KEY = "alert:state:history"
+# Per-check status keys from before the state hash; read once to seed it, then deleted.
+LEGACY_ALERT_STATE_KEYS = {
+    "ready": "alert:state:ready",
+    "beat": "alert:state:beat",
+    "workers": "alert:state:workers",
+}
+ALERT_DEAD_LETTER_KEY = "alert:dead_letter"
+ALERT_PENDING_KEY = "alert:group:pending"
+ALERT_GROUP_OPENED_KEY = "alert:group:opened_at"
+ALERT_RATE_PREFIX = "alert:rate:"
+ALERT_SUPPRESSED_PREFIX = "alert:suppressed:"
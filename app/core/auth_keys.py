@@ -0,0 +1 @@
+PRINCIPAL_CACHE_PREFIX = "auth:principal:"
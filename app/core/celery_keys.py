@@ -1 +1,4 @@
 BEAT_HEARTBEAT_REDIS_KEY = "celery:beat:heartbeat"
+CELERY_STATE_REDIS_KEY = "celery:state:snapshot"
+CELERY_TASK_METRICS_PREFIX = "celery:metrics:task:"
+CELERY_TASK_METRICS_NAMES_KEY = "celery:metrics:tasks"
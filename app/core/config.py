@@ -1,11 +1,28 @@
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _DEFAULT_JWT_SECRET = "change-me-to-a-long-random-secret-in-production"
 
+RateLimitAlgorithm = Literal["fixed_window", "sliding_window", "token_bucket"]
+CountStrategy = Literal["exact", "estimate", "cached", "auto"]
+ExportStorageBackend = Literal["local"]
+AuditWriteMode = Literal["sync", "buffered"]
+AlertDeliveryMode = Literal["queued", "inline"]
+RetentionAction = Literal["detach", "drop"]
+
+
+class RateLimitRule(BaseModel):
+    """Limit applied to requests whose path starts with ``prefix`` (longest match wins)."""
+
+    prefix: str
+    limit: int = Field(ge=1)
+    window_seconds: int = Field(default=60, ge=1)
+    algorithm: RateLimitAlgorithm | None = None
+    scope: Literal["ip", "principal"] = "ip"
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -27,11 +44,38 @@ class Settings(BaseSettings):
     )
     redis_url: str = Field(default="redis://localhost:6379/0")
 
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_pool_warmup_connections: int = Field(default=0, ge=0)
+    db_statement_cache_size: int = Field(default=100, ge=0)
+    db_statement_timeout_ms: int | None = None
+    db_echo: bool | None = None
+
+    database_replica_url: str | None = None
+    db_replica_max_lag_seconds: float = Field(default=5.0, ge=0)
+    db_replica_lag_check_interval_seconds: float = Field(default=5.0, gt=0)
+
+    health_probe_timeout_seconds: float = Field(default=2.0, gt=0)
+    migration_status_cache_seconds: float = Field(default=30.0, ge=0)
+
     jwt_secret: str = _DEFAULT_JWT_SECRET
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    principal_cache_enabled: bool = True
+    principal_cache_max_entries: int = 10_000
+    principal_cache_local_ttl_seconds: float = 5.0
+    principal_cache_redis_enabled: bool = True
+    principal_cache_redis_ttl_seconds: int = 60
+
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+    password_hash_executor: Literal["thread", "process"] = "thread"
+
     cors_origins: list[str] = [
         "http://localhost:3000",
         "http://localhost:5173",
@@ -39,6 +83,13 @@ class Settings(BaseSettings):
         "https://localhost",
     ]
     rate_limit_per_minute: int = 100
+    rate_limit_algorithm: RateLimitAlgorithm = "fixed_window"
+    rate_limit_rules: list[RateLimitRule] = []
+    rate_limit_local_enabled: bool = True
+    rate_limit_local_threshold: float = Field(default=2.0, gt=0)
+    rate_limit_local_sketch_width: int = Field(default=2048, ge=16)
+    rate_limit_local_sketch_depth: int = Field(default=4, ge=1)
+    rate_limit_local_max_blocked: int = 10_000
     trust_proxy_headers: bool = False
 
     celery_timezone: str = "UTC"
@@ -46,11 +97,46 @@ class Settings(BaseSettings):
     celery_beat_schedule_file: str = "logs/celerybeat-schedule"
     celery_inspect_timeout: float = 5.0
     celery_inspect_overall_timeout: float = 15.0
-
-    admin_audit_export_max_rows: int = 5000
+    celery_state_enabled: bool = True
+    celery_state_publish_interval_seconds: float = 2.0
+    celery_state_max_age_seconds: float = 10.0
+    celery_state_max_tasks: int = 10_000
+    celery_task_metrics_enabled: bool = True
+
+    admin_audit_export_max_rows: int | None = None
+    admin_audit_export_batch_size: int = Field(default=1000, ge=1)
+    admin_audit_export_chunk_bytes: int = Field(default=64 * 1024, ge=1)
+    admin_export_storage_backend: ExportStorageBackend = "local"
+    admin_export_storage_dir: str = "exports"
+    admin_export_job_ttl_seconds: int = Field(default=86400, ge=60)
+    admin_export_dedupe_seconds: int = Field(default=900, ge=0)
+    admin_export_progress_interval_seconds: float = Field(default=1.0, gt=0)
+    admin_export_stale_seconds: float = Field(default=60.0, gt=0)
+    admin_count_strategy: CountStrategy = "auto"
+    admin_count_estimate_threshold: int = Field(default=100_000, ge=0)
+    admin_count_cache_ttl_seconds: int = Field(default=30, ge=0)
+    admin_dashboard_cache_enabled: bool = True
+    admin_dashboard_users_ttl_seconds: float = Field(default=60.0, ge=0)
+    admin_dashboard_services_ttl_seconds: float = Field(default=5.0, ge=0)
+    admin_dashboard_metrics_ttl_seconds: float = Field(default=15.0, ge=0)
+    admin_dashboard_system_ttl_seconds: float = Field(default=15.0, ge=0)
+    admin_dashboard_stale_seconds: int = Field(default=300, ge=0)
+    admin_dashboard_lock_seconds: float = Field(default=10.0, gt=0)
+    admin_dashboard_refresh_interval_seconds: float = Field(default=60.0, ge=0)
     admin_reported_api_replicas: int | None = None
     flower_url: str | None = None
 
+    audit_write_mode: AuditWriteMode = "sync"
+    audit_sync_actions: list[str] = Field(
+        default_factory=lambda: ["user.update", "user.reset_password"]
+    )
+    audit_buffer_max_batch: int = Field(default=500, ge=1, le=2000)
+    audit_buffer_max_latency_ms: int = Field(default=200, ge=1)
+    audit_buffer_max_pending: int = Field(default=10_000, ge=1)
+    audit_partition_months_ahead: int = Field(default=3, ge=1)
+    audit_retention_months: int | None = Field(default=None, ge=1)
+    audit_retention_action: RetentionAction = "detach"
+
     alert_webhook_url: str | None = None
     alert_webhook_secret: str | None = None
     alert_webhook_timeout_seconds: float = 10.0
@@ -58,11 +144,26 @@ class Settings(BaseSettings):
     alert_check_interval_seconds: int = 120
     alert_worker_zero_enabled: bool = False
     alert_worker_zero_duration_seconds: int = 300
+    alert_delivery_mode: AlertDeliveryMode = "queued"
+    alert_delivery_max_attempts: int = Field(default=6, ge=1)
+    alert_delivery_backoff_base_seconds: float = 5.0
+    alert_delivery_backoff_max_seconds: float = 600.0
+    alert_dead_letter_max_entries: int = 1000
+    alert_state_history_max_entries: int = Field(default=500, ge=1)
+    alert_group_window_seconds: int = Field(default=0, ge=0)
+    alert_destination_rate_limit: int = Field(default=0, ge=0)
+    alert_destination_rate_window_seconds: int = Field(default=3600, ge=1)
 
     loki_url: str | None = None
     loki_query_timeout_seconds: float = 15.0
     loki_max_lines: int = 500
 
+    http_client_max_connections: int = 100
+    http_client_max_keepalive_connections: int = 20
+    http_client_keepalive_expiry_seconds: float = 30.0
+    http_client_connect_timeout_seconds: float = 5.0
+    http_client_http2: bool = True
+
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, value: object) -> list[str]:
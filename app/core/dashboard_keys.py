@@ -0,0 +1,2 @@
+DASHBOARD_SNAPSHOT_PREFIX = "admin:dashboard:snapshot:"
+DASHBOARD_LOCK_PREFIX = "admin:dashboard:lock:"
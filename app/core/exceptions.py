@@ -21,11 +21,13 @@ class AppException(Exception):
         code: int = 40001,
         status_code: int = status.HTTP_400_BAD_REQUEST,
         data: Any = None,
+        headers: dict[str, str] | None = None,
     ) -> None:
         self.message = message
         self.code = code
         self.status_code = status_code
         self.data = data
+        self.headers = headers
         super().__init__(message)
 
 
@@ -35,10 +37,12 @@ def _json_error_response(
     code: int,
     message: str,
     data: Any = None,
+    headers: dict[str, str] | None = None,
 ) -> JSONResponse:
     response = JSONResponse(
         status_code=status_code,
         content=ApiResponse(code=code, message=message, data=data).model_dump(),
+        headers=headers,
     )
     return apply_request_id_header(response)
 
@@ -53,6 +57,7 @@ def register_exception_handlers(app: FastAPI) -> None:
             code=exc.code,
             message=exc.message,
             data=exc.data,
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
@@ -0,0 +1,2 @@
+EXPORT_JOB_PREFIX = "export:job:"
+EXPORT_DEDUPE_PREFIX = "export:dedupe:"
@@ -0,0 +1,136 @@
+import importlib.util
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Literal
+
+import httpx
+from prometheus_client import Counter, Histogram
+
+from app.core.config import Settings, get_settings
+
+HttpDestination = Literal["webhook", "loki"]
+
+HTTP_CLIENT_REQUESTS = Counter(
+    "http_client_requests_total",
+    "Outbound HTTP requests by destination and outcome: status class, or error",
+    ["destination", "status"],
+)
+HTTP_CLIENT_DURATION = Histogram(
+    "http_client_request_duration_seconds",
+    "Time from sending an outbound request to receiving its response headers",
+    ["destination"],
+)
+
+_STARTED_AT = "fastapi_kit.started_at"
+
+_registry: "HttpClientRegistry | None" = None
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """One pooled, keep-alive ``httpx.AsyncClient`` per destination.
+
+    Clients are created on first use and bound to the running event loop, so a registry
+    belongs to one loop: the API lifespan or a Celery worker runtime.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+        self._clients: dict[HttpDestination, httpx.AsyncClient] = {}
+
+    def get(self, destination: HttpDestination) -> httpx.AsyncClient:
+        client = self._clients.get(destination)
+        if client is None:
+            client = self._clients[destination] = build_client(destination, self.settings)
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+class _InstrumentedClient(httpx.AsyncClient):
+    """Counts each request once: by its final status class, or ``error`` when ``send``
+    raises a transport error (connect errors, timeouts, a body that breaks off mid-read).
+    """
+
+    def __init__(self, destination: HttpDestination, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.destination = destination
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        try:
+            response = await super().send(request, **kwargs)
+        except httpx.TransportError:
+            HTTP_CLIENT_REQUESTS.labels(destination=self.destination, status="error").inc()
+            raise
+        HTTP_CLIENT_REQUESTS.labels(
+            destination=self.destination, status=f"{response.status_code // 100}xx"
+        ).inc()
+        return response
+
+
+def build_client(
+    destination: HttpDestination,
+    settings: Settings,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    read_timeout = {
+        "webhook": settings.alert_webhook_timeout_seconds,
+        "loki": settings.loki_query_timeout_seconds,
+    }[destination]
+
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions[_STARTED_AT] = time.perf_counter()
+
+    async def on_response(response: httpx.Response) -> None:
+        started = response.request.extensions.get(_STARTED_AT)
+        if started is not None:
+            HTTP_CLIENT_DURATION.labels(destination=destination).observe(
+                time.perf_counter() - started
+            )
+
+    return _InstrumentedClient(
+        destination,
+        timeout=httpx.Timeout(read_timeout, connect=settings.http_client_connect_timeout_seconds),
+        limits=httpx.Limits(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+        ),
+        http2=settings.http_client_http2 and _http2_available(),
+        event_hooks={"request": [on_request], "response": [on_response]},
+        transport=transport,
+    )
+
+
+def start_http_clients(settings: Settings | None = None) -> HttpClientRegistry:
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry(settings or get_settings())
+    return _registry
+
+
+async def close_http_clients() -> None:
+    global _registry
+    if _registry is not None:
+        registry, _registry = _registry, None
+        await registry.aclose()
+
+
+@asynccontextmanager
+async def http_client(
+    destination: HttpDestination, settings: Settings | None = None
+) -> AsyncIterator[httpx.AsyncClient]:
+    """The shared client for ``destination``; a one-off client when no registry is running."""
+    if _registry is not None:
+        yield _registry.get(destination)
+        return
+    async with build_client(destination, settings or get_settings()) as client:
+        yield client
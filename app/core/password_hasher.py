@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from fastapi import status
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.config import Settings, get_settings
+from app.core.exceptions import AppException
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+PasswordOperation = Literal["hash", "verify"]
+
+PASSWORD_HASH_BUSY_CODE = 50302
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hash/verify jobs queued or running in the worker pool",
+)
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password job waited for a pool worker",
+    ["operation"],
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password in a pool worker",
+    ["operation"],
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password jobs rejected because the worker pool was saturated",
+    ["operation"],
+)
+
+
+def _timed(fn: Callable[..., T], *args: Any) -> tuple[T, float]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded worker pool.
+
+    At most ``workers + max_pending`` jobs are admitted at once; beyond that callers
+    get a 503 instead of queueing unboundedly behind other logins.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        max_pending: int = 64,
+        executor: Literal["thread", "process"] = "thread",
+    ) -> None:
+        self.capacity = workers + max_pending
+        self._in_flight = 0
+        self._executor: Executor
+        if executor == "process":
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="password-hash"
+            )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "PasswordHasher":
+        return cls(
+            workers=settings.password_hash_workers,
+            max_pending=settings.password_hash_max_pending,
+            executor=settings.password_hash_executor,
+        )
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def hash(self, password: str) -> str:
+        return await self._submit("hash", get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit("verify", verify_password, plain_password, hashed_password)
+
+    async def _submit(self, operation: PasswordOperation, fn: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.capacity:
+            PASSWORD_HASH_REJECTED.labels(operation=operation).inc()
+            raise AppException(
+                "Server is busy, please retry shortly",
+                code=PASSWORD_HASH_BUSY_CODE,
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        self._in_flight += 1
+        PASSWORD_HASH_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(self._executor, _timed, fn, *args)
+        finally:
+            self._in_flight -= 1
+            PASSWORD_HASH_IN_FLIGHT.dec()
+
+        total = time.perf_counter() - start
+        PASSWORD_HASH_DURATION.labels(operation=operation).observe(elapsed)
+        PASSWORD_HASH_QUEUE_WAIT.labels(operation=operation).observe(max(total - elapsed, 0.0))
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_password_hasher: PasswordHasher | None = None
+
+
+def get_password_hasher(settings: Settings | None = None) -> PasswordHasher:
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher.from_settings(settings or get_settings())
+    return _password_hasher
+
+
+async def close_password_hasher() -> None:
+    global _password_hasher
+    if _password_hasher is not None:
+        hasher, _password_hasher = _password_hasher, None
+        # Waits for the jobs already running, which must not stall the loop meanwhile.
+        await asyncio.to_thread(hasher.shutdown)
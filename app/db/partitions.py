@@ -0,0 +1,157 @@
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import RetentionAction
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_IS_PARTITIONED_SQL = text(
+    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = CAST(:table AS regclass))"
+)
+_EXISTS_SQL = text("SELECT to_regclass(:name) IS NOT NULL")
+_PARTITIONS_SQL = text(
+    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+    " WHERE i.inhparent = CAST(:table AS regclass)"
+)
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    name: str
+    start: date
+
+    @property
+    def end(self) -> date:
+        return add_months(self.start, 1)
+
+
+class MonthlyPartitionManager:
+    """Keeps a table range-partitioned by month on ``created_at``.
+
+    Partitions are named ``<table>_pYYYY_MM`` and bounded in UTC; anything else attached
+    to the table, including the ``<table>_default`` catch-all, is left alone.
+    """
+
+    def __init__(self, table: str) -> None:
+        self.table = table
+        self.default_partition = f"{table}_default"
+        self._name_pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$")
+
+    def partition_for(self, month: date) -> MonthlyPartition:
+        start = month_start(month)
+        return MonthlyPartition(f"{self.table}_p{start:%Y_%m}", start)
+
+    async def is_partitioned(self, conn: AsyncConnection) -> bool:
+        return bool(await conn.scalar(_IS_PARTITIONED_SQL, {"table": self.table}))
+
+    async def partitions(self, conn: AsyncConnection) -> list[MonthlyPartition]:
+        found = []
+        for name in (await conn.scalars(_PARTITIONS_SQL, {"table": self.table})).all():
+            match = self._name_pattern.match(name)
+            if match:
+                found.append(MonthlyPartition(name, date(int(match[1]), int(match[2]), 1)))
+        return sorted(found, key=lambda partition: partition.start)
+
+    async def ensure_months(
+        self, conn: AsyncConnection, *, months_ahead: int, today: date | None = None
+    ) -> list[str]:
+        """Create partitions from the current month through ``months_ahead`` months out."""
+        first = month_start(today or datetime.now(UTC).date())
+        existing = {partition.name for partition in await self.partitions(conn)}
+        has_default = await self._has_default(conn)
+        created = []
+        for offset in range(months_ahead + 1):
+            partition = self.partition_for(add_months(first, offset))
+            if partition.name not in existing:
+                await self._create(conn, partition, has_default=has_default)
+                created.append(partition.name)
+        return created
+
+    async def apply_retention(
+        self,
+        conn: AsyncConnection,
+        *,
+        keep_months: int,
+        action: RetentionAction,
+        today: date | None = None,
+    ) -> list[str]:
+        """Detach or drop partitions that end before the retention window starts.
+
+        Detached partitions stay as ordinary tables for archiving; dropping frees the
+        space immediately. Either way it is a catalog change, not a bulk ``DELETE``.
+        """
+        cutoff = add_months(month_start(today or datetime.now(UTC).date()), -keep_months)
+        expired = [p for p in await self.partitions(conn) if p.end <= cutoff]
+        for partition in expired:
+            await conn.execute(text(f"ALTER TABLE {self.table} DETACH PARTITION {partition.name}"))
+            if action == "drop":
+                await conn.execute(text(f"DROP TABLE {partition.name}"))
+            logger.info("partition_expired", partition=partition.name, action=action)
+        if await self._has_default(conn):
+            await conn.execute(
+                text(f"DELETE FROM {self.default_partition} WHERE created_at < :cutoff"),
+                {"cutoff": _utc(cutoff)},
+            )
+        return [partition.name for partition in expired]
+
+    async def _has_default(self, conn: AsyncConnection) -> bool:
+        return bool(await conn.scalar(_EXISTS_SQL, {"name": self.default_partition}))
+
+    async def _create(
+        self, conn: AsyncConnection, partition: MonthlyPartition, *, has_default: bool
+    ) -> None:
+        bounds = {"start": _utc(partition.start), "end": _utc(partition.end)}
+        # Postgres refuses a new partition while the default holds rows in its range,
+        # so move those rows across with the default detached.
+        stranded = has_default and await conn.scalar(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {self.default_partition}"
+                " WHERE created_at >= :start AND created_at < :end)"
+            ),
+            bounds,
+        )
+        if stranded:
+            await conn.execute(
+                text(f"ALTER TABLE {self.table} DETACH PARTITION {self.default_partition}")
+            )
+        await conn.execute(
+            text(
+                f"CREATE TABLE {partition.name} PARTITION OF {self.table}"
+                f" FOR VALUES FROM ('{bounds['start'].isoformat()}')"
+                f" TO ('{bounds['end'].isoformat()}')"
+            )
+        )
+        if stranded:
+            await conn.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {self.default_partition}"
+                    " WHERE created_at >= :start AND created_at < :end RETURNING *)"
+                    f" INSERT INTO {self.table} SELECT * FROM moved"
+                ),
+                bounds,
+            )
+            await conn.execute(
+                text(f"ALTER TABLE {self.table} ATTACH PARTITION {self.default_partition} DEFAULT")
+            )
+        logger.info("partition_created", partition=partition.name, moved_rows=bool(stranded))
+
+
+def _utc(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day, tzinfo=UTC)
+
+
+audit_log_partitions = MonthlyPartitionManager("audit_logs")
@@ -0,0 +1,47 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the SQLAlchemy pool",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Pool checkouts that gave up after pool_timeout",
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured persistent connections in the pool")
+DB_POOL_IN_USE = Gauge("db_pool_connections_in_use", "Connections currently checked out")
+DB_POOL_IDLE = Gauge("db_pool_connections_idle", "Connections idle in the pool")
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is still filling)",
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records checkout wait time and timeouts."""
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def bind_pool_gauges(engine: AsyncEngine) -> None:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return
+    DB_POOL_SIZE.set_function(lambda: float(pool.size()))
+    DB_POOL_IN_USE.set_function(lambda: float(pool.checkedout()))
+    DB_POOL_IDLE.set_function(lambda: float(pool.checkedin()))
+    DB_POOL_OVERFLOW.set_function(lambda: float(pool.overflow()))
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import Connection, Engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session, UOWTransaction
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PRIMARY_WRITE_KEY = "wrote_primary"
+# Read-session info: the request's primary ``Session``, and whether reads moved to it.
+PRIMARY_SESSION_KEY = "primary_session"
+ROUTED_PRIMARY_KEY = "routed_primary"
+
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+DB_REPLICA_LAG = Gauge("db_replica_lag_seconds", "Last measured read-replica replay lag")
+DB_READ_ROUTING = Counter(
+    "db_read_routing_total",
+    "Read routing decisions by target database and reason",
+    ["target", "reason"],
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_primary_write(session: Session, _flush_context: UOWTransaction) -> None:
+    session.info[PRIMARY_WRITE_KEY] = True
+
+
+class ReplicaReadSession(Session):
+    """Replica session that picks its connection per statement.
+
+    Statements go to the replica until the request's primary session has flushed a
+    write; from then on they run on that session's own connection, so the rest of the
+    request reads its own uncommitted writes. Use with
+    ``join_transaction_mode="rollback_only"`` and only ever close this session: closing
+    leaves the joined primary transaction to its owner, to commit or roll back.
+    """
+
+    def get_bind(self, mapper: Any = None, **kw: Any) -> Engine | Connection:
+        primary: Session | None = self.info.get(PRIMARY_SESSION_KEY)
+        if primary is not None and primary.info.get(PRIMARY_WRITE_KEY):
+            if not self.info.get(ROUTED_PRIMARY_KEY):
+                self.info[ROUTED_PRIMARY_KEY] = True
+                DB_READ_ROUTING.labels(target="primary", reason="wrote_primary").inc()
+            return primary.connection()
+        return super().get_bind(mapper, **kw)
+
+
+class ReplicaLagMonitor:
+    """Caches the replica's replay lag so routing costs one probe per interval, not per request.
+
+    A failed probe counts as unusable so reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._clock = clock
+        self._lag: float | None = None
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def is_usable(self) -> bool:
+        lag = await self.current_lag()
+        return lag is not None and lag <= self.max_lag_seconds
+
+    async def current_lag(self) -> float | None:
+        if self._fresh():
+            return self._lag
+        async with self._lock:
+            if not self._fresh():
+                self._lag = await self._probe()
+                self._checked_at = self._clock()
+        return self._lag
+
+    def _fresh(self) -> bool:
+        return (
+            self._checked_at is not None
+            and self._clock() - self._checked_at < self.check_interval_seconds
+        )
+
+    async def _probe(self) -> float | None:
+        try:
+            async with self.engine.connect() as conn:
+                raw: Any = await conn.scalar(_REPLICA_LAG_SQL)
+        except Exception:
+            logger.warning("db_replica_lag_probe_failed")
+            return None
+        lag = float(raw or 0)
+        DB_REPLICA_LAG.set(lag)
+        return lag
@@ -1,5 +1,9 @@
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any
 
+from fastapi import Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -8,20 +12,50 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import Settings, get_settings
+from app.db.pool import InstrumentedAsyncQueuePool, bind_pool_gauges
+from app.db.replica import (
+    DB_READ_ROUTING,
+    PRIMARY_SESSION_KEY,
+    ReplicaLagMonitor,
+    ReplicaReadSession,
+)
 
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_replica_engine: AsyncEngine | None = None
+_replica_session_factory: async_sessionmaker[AsyncSession] | None = None
+_replica_monitor: ReplicaLagMonitor | None = None
+
+
+def engine_options(settings: Settings, url: str | None = None) -> dict[str, Any]:
+    echo = settings.db_echo if settings.db_echo is not None else settings.environment == "dev"
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "echo": echo,
+    }
+    url = url or settings.database_url_str
+    if url.startswith("postgresql+asyncpg"):
+        server_settings: dict[str, str] = {"application_name": settings.app_name}
+        if settings.db_statement_timeout_ms is not None:
+            server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": server_settings,
+        }
+    return options
 
 
 def get_engine(settings: Settings | None = None) -> AsyncEngine:
     global _engine
     if _engine is None:
         settings = settings or get_settings()
-        _engine = create_async_engine(
-            settings.database_url_str,
-            pool_pre_ping=True,
-            echo=settings.environment == "dev",
-        )
+        _engine = create_async_engine(settings.database_url_str, **engine_options(settings))
+        bind_pool_gauges(_engine)
     return _engine
 
 
@@ -38,6 +72,43 @@ def get_session_factory(settings: Settings | None = None) -> async_sessionmaker[
     return _session_factory
 
 
+def get_replica_engine(settings: Settings | None = None) -> AsyncEngine | None:
+    global _replica_engine, _replica_monitor
+    if _replica_engine is None:
+        settings = settings or get_settings()
+        url = settings.database_replica_url
+        if not url:
+            return None
+        # Pool gauges stay bound to the primary; the replica pool is not exported.
+        _replica_engine = create_async_engine(url, **engine_options(settings, url))
+        _replica_monitor = ReplicaLagMonitor(
+            _replica_engine,
+            max_lag_seconds=settings.db_replica_max_lag_seconds,
+            check_interval_seconds=settings.db_replica_lag_check_interval_seconds,
+        )
+    return _replica_engine
+
+
+def get_replica_session_factory(
+    settings: Settings | None = None,
+) -> async_sessionmaker[AsyncSession] | None:
+    global _replica_session_factory
+    if _replica_session_factory is None:
+        engine = get_replica_engine(settings)
+        if engine is None:
+            return None
+        _replica_session_factory = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            sync_session_class=ReplicaReadSession,
+            join_transaction_mode="rollback_only",
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False,
+        )
+    return _replica_session_factory
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     session_factory = get_session_factory()
     async with session_factory() as session:
@@ -49,9 +120,57 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def get_read_db(
+    primary: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only handlers, served by the replica when it is safe to do so.
+
+    Falls back to the request's primary session when no replica is configured or the
+    replica lags beyond ``db_replica_max_lag_seconds``. Otherwise each statement is
+    routed when it runs (``ReplicaReadSession``): once the request writes through its
+    primary session, later reads use that session's connection and see the write.
+    """
+    replica_factory = get_replica_session_factory()
+    if replica_factory is None:
+        DB_READ_ROUTING.labels(target="primary", reason="no_replica").inc()
+        yield primary
+        return
+    if _replica_monitor is not None and not await _replica_monitor.is_usable():
+        DB_READ_ROUTING.labels(target="primary", reason="replica_lag").inc()
+        yield primary
+        return
+
+    DB_READ_ROUTING.labels(target="replica", reason="ok").inc()
+    # Closing rolls back the replica transaction but leaves a joined primary one alone.
+    async with replica_factory(info={PRIMARY_SESSION_KEY: primary.sync_session}) as session:
+        yield session
+
+
+async def warm_up_pool(connections: int, settings: Settings | None = None) -> None:
+    """Open ``connections`` pooled connections up front so the first requests skip connect.
+
+    Capped at ``db_pool_size``: overflow connections are closed as soon as they are
+    returned, so warming more would only open connections to throw away.
+    """
+    settings = settings or get_settings()
+    engine = get_engine(settings)
+    connections = min(connections, settings.db_pool_size)
+    # Hold every connection until all are open, otherwise each checkout reuses the first.
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
 async def dispose_engine() -> None:
-    global _engine, _session_factory
+    global _engine, _session_factory, _replica_engine, _replica_session_factory
+    global _replica_monitor
     if _engine is not None:
         await _engine.dispose()
         _engine = None
     _session_factory = None
+    if _replica_engine is not None:
+        await _replica_engine.dispose()
+        _replica_engine = None
+    _replica_session_factory = None
+    _replica_monitor = None
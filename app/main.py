@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -10,19 +11,34 @@ from app.api.v1.router import api_router
 from app.cache.redis import close_redis_pool, init_redis_pool
 from app.core.config import get_settings
 from app.core.exceptions import register_exception_handlers
+from app.core.http_client import close_http_clients, start_http_clients
 from app.core.logging import setup_logging
-from app.db.session import dispose_engine
+from app.core.password_hasher import close_password_hasher
+from app.db.session import dispose_engine, get_session_factory, warm_up_pool
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_id import RequestIDMiddleware
+from app.services.audit_writer import close_audit_writer, start_audit_writer
+from app.services.celery_metrics import register_celery_metrics
+from app.services.migration_status import alembic_head_revision
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     settings = get_settings()
     await init_redis_pool(settings)
+    start_http_clients(settings)
+    # Parse the migration scripts now rather than on the first dashboard or alert check.
+    await asyncio.to_thread(alembic_head_revision)
+    if settings.db_pool_warmup_connections:
+        await warm_up_pool(settings.db_pool_warmup_connections, settings)
+    if settings.audit_write_mode == "buffered":
+        start_audit_writer(get_session_factory(settings), settings)
     yield
+    await close_audit_writer()
+    await close_http_clients()
     await close_redis_pool()
     await dispose_engine()
+    await close_password_hasher()
 
 
 def create_app() -> FastAPI:
@@ -54,6 +70,7 @@ def create_app() -> FastAPI:
     app.include_router(api_router, prefix="/api/v1")
 
     Instrumentator().instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)
+    register_celery_metrics(settings)
 
     return app
 
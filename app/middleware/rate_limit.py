@@ -1,19 +1,60 @@
-import time
+import math
 
+from jose import JWTError
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.responses import JSONResponse
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.cache.local_rate_limiter import LocalPreLimiter
+from app.cache.rate_limiter import RateLimitResult, RedisRateLimiter
 from app.cache.redis import get_redis_client
-from app.core.config import get_settings
+from app.core.config import RateLimitRule, Settings, get_settings
+from app.core.security import get_subject_from_token
 from app.middleware.client_ip import get_client_ip
 from app.middleware.request_id import apply_request_id_header
 from app.schemas.common import ApiResponse
 
+API_PREFIX = "/api/v1"
+
+
+def resolve_rule(path: str, settings: Settings) -> RateLimitRule:
+    best: RateLimitRule | None = None
+    for rule in settings.rate_limit_rules:
+        if path.startswith(rule.prefix) and (best is None or len(rule.prefix) > len(best.prefix)):
+            best = rule
+    if best is not None:
+        return best
+    return RateLimitRule(prefix=API_PREFIX, limit=settings.rate_limit_per_minute)
+
+
+def _principal_identity(request: Request, settings: Settings) -> str | None:
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return f"user:{get_subject_from_token(token, 'access', settings)}"
+    except JWTError:
+        return None
+
+
+def rate_limit_headers(result: RateLimitResult) -> dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(math.ceil(result.reset_ms / 1000)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(math.ceil(result.retry_after_ms / 1000), 1))
+    return headers
+
 
 class RateLimitMiddleware:
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
+        self.limiter = RedisRateLimiter()
+        self.local: LocalPreLimiter | None = None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -22,35 +63,48 @@ class RateLimitMiddleware:
 
         request = Request(scope, receive)
         settings = get_settings()
-        if not request.url.path.startswith("/api/v1"):
+        if not request.url.path.startswith(API_PREFIX):
             await self.app(scope, receive, send)
             return
         if scope.get("method") == "OPTIONS":
             await self.app(scope, receive, send)
             return
 
-        client_ip = get_client_ip(request, trust_proxy_headers=settings.trust_proxy_headers)
-        window = int(time.time() // 60)
-        key = f"rate_limit:{client_ip}:{window}"
+        rule = resolve_rule(request.url.path, settings)
+        identity: str | None = None
+        if rule.scope == "principal":
+            identity = _principal_identity(request, settings)
+        if identity is None:
+            client_ip = get_client_ip(request, trust_proxy_headers=settings.trust_proxy_headers)
+            identity = f"ip:{client_ip}"
+        algorithm = rule.algorithm or settings.rate_limit_algorithm
+        key = f"rate_limit:{algorithm}:{rule.prefix}:{identity}"
 
-        try:
-            redis = get_redis_client()
-            count = await redis.incr(key)
-            if count == 1:
-                await redis.expire(key, 60)
-            if count > settings.rate_limit_per_minute:
-                response = apply_request_id_header(
-                    JSONResponse(
-                        status_code=429,
-                        content=ApiResponse(
-                            code=42900,
-                            message="Rate limit exceeded",
-                            data=None,
-                        ).model_dump(),
-                    )
+        local: LocalPreLimiter | None = None
+        if settings.rate_limit_local_enabled:
+            if self.local is None:
+                self.local = LocalPreLimiter.from_settings(settings)
+            local = self.local
+            retry_after_ms = local.check(key, limit=rule.limit, window_seconds=rule.window_seconds)
+            if retry_after_ms is not None:
+                result = RateLimitResult(
+                    allowed=False,
+                    limit=rule.limit,
+                    remaining=0,
+                    retry_after_ms=retry_after_ms,
+                    reset_ms=retry_after_ms,
                 )
-                await response(scope, receive, send)
+                await self._reject(result, scope, receive, send)
                 return
+
+        try:
+            result = await self.limiter.hit(
+                get_redis_client(),
+                key,
+                algorithm=algorithm,
+                limit=rule.limit,
+                window_seconds=rule.window_seconds,
+            )
         except Exception:
             response = apply_request_id_header(
                 JSONResponse(
@@ -65,4 +119,34 @@ class RateLimitMiddleware:
             await response(scope, receive, send)
             return
 
-        await self.app(scope, receive, send)
+        if not result.allowed:
+            if local is not None:
+                local.block(key, result.retry_after_ms)
+            await self._reject(result, scope, receive, send)
+            return
+
+        headers = rate_limit_headers(result)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers.setdefault(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    @staticmethod
+    async def _reject(result: RateLimitResult, scope: Scope, receive: Receive, send: Send) -> None:
+        response = apply_request_id_header(
+            JSONResponse(
+                status_code=429,
+                content=ApiResponse(
+                    code=42900,
+                    message="Rate limit exceeded",
+                    data=None,
+                ).model_dump(),
+                headers=rate_limit_headers(result),
+            )
+        )
+        await response(scope, receive, send)
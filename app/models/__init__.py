@@ -1,7 +1,8 @@
 from app.models.alert_delivery import AlertDelivery
+from app.models.alert_destination import AlertDestination
 from app.models.alert_settings import AlertSettings
 from app.models.audit_log import AuditLog
 from app.models.base import Base
 from app.models.user import User
 
-__all__ = ["AlertDelivery", "AlertSettings", "AuditLog", "Base", "User"]
+__all__ = ["AlertDelivery", "AlertDestination", "AlertSettings", "AuditLog", "Base", "User"]
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -9,7 +9,10 @@ from app.models.base import Base
 
 
 class AlertDelivery(Base):
+    """One delivery attempt of an alert to one destination."""
+
     __tablename__ = "alert_deliveries"
+    __table_args__ = (Index("ix_alert_deliveries_created_at_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -19,9 +22,13 @@ class AlertDelivery(Base):
     event_type: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     success: Mapped[bool] = mapped_column(Boolean, nullable=False)
     http_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Attempts of the same alert to the same destination share a dispatch_id.
+    dispatch_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    destination: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    attempt: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1", default=1)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
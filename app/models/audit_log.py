@@ -2,7 +2,18 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    Text,
+    event,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,6 +22,12 @@ from app.models.base import Base
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    # Monthly range partitions on created_at (see app.db.partitions); the partition key
+    # has to be part of the primary key.
+    __table_args__ = (
+        Index("ix_audit_logs_created_at_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -21,10 +38,9 @@ class AuditLog(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
-    action: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    resource_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    action: Mapped[str] = mapped_column(String(100), nullable=False)
+    resource_type: Mapped[str] = mapped_column(String(100), nullable=False)
     resource_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     detail: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     ip: Mapped[str | None] = mapped_column(String(45), nullable=True)
@@ -32,7 +48,44 @@ class AuditLog(Base):
     request_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
         nullable=False,
-        index=True,
+    )
+
+
+# Each admin filter gets a (filter, created_at DESC, id DESC) index so a filtered page is
+# one ordered index range scan; "user" rows also get a partial index by resource_id.
+Index(
+    "ix_audit_logs_action_created_at_id",
+    AuditLog.action,
+    AuditLog.created_at.desc(),
+    AuditLog.id.desc(),
+)
+Index(
+    "ix_audit_logs_actor_id_created_at_id",
+    AuditLog.actor_id,
+    AuditLog.created_at.desc(),
+    AuditLog.id.desc(),
+)
+Index(
+    "ix_audit_logs_resource_type_created_at_id",
+    AuditLog.resource_type,
+    AuditLog.created_at.desc(),
+    AuditLog.id.desc(),
+)
+Index(
+    "ix_audit_logs_user_resource_created_at_id",
+    AuditLog.resource_id,
+    AuditLog.created_at.desc(),
+    AuditLog.id.desc(),
+    postgresql_where=AuditLog.resource_type == "user",
+)
+
+
+@event.listens_for(AuditLog.__table__, "after_create")
+def _create_default_partition(_table: Table, connection: Connection, **_kw: Any) -> None:
+    # Rows outside every monthly partition land here until maintenance creates their month.
+    connection.execute(
+        text("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT")
     )
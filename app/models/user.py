@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, Connection, DateTime, Index, String, Table, event, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +11,7 @@ from app.models.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -25,3 +27,20 @@ class User(Base):
         server_default=func.now(),
         nullable=False,
     )
+
+
+# Admin email search (UserRepository.search_by_email). The unique index on email uses the
+# database collation, which LIKE 'abc%' cannot use, so prefix matches get a C-collated
+# copy; substring and similarity matches use the trigram index.
+Index(
+    "ix_users_email_trgm",
+    func.lower(User.email).label("email_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"email_lower": "gin_trgm_ops"},
+)
+Index("ix_users_email_prefix", func.lower(User.email).collate("C"))
+
+
+@event.listens_for(User.__table__, "before_create")
+def _create_trigram_extension(_table: Table, connection: Connection, **_kw: Any) -> None:
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
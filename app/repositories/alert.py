@@ -1,8 +1,13 @@
-from sqlalchemy import func, select
+import uuid
+
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.alert_delivery import AlertDelivery
+from app.models.alert_destination import AlertDestination
 from app.models.alert_settings import SETTINGS_ROW_ID, AlertSettings
+from app.repositories.counting import RowCounter
+from app.repositories.pagination import Cursor, Page, keyset_page, newest_first, split_page
 
 
 class AlertSettingsRepository:
@@ -23,6 +28,35 @@ class AlertSettingsRepository:
         return row
 
 
+class AlertDestinationRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def list_all(self) -> list[AlertDestination]:
+        result = await self.session.scalars(
+            select(AlertDestination).order_by(AlertDestination.name)
+        )
+        return list(result.all())
+
+    async def get(self, destination_id: uuid.UUID) -> AlertDestination | None:
+        return await self.session.get(AlertDestination, destination_id)
+
+    async def get_by_name(self, name: str) -> AlertDestination | None:
+        return await self.session.scalar(
+            select(AlertDestination).where(AlertDestination.name == name)
+        )
+
+    async def create(self, destination: AlertDestination) -> AlertDestination:
+        self.session.add(destination)
+        await self.session.flush()
+        await self.session.refresh(destination)
+        return destination
+
+    async def delete(self, destination: AlertDestination) -> None:
+        await self.session.delete(destination)
+        await self.session.flush()
+
+
 class AlertDeliveryRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -38,10 +72,32 @@ class AlertDeliveryRepository:
         *,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[AlertDelivery], int]:
-        query = select(AlertDelivery).order_by(AlertDelivery.created_at.desc())
-        count_query = select(func.count()).select_from(AlertDelivery)
-        total = int((await self.session.scalar(count_query)) or 0)
+        counter: RowCounter | None = None,
+    ) -> Page[AlertDelivery]:
+        query = select(AlertDelivery)
+        counter = counter or RowCounter(self.session)
+        total = await counter.count(query, table=AlertDelivery.__tablename__, filters={})
         offset = (page - 1) * page_size
-        result = await self.session.scalars(query.offset(offset).limit(page_size))
-        return list(result.all()), total
+        result = await self.session.scalars(
+            newest_first(query, AlertDelivery.created_at, AlertDelivery.id)
+            .offset(offset)
+            .limit(page_size + 1)
+        )
+        items, next_cursor = split_page(result.all(), page_size)
+        return Page(items, next_cursor, total.value, total.estimated)
+
+    async def list_after(
+        self,
+        *,
+        cursor: Cursor,
+        page_size: int = 20,
+    ) -> Page[AlertDelivery]:
+        query = keyset_page(
+            select(AlertDelivery),
+            AlertDelivery.created_at,
+            AlertDelivery.id,
+            cursor=cursor,
+            page_size=page_size,
+        )
+        result = await self.session.scalars(query)
+        return Page(*split_page(result.all(), page_size))
@@ -1,17 +1,43 @@
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import Select, func, or_, select
+from sqlalchemy import Row, func, literal_column, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.audit_log import AuditLog
+from app.repositories.counting import CountResult, RowCounter
+from app.repositories.pagination import (
+    Cursor,
+    Page,
+    SelectT,
+    keyset_page,
+    newest_first,
+    split_page,
+)
+
+EXPORT_COLUMNS = (
+    AuditLog.created_at,
+    AuditLog.action,
+    AuditLog.actor_id,
+    AuditLog.resource_type,
+    AuditLog.resource_id,
+    AuditLog.ip,
+    AuditLog.request_id,
+    AuditLog.detail,
+)
 
 
 class AuditLogRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    def add(self, log: AuditLog) -> None:
+        """Stage ``log`` for insertion with the session's next flush."""
+        self.session.add(log)
+
     async def create(self, log: AuditLog) -> AuditLog:
         self.session.add(log)
         await self.session.flush()
@@ -28,45 +54,95 @@ class AuditLogRepository:
         resource_type: str | None = None,
         since: datetime | None = None,
         until: datetime | None = None,
-    ) -> tuple[list[AuditLog], int]:
-        query = select(AuditLog)
-        count_query = select(func.count()).select_from(AuditLog)
+        counter: RowCounter | None = None,
+    ) -> Page[AuditLog]:
+        query = self._apply_filters(
+            select(AuditLog),
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
+        )
+        total = await self.count_matching(
+            counter or RowCounter(self.session),
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
+        )
 
-        if action:
-            query = query.where(AuditLog.action == action)
-            count_query = count_query.where(AuditLog.action == action)
-        if actor_id is not None:
-            query = query.where(AuditLog.actor_id == actor_id)
-            count_query = count_query.where(AuditLog.actor_id == actor_id)
-        if resource_type:
-            query = query.where(AuditLog.resource_type == resource_type)
-            count_query = count_query.where(AuditLog.resource_type == resource_type)
-        if since is not None:
-            query = query.where(AuditLog.created_at >= since)
-            count_query = count_query.where(AuditLog.created_at >= since)
-        if until is not None:
-            query = query.where(AuditLog.created_at <= until)
-            count_query = count_query.where(AuditLog.created_at <= until)
+        offset = (page - 1) * page_size
+        result = await self.session.scalars(
+            newest_first(query, AuditLog.created_at, AuditLog.id)
+            .offset(offset)
+            .limit(page_size + 1)
+        )
+        items, next_cursor = split_page(result.all(), page_size)
+        return Page(items, next_cursor, total.value, total.estimated)
 
-        total_result = await self.session.execute(count_query)
-        total = int(total_result.scalar_one())
+    async def count_matching(
+        self,
+        counter: RowCounter,
+        *,
+        action: str | None = None,
+        actor_id: uuid.UUID | None = None,
+        resource_type: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> CountResult:
+        filters: dict[str, object] = {
+            "action": action or None,
+            "actor_id": actor_id,
+            "resource_type": resource_type or None,
+            "since": since,
+            "until": until,
+        }
+        query = self._apply_filters(
+            select(AuditLog),
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
+        )
+        return await counter.count(query, table=AuditLog.__tablename__, filters=filters)
 
-        offset = (page - 1) * page_size
-        result = await self.session.execute(
-            query.order_by(AuditLog.created_at.desc()).offset(offset).limit(page_size)
+    async def list_after(
+        self,
+        *,
+        cursor: Cursor,
+        page_size: int = 20,
+        action: str | None = None,
+        actor_id: uuid.UUID | None = None,
+        resource_type: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Page[AuditLog]:
+        query = self._apply_filters(
+            select(AuditLog),
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
         )
-        return list(result.scalars().all()), total
+        result = await self.session.scalars(
+            keyset_page(query, AuditLog.created_at, AuditLog.id, cursor=cursor, page_size=page_size)
+        )
+        return Page(*split_page(result.all(), page_size))
 
     def _apply_filters(
         self,
-        query: Select[tuple[AuditLog]],
+        query: SelectT,
         *,
         action: str | None = None,
         actor_id: uuid.UUID | None = None,
         resource_type: str | None = None,
         since: datetime | None = None,
         until: datetime | None = None,
-    ) -> Select[tuple[AuditLog]]:
+    ) -> SelectT:
         if action:
             query = query.where(AuditLog.action == action)
         if actor_id is not None:
@@ -85,41 +161,70 @@ class AuditLogRepository:
         user_id: uuid.UUID,
         limit: int = 20,
     ) -> tuple[list[AuditLog], int]:
-        user_id_str = str(user_id)
-        condition = or_(
+        """Events the user performed or that targeted them, newest first.
+
+        An ``OR`` across the two conditions cannot use a single index, so each becomes a
+        ``UNION ALL`` branch served by its own index: the actor composite and the partial
+        index on user resources. The second branch skips rows the first already returns.
+        """
+        branches = [
             AuditLog.actor_id == user_id,
-            (AuditLog.resource_type == "user") & (AuditLog.resource_id == user_id_str),
+            # Inline literal so generic plans of the prepared statement still match the
+            # partial index predicate.
+            (AuditLog.resource_type == literal_column("'user'"))
+            & (AuditLog.resource_id == str(user_id))
+            & AuditLog.actor_id.is_distinct_from(user_id),
+        ]
+        combined = union_all(
+            *(
+                newest_first(
+                    select(AuditLog).where(branch), AuditLog.created_at, AuditLog.id
+                ).limit(limit)
+                for branch in branches
+            )
+        ).subquery()
+        logs = aliased(AuditLog, combined)
+        result = await self.session.scalars(
+            newest_first(select(logs), logs.created_at, logs.id).limit(limit)
         )
-        query = select(AuditLog).where(condition)
-        count_query = select(func.count()).select_from(AuditLog).where(condition)
 
-        total_result = await self.session.execute(count_query)
-        total = int(total_result.scalar_one())
+        counts = [
+            select(func.count()).select_from(AuditLog).where(branch).scalar_subquery()
+            for branch in branches
+        ]
+        total = int(await self.session.scalar(select(counts[0] + counts[1])) or 0)
+        return list(result.all()), total
 
-        result = await self.session.execute(query.order_by(AuditLog.created_at.desc()).limit(limit))
-        return list(result.scalars().all()), total
-
-    async def iter_for_export(
+    async def iter_export_batches(
         self,
         *,
-        max_rows: int,
+        batch_size: int = 1000,
+        max_rows: int | None = None,
         action: str | None = None,
         actor_id: uuid.UUID | None = None,
         resource_type: str | None = None,
         since: datetime | None = None,
         until: datetime | None = None,
-    ) -> AsyncIterator[AuditLog]:
-        query = select(AuditLog)
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """Stream ``EXPORT_COLUMNS`` rows from a server-side cursor, ``batch_size`` at a time.
+
+        Plain column rows skip the ORM identity map, so memory stays bounded by one batch
+        however many rows match.
+        """
         query = self._apply_filters(
-            query,
+            select(*EXPORT_COLUMNS),
             action=action,
             actor_id=actor_id,
             resource_type=resource_type,
             since=since,
             until=until,
         )
-        result = await self.session.execute(
-            query.order_by(AuditLog.created_at.desc()).limit(max_rows)
-        )
-        for row in result.scalars().all():
-            yield row
+        query = newest_first(query, AuditLog.created_at, AuditLog.id)
+        if max_rows is not None:
+            query = query.limit(max_rows)
+        result = await self.session.stream(query.execution_options(yield_per=batch_size))
+        try:
+            async for batch in result.partitions():
+                yield batch
+        finally:
+            await result.close()
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
+
+from app.core.config import CountStrategy, Settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+COUNT_CACHE_PREFIX = "count:"
+
+LIST_COUNTS = Counter(
+    "admin_list_counts_total",
+    "Admin list totals by table and how they were produced",
+    ["table", "source"],
+)
+
+# A partitioned parent has no reltuples of its own, so sum its analyzed partitions.
+_RELTUPLES_SQL = text(
+    "SELECT CASE WHEN c.relkind = 'p' THEN ("
+    "SELECT sum(p.reltuples) FILTER (WHERE p.reltuples >= 0)"
+    " FROM pg_inherits i JOIN pg_class p ON p.oid = i.inhrelid WHERE i.inhparent = c.oid"
+    ") ELSE c.reltuples END::bigint"
+    " FROM pg_class c WHERE c.oid = CAST(:table AS regclass)"
+)
+
+# reltuples only moves on VACUUM/ANALYZE, so one read per table serves the process for a while.
+TABLE_ROWS_TTL_SECONDS = 300.0
+_table_rows: dict[str, tuple[float, int | None]] = {}
+
+
+class _ExplainJson(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson, "postgresql")
+def _compile_explain(element: _ExplainJson, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+@dataclass(frozen=True)
+class CountResult:
+    value: int
+    # Planner estimates and cached counts; False only for a count taken just now.
+    estimated: bool = False
+
+
+class RowCounter:
+    """Produces list totals without always paying for ``SELECT count(*)``.
+
+    ``exact`` always counts. ``estimate`` uses ``pg_class.reltuples`` for unfiltered
+    lists and the planner's row estimate otherwise. ``cached`` keeps exact counts in
+    Redis per filter set for ``cache_ttl_seconds``. ``auto`` counts exactly until the
+    planner expects at least ``estimate_threshold`` rows, then returns the estimate;
+    tables whose ``reltuples`` is already below the threshold skip the planner entirely.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        strategy: CountStrategy = "exact",
+        estimate_threshold: int = 100_000,
+        redis: Redis | None = None,
+        cache_ttl_seconds: int = 30,
+    ) -> None:
+        self.session = session
+        self.strategy = strategy
+        self.estimate_threshold = estimate_threshold
+        self.redis = redis
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+    @classmethod
+    def from_settings(
+        cls, session: AsyncSession, settings: Settings, redis: Redis | None = None
+    ) -> "RowCounter":
+        return cls(
+            session,
+            strategy=settings.admin_count_strategy,
+            estimate_threshold=settings.admin_count_estimate_threshold,
+            redis=redis,
+            cache_ttl_seconds=settings.admin_count_cache_ttl_seconds,
+        )
+
+    async def count(
+        self,
+        query: Select[Any],
+        *,
+        table: str,
+        filters: dict[str, object],
+    ) -> CountResult:
+        """Count rows matched by ``query``, a filtered select with no ordering or limit."""
+        active = {key: value for key, value in filters.items() if value is not None}
+        if self.strategy == "cached":
+            return await self._cached(query, table=table, filters=active)
+        if self.strategy == "auto":
+            rows = await self._table_rows(table)
+            if rows is not None and rows < self.estimate_threshold:
+                return await self._exact(query, table=table)
+        if self.strategy in {"estimate", "auto"}:
+            estimate = await self._estimate(query, table=table, filtered=bool(active))
+            if estimate is not None and (
+                self.strategy == "estimate" or estimate >= self.estimate_threshold
+            ):
+                LIST_COUNTS.labels(table=table, source="estimate").inc()
+                return CountResult(estimate, estimated=True)
+        return await self._exact(query, table=table)
+
+    async def _exact(self, query: Select[Any], *, table: str) -> CountResult:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        value = int((await self.session.scalar(count_query)) or 0)
+        LIST_COUNTS.labels(table=table, source="exact").inc()
+        return CountResult(value)
+
+    async def _table_rows(self, table: str) -> int | None:
+        now = time.monotonic()
+        cached = _table_rows.get(table)
+        if cached is not None and now - cached[0] < TABLE_ROWS_TTL_SECONDS:
+            return cached[1]
+        rows: int | None = None
+        try:
+            # A failed statement aborts the whole transaction; the savepoint contains it.
+            async with self.session.begin_nested():
+                reltuples = await self.session.scalar(_RELTUPLES_SQL, {"table": table})
+            # -1 until the table has been vacuumed or analyzed at least once.
+            if reltuples is not None and reltuples >= 0:
+                rows = int(reltuples)
+        except Exception:
+            logger.warning("count_estimate_failed", table=table)
+        _table_rows[table] = (now, rows)
+        return rows
+
+    async def _estimate(self, query: Select[Any], *, table: str, filtered: bool) -> int | None:
+        if not filtered:
+            return await self._table_rows(table)
+        try:
+            async with self.session.begin_nested():
+                plan: Any = await self.session.scalar(_ExplainJson(query.order_by(None)))
+        except Exception:
+            logger.warning("count_estimate_failed", table=table)
+            return None
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def _cached(
+        self, query: Select[Any], *, table: str, filters: dict[str, object]
+    ) -> CountResult:
+        if self.redis is None or self.cache_ttl_seconds <= 0:
+            return await self._exact(query, table=table)
+        key = cache_key(table, filters)
+        try:
+            cached = await self.redis.get(key)
+        except Exception:
+            logger.warning("count_cache_read_failed", table=table)
+            cached = None
+        if cached is not None:
+            LIST_COUNTS.labels(table=table, source="cache").inc()
+            # Up to cache_ttl_seconds old, so it may no longer be the exact total.
+            return CountResult(int(cached), estimated=True)
+
+        result = await self._exact(query, table=table)
+        try:
+            await self.redis.set(key, result.value, ex=self.cache_ttl_seconds)
+        except Exception:
+            logger.warning("count_cache_write_failed", table=table)
+        return result
+
+
+def cache_key(table: str, filters: dict[str, object]) -> str:
+    raw = json.dumps(filters, sort_keys=True, default=str)
+    return f"{COUNT_CACHE_PREFIX}{table}:{hashlib.sha1(raw.encode()).hexdigest()}"
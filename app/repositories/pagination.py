@@ -0,0 +1,94 @@
+import base64
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Protocol, TypeVar
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.exceptions import AppException
+
+INVALID_CURSOR_CODE = 40007
+
+
+class _Keyed(Protocol):
+    id: Any
+    created_at: Any
+
+
+RowT = TypeVar("RowT", bound=_Keyed)
+SelectT = TypeVar("SelectT", bound=Select[Any])
+
+
+@dataclass
+class Page(Generic[RowT]):
+    items: list[RowT]
+    next_cursor: str | None = None
+    total: int | None = None
+    total_estimated: bool = False
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after the last row of a page, ordered by ``(created_at, id)`` descending."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        raw = json.dumps([self.created_at.isoformat(), self.id.hex], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(datetime.fromisoformat(created_at), uuid.UUID(hex=row_id))
+        except (ValueError, TypeError) as exc:
+            raise AppException("Invalid pagination cursor", code=INVALID_CURSOR_CODE) from exc
+
+    @classmethod
+    def after(cls, row: _Keyed) -> "Cursor":
+        return cls(row.created_at, row.id)
+
+
+def newest_first(
+    query: SelectT,
+    created_at: InstrumentedAttribute[datetime],
+    row_id: InstrumentedAttribute[uuid.UUID],
+) -> SelectT:
+    return query.order_by(created_at.desc(), row_id.desc())
+
+
+def keyset_page(
+    query: SelectT,
+    created_at: InstrumentedAttribute[datetime],
+    row_id: InstrumentedAttribute[uuid.UUID],
+    *,
+    cursor: Cursor,
+    page_size: int,
+) -> SelectT:
+    """Rows strictly after ``cursor``; fetches one extra row to detect a following page.
+
+    The row-value comparison lets Postgres seek straight to the cursor on the
+    ``(created_at, id)`` index, so deep pages cost the same as the first. The plain
+    ``created_at`` bound is redundant but lets the planner prune time partitions,
+    which it cannot do from a row comparison.
+    """
+    query = query.where(
+        created_at <= cursor.created_at,
+        tuple_(created_at, row_id) < tuple_(cursor.created_at, cursor.id),
+    )
+    return newest_first(query, created_at, row_id).limit(page_size + 1)
+
+
+def split_page(rows: Sequence[RowT], page_size: int) -> tuple[list[RowT], str | None]:
+    """Trim the look-ahead row from a ``keyset_page`` result and build the next cursor."""
+    items = list(rows[:page_size])
+    if len(rows) <= page_size or not items:
+        return items, None
+    return items, Cursor.after(items[-1]).encode()
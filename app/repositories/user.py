@@ -5,6 +5,22 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.roles import ADMIN
 from app.models.user import User
+from app.repositories.counting import RowCounter
+from app.repositories.pagination import (
+    Cursor,
+    Page,
+    SelectT,
+    keyset_page,
+    newest_first,
+    split_page,
+)
+
+# pg_trgm indexes three-character grams; shorter terms cannot narrow a trigram scan.
+TRIGRAM_MIN_LENGTH = 3
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class UserRepository:
@@ -60,29 +76,81 @@ class UserRepository:
         email: str | None = None,
         is_active: bool | None = None,
         role: str | None = None,
-    ) -> tuple[list[User], int]:
-        query = select(User)
-        count_query = select(func.count()).select_from(User)
+        counter: RowCounter | None = None,
+    ) -> Page[User]:
+        filters: dict[str, object] = {"email": email or None, "is_active": is_active, "role": role}
+        query = self._apply_filters(select(User), email=email, is_active=is_active, role=role)
+        counter = counter or RowCounter(self.session)
+        total = await counter.count(query, table=User.__tablename__, filters=filters)
+
+        offset = (page - 1) * page_size
+        result = await self.session.scalars(
+            newest_first(query, User.created_at, User.id).offset(offset).limit(page_size + 1)
+        )
+        items, next_cursor = split_page(result.all(), page_size)
+        return Page(items, next_cursor, total.value, total.estimated)
+
+    async def list_after(
+        self,
+        *,
+        cursor: Cursor,
+        page_size: int = 20,
+        email: str | None = None,
+        is_active: bool | None = None,
+        role: str | None = None,
+    ) -> Page[User]:
+        query = self._apply_filters(select(User), email=email, is_active=is_active, role=role)
+        result = await self.session.scalars(
+            keyset_page(query, User.created_at, User.id, cursor=cursor, page_size=page_size)
+        )
+        return Page(*split_page(result.all(), page_size))
 
+    async def search_by_email(
+        self,
+        term: str,
+        *,
+        limit: int = 20,
+        prefix: bool = False,
+        is_active: bool | None = None,
+        role: str | None = None,
+    ) -> list[User]:
+        """Users whose email contains ``term``, best match first.
+
+        Prefix searches, and terms too short for a trigram, match from the start of the
+        address through the C-collated btree in email order. Anything else goes through
+        the trigram index and is ranked by similarity.
+        """
+        term = term.strip().lower()
+        query = self._apply_filters(select(User), is_active=is_active, role=role)
+        if prefix or len(term) < TRIGRAM_MIN_LENGTH:
+            collated = func.lower(User.email).collate("C")
+            query = query.where(collated.like(f"{escape_like(term)}%", escape="\\"))
+            query = query.order_by(collated)
+        else:
+            lowered = func.lower(User.email)
+            query = query.where(lowered.like(f"%{escape_like(term)}%", escape="\\"))
+            query = query.order_by(func.similarity(lowered, term).desc(), lowered)
+        result = await self.session.scalars(query.limit(limit))
+        return list(result.all())
+
+    def _apply_filters(
+        self,
+        query: SelectT,
+        *,
+        email: str | None = None,
+        is_active: bool | None = None,
+        role: str | None = None,
+    ) -> SelectT:
         if email:
-            pattern = f"%{email.lower()}%"
-            query = query.where(User.email.ilike(pattern))
-            count_query = count_query.where(User.email.ilike(pattern))
+            # Matches the lower(email) trigram index, which ILIKE on email would not use.
+            query = query.where(
+                func.lower(User.email).like(f"%{escape_like(email.lower())}%", escape="\\")
+            )
         if is_active is not None:
             query = query.where(User.is_active.is_(is_active))
-            count_query = count_query.where(User.is_active.is_(is_active))
         if role is not None:
             query = query.where(User.role == role)
-            count_query = count_query.where(User.role == role)
-
-        total_result = await self.session.execute(count_query)
-        total = int(total_result.scalar_one())
-
-        offset = (page - 1) * page_size
-        result = await self.session.execute(
-            query.order_by(User.created_at.desc()).offset(offset).limit(page_size)
-        )
-        return list(result.scalars().all()), total
+        return query
 
     async def update_fields(self, user: User, **fields: object) -> User:
         for key, value in fields.items():
@@ -5,6 +5,8 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from app.core.roles import ALL_ROLES
+from app.services.audit_export import ExportFormat
+from app.services.export_jobs import ExportJobStatus
 
 
 class UserAdmin(BaseModel):
@@ -72,6 +74,20 @@ class CeleryTaskInfo(BaseModel):
     args: list[Any] = Field(default_factory=list)
 
 
+class CeleryQueueInfo(BaseModel):
+    name: str
+    length: int
+
+
+class CeleryTaskTiming(BaseModel):
+    name: str
+    count: int
+    wait_avg_seconds: float | None = None
+    wait_p95_seconds: float | None = None
+    runtime_avg_seconds: float | None = None
+    runtime_p95_seconds: float | None = None
+
+
 class BeatScheduleEntry(BaseModel):
     name: str
     task: str
@@ -85,6 +101,8 @@ class CeleryOverview(BaseModel):
     scheduled_tasks: list[CeleryTaskInfo]
     reserved_tasks: list[CeleryTaskInfo] = Field(default_factory=list)
     beat_schedule: list[BeatScheduleEntry] = Field(default_factory=list)
+    queues: list[CeleryQueueInfo] = Field(default_factory=list)
+    task_timings: list[CeleryTaskTiming] = Field(default_factory=list)
     flower_url: str | None = None
     message: str | None = None
 
@@ -102,3 +120,30 @@ class AuditLogPublic(BaseModel):
     user_agent: str | None
     request_id: str | None = None
     created_at: datetime
+
+
+class ExportJobCreate(BaseModel):
+    format: ExportFormat = "csv"
+    gzip: bool = False
+    action: str | None = None
+    actor_id: uuid.UUID | None = None
+    resource_type: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+class ExportJobPublic(BaseModel):
+    id: str
+    status: ExportJobStatus
+    format: ExportFormat
+    gzip: bool
+    filters: dict[str, str]
+    rows: int
+    bytes: int
+    total_estimate: int | None = None
+    progress: float | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+    error: str | None = None
+    reused: bool = False
+    download_url: str | None = None
@@ -1,7 +1,10 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.services.alert_webhook import validate_webhook_url
 
 
 class AlertSettingsPublic(BaseModel):
@@ -23,11 +26,69 @@ class AlertDeliveryPublic(BaseModel):
     event_type: str
     success: bool
     http_status: int | None
+    dispatch_id: uuid.UUID | None
+    destination: str | None
+    attempt: int
+    error: str | None
     created_at: datetime
 
     model_config = {"from_attributes": True}
 
 
+class AlertDestinationPublic(BaseModel):
+    id: uuid.UUID
+    name: str
+    url: str
+    secret_configured: bool
+    rate_limit: int | None
+    created_at: datetime
+
+
+class AlertDestinationCreate(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+    url: str = Field(max_length=2048)
+    secret: str | None = Field(default=None, max_length=512)
+    rate_limit: int | None = Field(default=None, ge=0)
+
+    @field_validator("url")
+    @classmethod
+    def _valid_url(cls, value: str) -> str:
+        value = value.strip()
+        validate_webhook_url(value)
+        return value
+
+
+class AlertDeadLetterPublic(BaseModel):
+    dispatch_id: str
+    destination: str
+    destination_name: str
+    event_type: str
+    payload: dict[str, Any]
+    attempts: int
+    http_status: int | None
+    error: str | None
+    failed_at: datetime
+
+
+class AlertCheckState(BaseModel):
+    check: str
+    status: str | None
+    since: datetime | None
+
+
+class AlertStateChange(BaseModel):
+    check: str
+    previous: str | None
+    current: str
+    at: datetime
+    details: dict[str, Any]
+
+
+class AlertStatePublic(BaseModel):
+    checks: list[AlertCheckState]
+    history: list[AlertStateChange]
+
+
 class AlertTestResult(BaseModel):
     sent: bool
     http_status: int | None
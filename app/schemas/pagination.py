@@ -7,6 +7,9 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
-    page: int = Field(ge=1)
+    # Cursor pages skip COUNT(*) and have no page number; both are null there.
+    total: int | None
+    total_estimated: bool = False
+    page: int | None = Field(default=None, ge=1)
     page_size: int = Field(ge=1, le=100)
+    next_cursor: str | None = None
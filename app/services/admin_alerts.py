@@ -1,34 +1,52 @@
 import uuid
-from typing import Any
 
 from fastapi import status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
 from app.core.exceptions import AppException
 from app.core.logging import get_logger
-from app.models.alert_delivery import AlertDelivery
+from app.models.alert_destination import AlertDestination
 from app.models.alert_settings import AlertSettings
-from app.repositories.alert import AlertDeliveryRepository, AlertSettingsRepository
+from app.repositories.alert import (
+    AlertDeliveryRepository,
+    AlertDestinationRepository,
+    AlertSettingsRepository,
+)
+from app.repositories.counting import RowCounter
+from app.repositories.pagination import Cursor
 from app.schemas.admin_alerts import (
+    AlertCheckState,
+    AlertDeadLetterPublic,
     AlertDeliveryPublic,
+    AlertDestinationCreate,
+    AlertDestinationPublic,
     AlertSettingsPublic,
     AlertSettingsUpdate,
+    AlertStateChange,
+    AlertStatePublic,
     AlertTestResult,
 )
 from app.schemas.pagination import PaginatedResponse
-from app.services.alert_webhook import build_alert_payload, post_webhook, validate_webhook_url
+from app.services.alert_dispatch import PRIMARY_DESTINATION, AlertDispatcher, Destination
+from app.services.alert_state import ALERT_CHECKS, AlertStateStore
+from app.services.alert_webhook import validate_webhook_url
 from app.services.audit import AuditService
 
 logger = get_logger(__name__)
 
 
 class AdminAlertsService:
-    def __init__(self, session: AsyncSession, settings: Settings) -> None:
+    def __init__(
+        self, session: AsyncSession, settings: Settings, redis: Redis | None = None
+    ) -> None:
         self.session = session
         self.settings = settings
+        self.redis = redis
         self.settings_repo = AlertSettingsRepository(session)
         self.deliveries_repo = AlertDeliveryRepository(session)
+        self.destinations_repo = AlertDestinationRepository(session)
 
     async def get_settings(self) -> AlertSettingsPublic:
         row = await self._ensure_settings_row()
@@ -82,16 +100,27 @@ class AdminAlertsService:
         *,
         page: int,
         page_size: int,
+        cursor: str | None = None,
+        counter: RowCounter | None = None,
     ) -> PaginatedResponse[AlertDeliveryPublic]:
-        items, total = await self.deliveries_repo.list_paginated(
-            page=page,
-            page_size=page_size,
-        )
+        if cursor is not None:
+            result = await self.deliveries_repo.list_after(
+                cursor=Cursor.decode(cursor),
+                page_size=page_size,
+            )
+        else:
+            result = await self.deliveries_repo.list_paginated(
+                page=page,
+                page_size=page_size,
+                counter=counter,
+            )
         return PaginatedResponse(
-            items=[AlertDeliveryPublic.model_validate(item) for item in items],
-            total=total,
-            page=page,
+            items=[AlertDeliveryPublic.model_validate(item) for item in result.items],
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=page if cursor is None else None,
             page_size=page_size,
+            next_cursor=result.next_cursor,
         )
 
     async def send_test(
@@ -110,19 +139,14 @@ class AdminAlertsService:
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        http_status, success = await self._deliver(
-            row.webhook_url,
-            row.webhook_secret,
+        result = await self._dispatcher().send_now(
+            Destination(
+                PRIMARY_DESTINATION, PRIMARY_DESTINATION, row.webhook_url, row.webhook_secret
+            ),
             event_type="test",
             details={"triggered_by": str(actor_id)},
         )
-        await self.deliveries_repo.create(
-            AlertDelivery(
-                event_type="test",
-                success=success,
-                http_status=http_status,
-            )
-        )
+        http_status, success = result.http_status, result.success
         await AuditService(self.session).record(
             actor_id=actor_id,
             action="alert.test_send",
@@ -144,31 +168,137 @@ class AdminAlertsService:
             row.webhook_secret = self.settings.alert_webhook_secret
         return row
 
-    async def _deliver(
+    async def list_destinations(self) -> list[AlertDestinationPublic]:
+        return [self._destination_public(row) for row in await self.destinations_repo.list_all()]
+
+    async def create_destination(
         self,
-        url: str,
-        secret: str | None,
+        payload: AlertDestinationCreate,
         *,
-        event_type: str,
-        details: dict[str, Any] | None = None,
-    ) -> tuple[int | None, bool]:
-        payload = build_alert_payload(
-            event_type=event_type,
-            settings=self.settings,
-            details=details,
+        actor_id: uuid.UUID,
+        ip: str | None,
+        user_agent: str | None,
+        request_id: str | None = None,
+    ) -> AlertDestinationPublic:
+        name = payload.name.strip()
+        if name == PRIMARY_DESTINATION or await self.destinations_repo.get_by_name(name):
+            raise AppException(
+                "Alert destination name already in use",
+                code=40902,
+                status_code=status.HTTP_409_CONFLICT,
+            )
+        row = await self.destinations_repo.create(
+            AlertDestination(
+                name=name,
+                url=payload.url,
+                secret=payload.secret or None,
+                rate_limit=payload.rate_limit,
+            )
         )
-        try:
-            http_status = await post_webhook(
-                url=url,
-                payload=payload,
-                secret=secret,
-                timeout=self.settings.alert_webhook_timeout_seconds,
+        await AuditService(self.session).record(
+            actor_id=actor_id,
+            action="alert.destination_create",
+            resource_type="alert_destination",
+            resource_id=str(row.id),
+            detail={"name": row.name},
+            ip=ip,
+            user_agent=user_agent,
+            request_id=request_id,
+        )
+        return self._destination_public(row)
+
+    async def delete_destination(
+        self,
+        destination_id: uuid.UUID,
+        *,
+        actor_id: uuid.UUID,
+        ip: str | None,
+        user_agent: str | None,
+        request_id: str | None = None,
+    ) -> None:
+        row = await self.destinations_repo.get(destination_id)
+        if row is None:
+            raise AppException(
+                "Alert destination not found",
+                code=40403,
+                status_code=status.HTTP_404_NOT_FOUND,
             )
-            success = http_status is not None and 200 <= http_status < 300
-            return http_status, success
-        except Exception:
-            logger.exception("alert_webhook_delivery_failed", event_type=event_type)
-            return None, False
+        await self.destinations_repo.delete(row)
+        await AuditService(self.session).record(
+            actor_id=actor_id,
+            action="alert.destination_delete",
+            resource_type="alert_destination",
+            resource_id=str(destination_id),
+            detail={"name": row.name},
+            ip=ip,
+            user_agent=user_agent,
+            request_id=request_id,
+        )
+
+    async def list_dead_letters(self, *, limit: int) -> list[AlertDeadLetterPublic]:
+        entries = await self._dispatcher().list_dead_letters(limit)
+        return [AlertDeadLetterPublic.model_validate(entry) for entry in entries]
+
+    async def retry_dead_letter(
+        self,
+        dispatch_id: str,
+        *,
+        actor_id: uuid.UUID,
+        ip: str | None,
+        user_agent: str | None,
+        request_id: str | None = None,
+    ) -> None:
+        if not await self._dispatcher().requeue(dispatch_id):
+            raise AppException(
+                "Dead-lettered alert not found",
+                code=40404,
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        await AuditService(self.session).record(
+            actor_id=actor_id,
+            action="alert.dead_letter_retry",
+            resource_type="alert_delivery",
+            resource_id=dispatch_id,
+            ip=ip,
+            user_agent=user_agent,
+            request_id=request_id,
+        )
+
+    async def get_state(self, *, history_limit: int) -> AlertStatePublic:
+        store = AlertStateStore(self._redis(), self.settings)
+        state = await store.current()
+        history = await store.history(history_limit)
+        return AlertStatePublic(
+            checks=[
+                AlertCheckState(
+                    check=check,
+                    status=state.get(check),
+                    since=state.get(f"{check}:since"),
+                )
+                for check in ALERT_CHECKS
+            ],
+            history=[AlertStateChange.model_validate(change) for change in history],
+        )
+
+    def _dispatcher(self) -> AlertDispatcher:
+        return AlertDispatcher(self.session, self._redis(), self.settings)
+
+    def _redis(self) -> Redis:
+        if self.redis is None:
+            msg = "AdminAlertsService needs a Redis client for alert delivery and state"
+            raise RuntimeError(msg)
+        return self.redis
+
+    @staticmethod
+    def _destination_public(row: AlertDestination) -> AlertDestinationPublic:
+        return AlertDestinationPublic(
+            id=row.id,
+            name=row.name,
+            url=row.url,
+            secret_configured=bool(row.secret),
+            rate_limit=row.rate_limit,
+            created_at=row.created_at,
+        )
 
     @staticmethod
     def _to_public(row: AlertSettings) -> AlertSettingsPublic:
@@ -1,13 +1,18 @@
-import csv
-import io
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
 from app.repositories.audit_log import AuditLogRepository
+from app.services.audit_export import (
+    ExportEncoder,
+    ExportFormat,
+    GzipStream,
+    check_export_format,
+    make_encoder,
+)
 
 
 class AdminAuditService:
@@ -16,36 +21,65 @@ class AdminAuditService:
         self.settings = settings
         self.logs = AuditLogRepository(session)
 
-    async def iter_export_rows(
+    def export(
         self,
         *,
+        fmt: ExportFormat = "csv",
+        gzip: bool = False,
         action: str | None = None,
         actor_id: uuid.UUID | None = None,
         resource_type: str | None = None,
         since: datetime | None = None,
         until: datetime | None = None,
-    ) -> AsyncIterator[str]:
-        max_rows = self.settings.admin_audit_export_max_rows
-        buffer = io.StringIO()
-        writer = csv.writer(buffer)
-        writer.writerow(
-            [
-                "created_at",
-                "action",
-                "actor_id",
-                "resource_type",
-                "resource_id",
-                "ip",
-                "request_id",
-                "detail",
-            ]
+        on_rows: Callable[[int], None] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Return the export as a byte stream in chunks of ~``admin_audit_export_chunk_bytes``.
+
+        Format problems raise here, before the response starts. Rows come from a
+        server-side cursor, so memory is bounded by one fetch batch plus one chunk
+        regardless of ``admin_audit_export_max_rows``. ``on_rows`` receives the running
+        row count after each fetch batch.
+        """
+        check_export_format(fmt, gzip)
+        encoder = make_encoder(fmt)
+        return self._stream(
+            encoder,
+            GzipStream() if gzip else None,
+            action=action,
+            actor_id=actor_id,
+            resource_type=resource_type,
+            since=since,
+            until=until,
+            on_rows=on_rows,
         )
-        yield buffer.getvalue()
-        buffer.seek(0)
-        buffer.truncate(0)
 
+    async def _stream(
+        self,
+        encoder: ExportEncoder,
+        gzip: GzipStream | None,
+        *,
+        action: str | None,
+        actor_id: uuid.UUID | None,
+        resource_type: str | None,
+        since: datetime | None,
+        until: datetime | None,
+        on_rows: Callable[[int], None] | None,
+    ) -> AsyncIterator[bytes]:
+        max_rows = self.settings.admin_audit_export_max_rows
+        chunk_bytes = self.settings.admin_audit_export_chunk_bytes
+
+        def emit(data: bytes) -> bytes:
+            return gzip.compress(data) if gzip is not None else data
+
+        # Send the header straight away so clients see the download start.
+        header = emit(encoder.begin())
+        if header:
+            yield header
+
+        pending = bytearray()
         count = 0
-        async for log in self.logs.iter_for_export(
+        async for batch in self.logs.iter_export_batches(
+            batch_size=self.settings.admin_audit_export_batch_size,
             max_rows=max_rows,
             action=action,
             actor_id=actor_id,
@@ -53,24 +87,18 @@ class AdminAuditService:
             since=since,
             until=until,
         ):
-            writer.writerow(
-                [
-                    log.created_at.isoformat(),
-                    log.action,
-                    str(log.actor_id) if log.actor_id else "",
-                    log.resource_type,
-                    log.resource_id or "",
-                    log.ip or "",
-                    log.request_id or "",
-                    str(log.detail) if log.detail else "",
-                ]
-            )
-            yield buffer.getvalue()
-            buffer.seek(0)
-            buffer.truncate(0)
-            count += 1
+            pending += encoder.encode(batch)
+            count += len(batch)
+            if on_rows is not None:
+                on_rows(count)
+            if len(pending) >= chunk_bytes:
+                yield emit(bytes(pending))
+                pending.clear()
 
-        if count >= max_rows:
-            writer.writerow([])
-            writer.writerow([f"# export truncated at {max_rows} rows"])
-            yield buffer.getvalue()
+        truncated_at = max_rows if max_rows is not None and count >= max_rows else None
+        pending += encoder.finish(truncated_at=truncated_at)
+        tail = emit(bytes(pending))
+        if gzip is not None:
+            tail += gzip.finish()
+        if tail:
+            yield tail
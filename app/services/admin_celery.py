@@ -1,11 +1,21 @@
 import asyncio
+import json
+import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
 
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.celery_keys import CELERY_STATE_REDIS_KEY
 from app.core.config import Settings, get_settings
+from app.core.logging import get_logger
 from app.schemas.admin import BeatScheduleEntry, CeleryOverview, CeleryTaskInfo, CeleryWorkerInfo
+from app.services.celery_metrics import read_queue_lengths, read_task_timings
 from app.tasks.celery_app import _beat_schedule, celery_app
 
+logger = get_logger(__name__)
+
 InspectMethod = Literal["stats", "active", "scheduled", "reserved"]
 
 
@@ -48,29 +58,36 @@ def _build_beat_schedule(settings: Settings) -> list[BeatScheduleEntry]:
 
 
 class AdminCeleryService:
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(self, settings: Settings | None = None, redis: Redis | None = None) -> None:
         self.settings = settings or get_settings()
-
-    async def get_overview(self) -> CeleryOverview:
+        self.redis = redis
+
+    async def get_overview(self, *, include_metrics: bool = True) -> CeleryOverview:
+        """Read from the event consumer's state; broadcast ``inspect`` only when it is stale."""
+        update: dict[str, Any] = {
+            "beat_schedule": _build_beat_schedule(self.settings),
+            "flower_url": self.settings.flower_url,
+        }
+        if include_metrics:
+            update.update(await self._read_metrics())
+        overview = await self._read_state()
+        if overview is None:
+            overview = await self._inspect()
+        return overview.model_copy(update=update)
+
+    async def _inspect(self) -> CeleryOverview:
         overall_timeout = self.settings.celery_inspect_overall_timeout
-        beat_schedule = _build_beat_schedule(self.settings)
-        flower_url = self.settings.flower_url
         try:
-            overview = await asyncio.wait_for(
+            return await asyncio.wait_for(
                 asyncio.to_thread(self._inspect_sync),
                 timeout=overall_timeout,
             )
-            return overview.model_copy(
-                update={"beat_schedule": beat_schedule, "flower_url": flower_url}
-            )
         except TimeoutError:
             return CeleryOverview(
                 status="degraded",
                 workers=[],
                 active_tasks=[],
                 scheduled_tasks=[],
-                beat_schedule=beat_schedule,
-                flower_url=flower_url,
                 message=(
                     f"Celery inspect timed out after {overall_timeout}s; "
                     "check that celery-worker is running"
@@ -82,11 +99,44 @@ class AdminCeleryService:
                 workers=[],
                 active_tasks=[],
                 scheduled_tasks=[],
-                beat_schedule=beat_schedule,
-                flower_url=flower_url,
                 message=str(exc),
             )
 
+    async def _read_metrics(self) -> dict[str, Any]:
+        if self.redis is None:
+            return {}
+        try:
+            return {
+                "queues": await read_queue_lengths(self.redis),
+                "task_timings": await read_task_timings(self.redis),
+            }
+        except RedisError:
+            logger.warning("celery_metrics_read_failed")
+            return {}
+
+    async def _read_state(self) -> CeleryOverview | None:
+        if self.redis is None or not self.settings.celery_state_enabled:
+            return None
+        try:
+            raw = await self.redis.get(CELERY_STATE_REDIS_KEY)
+        except RedisError:
+            logger.warning("celery_state_read_failed")
+            return None
+        if not raw:
+            return None
+        state = json.loads(raw)
+        if time.time() - state["updated_at"] > self.settings.celery_state_max_age_seconds:
+            return None
+        workers = [CeleryWorkerInfo(**worker) for worker in state["workers"]]
+        return CeleryOverview(
+            status="ok" if workers else "unavailable",
+            workers=workers,
+            active_tasks=[CeleryTaskInfo(**task) for task in state["active_tasks"]],
+            scheduled_tasks=[CeleryTaskInfo(**task) for task in state["scheduled_tasks"]],
+            reserved_tasks=[CeleryTaskInfo(**task) for task in state["reserved_tasks"]],
+            message=None if workers else "No Celery workers are sending heartbeats",
+        )
+
     def _inspect_sync(self) -> CeleryOverview:
         timeout = self.settings.celery_inspect_timeout
 
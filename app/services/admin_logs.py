@@ -8,6 +8,7 @@ from fastapi import status
 
 from app.core.config import Settings
 from app.core.exceptions import AppException
+from app.core.http_client import http_client
 from app.core.logging import get_logger
 from app.schemas.admin_logs import LogEntryPublic, LogQueryResult
 
@@ -57,9 +58,7 @@ class AdminLogsService:
 
         url = urljoin(f"{base}/", "loki/api/v1/query_range")
         try:
-            async with httpx.AsyncClient(
-                timeout=self.settings.loki_query_timeout_seconds
-            ) as client:
+            async with http_client("loki", self.settings) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
                 payload = response.json()
@@ -4,11 +4,14 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache.principal import Principal, get_principal_cache
 from app.core.exceptions import AppException
+from app.core.password_hasher import get_password_hasher
 from app.core.roles import ADMIN
-from app.core.security import get_password_hash
 from app.models.user import User
 from app.repositories.audit_log import AuditLogRepository
+from app.repositories.counting import RowCounter
+from app.repositories.pagination import Cursor
 from app.repositories.user import UserRepository
 from app.schemas.admin import AuditLogPublic, PasswordResetResult, UserAdmin, UserUpdate
 from app.schemas.pagination import PaginatedResponse
@@ -29,20 +32,48 @@ class AdminUserService:
         email: str | None = None,
         is_active: bool | None = None,
         role: str | None = None,
+        cursor: str | None = None,
+        counter: RowCounter | None = None,
     ) -> PaginatedResponse[UserAdmin]:
-        items, total = await self.users.list_paginated(
-            page=page,
-            page_size=page_size,
-            email=email,
-            is_active=is_active,
-            role=role,
-        )
+        if cursor is not None:
+            result = await self.users.list_after(
+                cursor=Cursor.decode(cursor),
+                page_size=page_size,
+                email=email,
+                is_active=is_active,
+                role=role,
+            )
+        else:
+            result = await self.users.list_paginated(
+                page=page,
+                page_size=page_size,
+                email=email,
+                is_active=is_active,
+                role=role,
+                counter=counter,
+            )
         return PaginatedResponse(
-            items=[UserAdmin.model_validate(u) for u in items],
-            total=total,
-            page=page,
+            items=[UserAdmin.model_validate(u) for u in result.items],
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=page if cursor is None else None,
             page_size=page_size,
+            next_cursor=result.next_cursor,
+        )
+
+    async def search_users(
+        self,
+        term: str,
+        *,
+        limit: int = 20,
+        prefix: bool = False,
+        is_active: bool | None = None,
+        role: str | None = None,
+    ) -> list[UserAdmin]:
+        users = await self.users.search_by_email(
+            term, limit=limit, prefix=prefix, is_active=is_active, role=role
         )
+        return [UserAdmin.model_validate(u) for u in users]
 
     async def get_user(self, user_id: uuid.UUID) -> UserAdmin:
         user = await self.users.get_by_id(user_id)
@@ -52,7 +83,7 @@ class AdminUserService:
 
     async def update_user(
         self,
-        actor: User,
+        actor: Principal,
         user_id: uuid.UUID,
         payload: UserUpdate,
         *,
@@ -95,6 +126,7 @@ class AdminUserService:
             )
 
         updated = await self.users.update_fields(user, **changes)
+        await get_principal_cache().invalidate_on_commit(self.session, user.id)
         await self.audit.record(
             actor_id=actor.id,
             action="user.update",
@@ -137,7 +169,7 @@ class AdminUserService:
 
     async def reset_password(
         self,
-        actor: User,
+        actor: Principal,
         user_id: uuid.UUID,
         *,
         ip: str | None = None,
@@ -151,8 +183,9 @@ class AdminUserService:
         temporary_password = secrets.token_urlsafe(12)
         await self.users.update_fields(
             user,
-            hashed_password=get_password_hash(temporary_password),
+            hashed_password=await get_password_hasher().hash(temporary_password),
         )
+        await get_principal_cache().invalidate_on_commit(self.session, user.id)
 
         await self.audit.record(
             actor_id=actor.id,
@@ -0,0 +1,321 @@
+import asyncio
+import json
+import random
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal, cast
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.rate_limiter import RedisRateLimiter
+from app.core.alert_keys import ALERT_DEAD_LETTER_KEY, ALERT_RATE_PREFIX, ALERT_SUPPRESSED_PREFIX
+from app.core.config import Settings
+from app.core.logging import get_logger
+from app.models.alert_delivery import AlertDelivery
+from app.models.alert_settings import AlertSettings
+from app.repositories.alert import (
+    AlertDeliveryRepository,
+    AlertDestinationRepository,
+    AlertSettingsRepository,
+)
+from app.services.alert_webhook import build_alert_payload, post_webhook
+
+logger = get_logger(__name__)
+
+PRIMARY_DESTINATION = "primary"
+# Client errors that are worth retrying; any other 4xx will fail the same way again.
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+
+DeliveryOutcome = Literal["delivered", "retry", "dead_lettered", "dropped"]
+
+ALERT_DELIVERY_ATTEMPTS = Counter(
+    "alert_delivery_attempts_total",
+    "Alert webhook delivery attempts",
+    ["outcome"],
+)
+ALERT_DEAD_LETTERS = Counter(
+    "alert_dead_letters_total",
+    "Alert deliveries given up on and moved to the dead-letter list",
+)
+ALERT_RATE_LIMITED = Counter(
+    "alert_notifications_rate_limited_total",
+    "Alert notifications not sent because the destination hit its rate cap",
+)
+
+_rate_limiter = RedisRateLimiter()
+
+
+@dataclass(frozen=True)
+class Destination:
+    key: str  # PRIMARY_DESTINATION or an alert_destinations id
+    name: str
+    url: str
+    secret: str | None
+    rate_limit: int | None = None  # None: ALERT_DESTINATION_RATE_LIMIT
+
+
+@dataclass(frozen=True)
+class AttemptResult:
+    http_status: int | None
+    error: str | None
+
+    @property
+    def success(self) -> bool:
+        return self.http_status is not None and 200 <= self.http_status < 300
+
+    @property
+    def retryable(self) -> bool:
+        if self.success:
+            return False
+        if self.http_status is None:
+            return True
+        return self.http_status >= 500 or self.http_status in RETRYABLE_CLIENT_ERRORS
+
+
+def backoff_seconds(
+    attempt: int, settings: Settings, *, rng: Callable[[], float] = random.random
+) -> float:
+    """Exponential backoff after ``attempt`` failed, jittered over its upper half."""
+    ceiling = min(
+        settings.alert_delivery_backoff_max_seconds,
+        settings.alert_delivery_backoff_base_seconds * 2.0 ** (attempt - 1),
+    )
+    return ceiling / 2 + rng() * ceiling / 2
+
+
+class AlertDispatcher:
+    """Fans alerts out to every destination and delivers them with retries.
+
+    Each destination's rate cap is applied first. In ``queued`` mode each destination
+    gets its own ``deliver_alert`` Celery task, so a slow or failing receiver never holds
+    up the health check. ``inline`` mode makes one
+    concurrent attempt per destination during the call instead.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: Redis,
+        settings: Settings,
+        *,
+        rate_limiter: RedisRateLimiter | None = None,
+    ) -> None:
+        self.session = session
+        self.redis = redis
+        self.settings = settings
+        self.rate_limiter = rate_limiter or _rate_limiter
+        self.destinations_repo = AlertDestinationRepository(session)
+        self.deliveries_repo = AlertDeliveryRepository(session)
+
+    async def destinations(self, settings_row: AlertSettings | None = None) -> list[Destination]:
+        destinations: list[Destination] = []
+        url = settings_row.webhook_url if settings_row else None
+        secret = settings_row.webhook_secret if settings_row else None
+        url = url or self.settings.alert_webhook_url
+        if url:
+            secret = secret or self.settings.alert_webhook_secret
+            destinations.append(Destination(PRIMARY_DESTINATION, PRIMARY_DESTINATION, url, secret))
+        for row in await self.destinations_repo.list_all():
+            destinations.append(
+                Destination(str(row.id), row.name, row.url, row.secret, row.rate_limit)
+            )
+        return destinations
+
+    async def get_destination(self, key: str) -> Destination | None:
+        if key == PRIMARY_DESTINATION:
+            settings_row = await AlertSettingsRepository(self.session).get_or_create()
+            primary = await self.destinations(settings_row)
+            return primary[0] if primary and primary[0].key == key else None
+        try:
+            row_id = uuid.UUID(key)
+        except ValueError:
+            return None
+        row = await self.destinations_repo.get(row_id)
+        if row is None:
+            return None
+        return Destination(str(row.id), row.name, row.url, row.secret, row.rate_limit)
+
+    async def dispatch(self, destinations: list[Destination], payload: dict[str, Any]) -> None:
+        """Send one notification (a single alert or a digest) to every destination under its cap."""
+        sends: list[tuple[Destination, dict[str, Any]]] = []
+        for destination in destinations:
+            admitted = await self._admit(destination, payload)
+            if admitted is not None:
+                sends.append((destination, admitted))
+        if self.settings.alert_delivery_mode == "inline":
+            await self._dispatch_inline(sends)
+            return
+
+        from app.tasks.alerts import deliver_alert
+
+        for destination, admitted in sends:
+            deliver_alert.delay(str(uuid.uuid4()), destination.key, admitted["event"], admitted)
+
+    async def _admit(
+        self, destination: Destination, payload: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Apply the destination's rate cap; what it held back is reported on the next send."""
+        limit = destination.rate_limit
+        if limit is None:
+            limit = self.settings.alert_destination_rate_limit
+        if not limit:
+            return payload
+        suppressed_key = f"{ALERT_SUPPRESSED_PREFIX}{destination.key}"
+        window = self.settings.alert_destination_rate_window_seconds
+        result = await self.rate_limiter.hit(
+            self.redis,
+            f"{ALERT_RATE_PREFIX}{destination.key}",
+            algorithm="fixed_window",
+            limit=limit,
+            window_seconds=window,
+        )
+        if not result.allowed:
+            ALERT_RATE_LIMITED.inc()
+            events = len(payload["details"].get("events", ())) or 1
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.incrby(suppressed_key, events)
+                pipe.expire(suppressed_key, window * 2)
+                await pipe.execute()
+            logger.info(
+                "alert_notification_rate_limited",
+                destination=destination.name,
+                event_type=payload["event"],
+            )
+            return None
+        suppressed = await self.redis.getdel(suppressed_key)
+        if suppressed:
+            return {**payload, "suppressed_events": int(suppressed)}
+        return payload
+
+    async def send_now(
+        self, destination: Destination, *, event_type: str, details: dict[str, Any] | None = None
+    ) -> AttemptResult:
+        """One recorded attempt, bypassing the queue (admin test sends)."""
+        payload = build_alert_payload(
+            event_type=event_type, settings=self.settings, details=details
+        )
+        result = await self._post(destination, payload)
+        await self._record(uuid.uuid4(), destination, event_type, result, attempt=1)
+        return result
+
+    async def _dispatch_inline(self, sends: list[tuple[Destination, dict[str, Any]]]) -> None:
+        results = await asyncio.gather(
+            *(self._post(destination, payload) for destination, payload in sends)
+        )
+        # The session takes one statement at a time, so rows are written after the posts.
+        for (destination, payload), result in zip(sends, results, strict=True):
+            await self._record(uuid.uuid4(), destination, payload["event"], result, attempt=1)
+
+    async def deliver(
+        self,
+        *,
+        dispatch_id: str,
+        destination_key: str,
+        event_type: str,
+        payload: dict[str, Any],
+        attempt: int,
+    ) -> DeliveryOutcome:
+        """Make one attempt and record it; the caller schedules the next one on ``retry``."""
+        destination = await self.get_destination(destination_key)
+        if destination is None:
+            logger.warning(
+                "alert_delivery_destination_gone",
+                destination=destination_key,
+                event_type=event_type,
+            )
+            return "dropped"
+
+        result = await self._post(destination, payload)
+        await self._record(uuid.UUID(dispatch_id), destination, event_type, result, attempt)
+        if result.success:
+            return "delivered"
+        if result.retryable and attempt < self.settings.alert_delivery_max_attempts:
+            return "retry"
+        await self.dead_letter(
+            {
+                "dispatch_id": dispatch_id,
+                "destination": destination_key,
+                "destination_name": destination.name,
+                "event_type": event_type,
+                "payload": payload,
+                "attempts": attempt,
+                "http_status": result.http_status,
+                "error": result.error,
+                "failed_at": datetime.now(UTC).isoformat(),
+            }
+        )
+        return "dead_lettered"
+
+    async def dead_letter(self, entry: dict[str, Any]) -> None:
+        ALERT_DEAD_LETTERS.inc()
+        logger.warning(
+            "alert_delivery_dead_lettered",
+            dispatch_id=entry["dispatch_id"],
+            destination=entry["destination"],
+            event_type=entry["event_type"],
+        )
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lpush(ALERT_DEAD_LETTER_KEY, json.dumps(entry))
+            pipe.ltrim(ALERT_DEAD_LETTER_KEY, 0, self.settings.alert_dead_letter_max_entries - 1)
+            await pipe.execute()
+
+    async def list_dead_letters(self, limit: int = 100) -> list[dict[str, Any]]:
+        raw = await self.redis.lrange(ALERT_DEAD_LETTER_KEY, 0, limit - 1)
+        return [json.loads(item) for item in raw]
+
+    async def requeue(self, dispatch_id: str) -> bool:
+        """Move a dead letter back onto the delivery queue, starting its attempts over."""
+        from app.tasks.alerts import deliver_alert
+
+        for raw in await self.redis.lrange(ALERT_DEAD_LETTER_KEY, 0, -1):
+            entry = json.loads(raw)
+            if entry["dispatch_id"] != dispatch_id:
+                continue
+            if not await self.redis.lrem(ALERT_DEAD_LETTER_KEY, 1, cast(str, raw)):
+                return False  # requeued concurrently
+            deliver_alert.delay(
+                entry["dispatch_id"], entry["destination"], entry["event_type"], entry["payload"]
+            )
+            return True
+        return False
+
+    async def _post(self, destination: Destination, payload: dict[str, Any]) -> AttemptResult:
+        try:
+            http_status = await post_webhook(
+                url=destination.url,
+                payload=payload,
+                secret=destination.secret,
+                timeout=self.settings.alert_webhook_timeout_seconds,
+            )
+        except Exception as exc:
+            logger.warning(
+                "alert_delivery_attempt_failed", destination=destination.name, error=str(exc)
+            )
+            return AttemptResult(http_status=None, error=f"{type(exc).__name__}: {exc}"[:500])
+        error = None if http_status and 200 <= http_status < 300 else f"HTTP {http_status}"
+        return AttemptResult(http_status=http_status, error=error)
+
+    async def _record(
+        self,
+        dispatch_id: uuid.UUID,
+        destination: Destination,
+        event_type: str,
+        result: AttemptResult,
+        attempt: int,
+    ) -> None:
+        ALERT_DELIVERY_ATTEMPTS.labels(outcome="ok" if result.success else "failed").inc()
+        await self.deliveries_repo.create(
+            AlertDelivery(
+                event_type=event_type,
+                success=result.success,
+                http_status=result.http_status,
+                dispatch_id=dispatch_id,
+                destination=destination.name,
+                attempt=attempt,
+                error=result.error,
+            )
+        )
@@ -0,0 +1,60 @@
+import json
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from app.core.alert_keys import ALERT_GROUP_OPENED_KEY, ALERT_PENDING_KEY
+from app.core.config import Settings
+
+# KEYS = (pending list, opened-at); ARGV = (window seconds, ttl seconds, *event payloads).
+# Appends the events, opens the group on the first one, and once the group is at least
+# `window` old hands back everything pending and clears it. Time comes from the Redis
+# server, like the rate limiter scripts.
+_ADD_AND_FLUSH = """
+local window = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local now = tonumber(redis.call('TIME')[1])
+if #ARGV > 2 then
+  redis.call('RPUSH', KEYS[1], unpack(ARGV, 3))
+  redis.call('SET', KEYS[2], now, 'NX')
+  redis.call('EXPIRE', KEYS[1], ttl)
+  redis.call('EXPIRE', KEYS[2], ttl)
+end
+local opened = tonumber(redis.call('GET', KEYS[2]))
+if opened ~= nil and now - opened < window then
+  return {}
+end
+local events = redis.call('LRANGE', KEYS[1], 0, -1)
+redis.call('DEL', KEYS[1], KEYS[2])
+return events
+"""
+
+
+class AlertGrouper:
+    """Holds alert events in Redis until their group window closes.
+
+    One ``EVALSHA`` per health check: the check's events go in, and a whole group comes
+    out once ``alert_group_window_seconds`` have passed since its first event. With a
+    zero window each check's events go straight out without touching Redis, and the
+    monitor sends them one by one instead of as a digest.
+    """
+
+    def __init__(self, redis: Redis, settings: Settings) -> None:
+        self.redis = redis
+        self.settings = settings
+        self._script: AsyncScript | None = None
+
+    async def add(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        window = self.settings.alert_group_window_seconds
+        if not window:
+            return events
+        if self._script is None:
+            self._script = self.redis.register_script(_ADD_AND_FLUSH)
+        # Outlive a few missed checks, then drop a group nobody is left to flush.
+        ttl = window + 3 * self.settings.alert_check_interval_seconds
+        flushed = await self._script(
+            keys=[ALERT_PENDING_KEY, ALERT_GROUP_OPENED_KEY],
+            args=[window, ttl, *(json.dumps(event) for event in events)],
+        )
+        return [json.loads(raw) for raw in flushed]
@@ -0,0 +1,201 @@
+"""Alert monitor state: one Redis hash, changed once per check.
+
+``evaluate`` is a pure function from the stored state and a health snapshot to the
+writes, state changes and alerts of one check. ``AlertStateStore.transition`` reads the
+hash under ``WATCH`` and applies the result in a single ``MULTI``, so a check costs the
+same three round trips however many checks or alerts it covers. The first check after
+upgrading from the per-check keys makes one more, to carry their statuses over.
+"""
+
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Literal
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from app.core.alert_keys import (
+    ALERT_STATE_HISTORY_KEY,
+    ALERT_STATE_KEY,
+    LEGACY_ALERT_STATE_KEYS,
+)
+from app.core.celery_keys import BEAT_HEARTBEAT_REDIS_KEY
+from app.core.config import Settings
+from app.services.health_probes import HealthSnapshot
+
+AlertCheck = Literal["ready", "beat", "workers"]
+
+ALERT_CHECKS: tuple[AlertCheck, ...] = ("ready", "beat", "workers")
+# Hash fields besides the per-check status and "<check>:since".
+WORKERS_ZERO_SINCE_FIELD = "workers:zero_since"
+DEDUPE_FIELD_PREFIX = "dedupe:"
+
+
+@dataclass(frozen=True)
+class StateChange:
+    check: AlertCheck
+    previous: str | None
+    current: str
+    at: str
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Transition:
+    updates: dict[str, str] = field(default_factory=dict)
+    removals: list[str] = field(default_factory=list)
+    changes: list[StateChange] = field(default_factory=list)
+    alerts: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+
+class _Evaluation:
+    def __init__(self, state: Mapping[str, str], settings: Settings, now: datetime) -> None:
+        self.state = state
+        self.settings = settings
+        self.now = now
+        self.result = Transition()
+
+    def set_status(self, check: AlertCheck, status: str, details: dict[str, Any]) -> str | None:
+        previous = self.state.get(check)
+        if previous != status:
+            at = self.now.isoformat()
+            self.result.updates[check] = status
+            self.result.updates[f"{check}:since"] = at
+            # The first "ok" seen is a baseline, not a change worth keeping.
+            if previous is not None or status != "ok":
+                self.result.changes.append(StateChange(check, previous, status, at, details))
+        return previous
+
+    def alert(self, event_type: str, details: dict[str, Any], *, dedupe: bool = True) -> None:
+        if dedupe:
+            dedupe_field = f"{DEDUPE_FIELD_PREFIX}{event_type}"
+            until = _float(self.state.get(dedupe_field))
+            if until is not None and until > self.now.timestamp():
+                return
+            expires = self.now.timestamp() + self.settings.alert_dedupe_seconds
+            self.result.updates[dedupe_field] = str(expires)
+        self.result.alerts.append((event_type, details))
+
+
+def evaluate(
+    state: Mapping[str, str],
+    snapshot: HealthSnapshot,
+    *,
+    settings: Settings,
+    recovery_enabled: bool,
+    now: datetime,
+) -> Transition:
+    ev = _Evaluation(state, settings, now)
+
+    ready = {
+        "database": "ok" if snapshot.database_ok else "error",
+        "redis": "ok" if snapshot.redis_ok else "error",
+    }
+    if snapshot.database_ok and snapshot.redis_ok:
+        if ev.set_status("ready", "ok", ready) == "failed" and recovery_enabled:
+            ev.alert("ready_recovered", ready, dedupe=False)
+    else:
+        ev.set_status("ready", "failed", ready)
+        ev.alert("ready_failed", ready)
+
+    if snapshot.beat_ok:
+        if ev.set_status("beat", "ok", {}) == "missing" and recovery_enabled:
+            ev.alert("beat_recovered", {}, dedupe=False)
+    else:
+        beat = {"heartbeat_key": BEAT_HEARTBEAT_REDIS_KEY}
+        ev.set_status("beat", "missing", beat)
+        ev.alert("beat_missing", beat)
+
+    if settings.alert_worker_zero_enabled:
+        _evaluate_workers(ev, snapshot, recovery_enabled=recovery_enabled)
+    return ev.result
+
+
+def _evaluate_workers(ev: _Evaluation, snapshot: HealthSnapshot, *, recovery_enabled: bool) -> None:
+    if snapshot.worker_count:
+        if WORKERS_ZERO_SINCE_FIELD in ev.state:
+            ev.result.removals.append(WORKERS_ZERO_SINCE_FIELD)
+        workers = {"worker_count": snapshot.worker_count}
+        if ev.set_status("workers", "ok", workers) == "missing" and recovery_enabled:
+            ev.alert("workers_recovered", workers, dedupe=False)
+        return
+
+    since = _float(ev.state.get(WORKERS_ZERO_SINCE_FIELD))
+    duration = ev.settings.alert_worker_zero_duration_seconds
+    # A start time this old means checks stopped for a while; count again from now.
+    # Never sooner than two missed checks, or a long interval could never alert.
+    expires_after = max(2 * duration, duration + 2 * ev.settings.alert_check_interval_seconds)
+    if since is not None and ev.now.timestamp() - since > expires_after:
+        since = None
+    if since is None:
+        ev.result.updates[WORKERS_ZERO_SINCE_FIELD] = str(ev.now.timestamp())
+        return
+    if ev.now.timestamp() - since < duration:
+        return
+    ev.set_status("workers", "missing", {"worker_count": 0})
+    ev.alert("workers_missing", {"worker_count": 0})
+
+
+def _float(raw: str | None) -> float | None:
+    try:
+        return float(raw) if raw is not None else None
+    except ValueError:
+        return None
+
+
+class AlertStateStore:
+    def __init__(self, redis: Redis, settings: Settings) -> None:
+        self.redis = redis
+        self.settings = settings
+
+    async def transition(
+        self, apply: Callable[[Mapping[str, str]], Transition]
+    ) -> Transition | None:
+        """Compute and store one check's transition; ``None`` if another check won the race."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            await pipe.watch(ALERT_STATE_KEY)
+            state: dict[Any, Any] = await pipe.hgetall(ALERT_STATE_KEY)
+            legacy: dict[str, str] = {}
+            if not state:
+                # First check since the upgrade: carry over the old per-check statuses,
+                # so an outage that spans the deploy still ends with a recovery alert.
+                values: list[Any] = await pipe.mget(list(LEGACY_ALERT_STATE_KEYS.values()))
+                legacy = {
+                    check: value
+                    for check, value in zip(LEGACY_ALERT_STATE_KEYS, values, strict=True)
+                    if value is not None
+                }
+                state = dict(legacy)
+            result = apply(state)
+            pipe.multi()  # type: ignore[no-untyped-call]
+            if legacy:
+                result.updates = {**legacy, **result.updates}
+                pipe.delete(*LEGACY_ALERT_STATE_KEYS.values())
+            if result.updates:
+                updates: dict[Any, Any] = result.updates
+                pipe.hset(ALERT_STATE_KEY, mapping=updates)
+            if result.removals:
+                pipe.hdel(ALERT_STATE_KEY, *result.removals)
+            if result.changes:
+                pipe.lpush(
+                    ALERT_STATE_HISTORY_KEY,
+                    *(json.dumps(asdict(change)) for change in result.changes),
+                )
+                pipe.ltrim(
+                    ALERT_STATE_HISTORY_KEY, 0, self.settings.alert_state_history_max_entries - 1
+                )
+            try:
+                await pipe.execute()
+            except WatchError:
+                return None
+        return result
+
+    async def current(self) -> dict[str, str]:
+        state: dict[Any, Any] = await self.redis.hgetall(ALERT_STATE_KEY)
+        return state
+
+    async def history(self, limit: int) -> list[dict[str, Any]]:
+        raw = await self.redis.lrange(ALERT_STATE_HISTORY_KEY, 0, limit - 1)
+        return [json.loads(item) for item in raw]
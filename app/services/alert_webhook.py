@@ -5,9 +5,8 @@ from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import urlparse
 
-import httpx
-
 from app.core.config import Settings
+from app.core.http_client import http_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +20,7 @@ EVENT_SUMMARIES: dict[str, str] = {
     "workers_missing": "No Celery workers available",
     "workers_recovered": "Celery workers are available again",
 }
+DIGEST_EVENT = "digest"
 
 
 def validate_webhook_url(url: str) -> None:
@@ -48,6 +48,32 @@ def build_alert_payload(
     }
 
 
+def build_digest_payload(
+    events: list[dict[str, Any]],
+    *,
+    settings: Settings,
+) -> dict[str, Any]:
+    """Combine the alert payloads of one group into a single notification.
+
+    A lone event keeps its own payload. Otherwise repeats of an event type collapse into
+    the latest one with an ``occurrences`` count, in order of first appearance.
+    """
+    if len(events) == 1:
+        return events[0]
+    grouped: dict[str, dict[str, Any]] = {}
+    for event in events:
+        occurrences = grouped[event["event"]]["occurrences"] + 1 if event["event"] in grouped else 1
+        grouped[event["event"]] = {**event, "occurrences": occurrences}
+    combined = list(grouped.values())
+    return {
+        "event": DIGEST_EVENT,
+        "environment": settings.environment,
+        "summary": f"{len(combined)} alerts: " + "; ".join(e["summary"] for e in combined),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "details": {"events": combined},
+    }
+
+
 def sign_payload(body: bytes, secret: str) -> str:
     digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
     return f"sha256={digest}"
@@ -65,6 +91,6 @@ async def post_webhook(
     if secret:
         headers["X-Alert-Signature"] = sign_payload(body, secret)
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(url, content=body, headers=headers)
+    async with http_client("webhook") as client:
+        response = await client.post(url, content=body, headers=headers, timeout=timeout)
         return response.status_code
@@ -1,10 +1,12 @@
 import uuid
+from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.audit_log import AuditLog
 from app.repositories.audit_log import AuditLogRepository
+from app.services.audit_writer import AUDIT_EVENTS, PENDING_AUDIT_KEY, get_audit_writer
 
 
 class AuditService:
@@ -23,15 +25,37 @@ class AuditService:
         ip: str | None = None,
         user_agent: str | None = None,
         request_id: str | None = None,
-    ) -> AuditLog:
-        log = AuditLog(
-            actor_id=actor_id,
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            detail=detail,
-            ip=ip,
-            user_agent=user_agent,
-            request_id=request_id,
-        )
-        return await self.logs.create(log)
+        durable: bool = False,
+    ) -> AuditLog | None:
+        """Record an audit event that is written when the caller's transaction commits.
+
+        Synchronously, the row joins the caller's transaction. In buffered mode the event
+        is handed to the ``AuditWriter`` after commit (or at once outside a transaction) and
+        ``None`` is returned; pass
+        ``durable=True`` to keep a single event in the caller's transaction regardless.
+        """
+        values: dict[str, Any] = {
+            "actor_id": actor_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "detail": detail,
+            "ip": ip,
+            "user_agent": user_agent,
+            "request_id": request_id,
+        }
+        writer = get_audit_writer()
+        if durable or writer is None or not writer.accepts(action):
+            log = AuditLog(**values)
+            self.logs.add(log)
+            AUDIT_EVENTS.labels(mode="sync").inc()
+            return log
+
+        # The row is inserted later, so stamp the time of the action now.
+        values["id"] = uuid.uuid4()
+        values["created_at"] = datetime.now(UTC)
+        if self.session.in_transaction():
+            self.session.info.setdefault(PENDING_AUDIT_KEY, []).append(values)
+        else:
+            writer.submit(values)
+        return None
@@ -0,0 +1,236 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol
+
+from fastapi import status
+
+from app.core.exceptions import AppException
+
+ExportFormat = Literal["csv", "ndjson", "parquet", "arrow"]
+
+COLUMNAR_UNAVAILABLE_CODE = 50101
+
+EXPORT_HEADER = [
+    "created_at",
+    "action",
+    "actor_id",
+    "resource_type",
+    "resource_id",
+    "ip",
+    "request_id",
+    "detail",
+]
+
+
+@dataclass(frozen=True)
+class ExportFormatInfo:
+    media_type: str
+    extension: str
+    columnar: bool = False
+
+
+EXPORT_FORMATS: dict[ExportFormat, ExportFormatInfo] = {
+    "csv": ExportFormatInfo("text/csv; charset=utf-8", "csv"),
+    "ndjson": ExportFormatInfo("application/x-ndjson", "ndjson"),
+    "parquet": ExportFormatInfo("application/vnd.apache.parquet", "parquet", columnar=True),
+    "arrow": ExportFormatInfo("application/vnd.apache.arrow.stream", "arrow", columnar=True),
+}
+
+
+class ExportEncoder(Protocol):
+    def begin(self) -> bytes: ...
+
+    def encode(self, batch: Sequence[Sequence[Any]]) -> bytes: ...
+
+    def finish(self, *, truncated_at: int | None) -> bytes: ...
+
+
+def _record(row: Sequence[Any]) -> dict[str, Any]:
+    record = dict(zip(EXPORT_HEADER, row, strict=True))
+    record["created_at"] = record["created_at"].isoformat()
+    record["actor_id"] = str(record["actor_id"]) if record["actor_id"] else None
+    return record
+
+
+def _json_detail(detail: Any) -> str | None:
+    return json.dumps(detail, separators=(",", ":"), default=str) if detail else None
+
+
+class CsvEncoder:
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate(0)
+        return data
+
+    def begin(self) -> bytes:
+        self._writer.writerow(EXPORT_HEADER)
+        return self._drain()
+
+    def encode(self, batch: Sequence[Sequence[Any]]) -> bytes:
+        for row in batch:
+            record = _record(row)
+            record["detail"] = _json_detail(record["detail"])
+            self._writer.writerow(["" if value is None else value for value in record.values()])
+        return self._drain()
+
+    def finish(self, *, truncated_at: int | None) -> bytes:
+        if truncated_at is not None:
+            self._writer.writerow([])
+            self._writer.writerow([f"# export truncated at {truncated_at} rows"])
+        return self._drain()
+
+
+class NdjsonEncoder:
+    def begin(self) -> bytes:
+        return b""
+
+    def encode(self, batch: Sequence[Sequence[Any]]) -> bytes:
+        lines = [json.dumps(_record(row), separators=(",", ":"), default=str) for row in batch]
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+
+    def finish(self, *, truncated_at: int | None) -> bytes:
+        return b""
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file that hands back what has been written since the last drain.
+
+    ``tell()`` reports the total bytes written, which Parquet needs for its footer
+    offsets even though earlier bytes have already been sent to the client.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._parts.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class ColumnarEncoder:
+    """Arrow IPC stream or Parquet, one record batch (row group) per fetch batch."""
+
+    def __init__(self, fmt: Literal["parquet", "arrow"]) -> None:
+        pa = _require_pyarrow()
+        self._pa = pa
+        self._fmt = fmt
+        self._sink = _DrainableSink()
+        self._schema = pa.schema(
+            [
+                ("created_at", pa.timestamp("us", tz="UTC")),
+                ("action", pa.string()),
+                ("actor_id", pa.string()),
+                ("resource_type", pa.string()),
+                ("resource_id", pa.string()),
+                ("ip", pa.string()),
+                ("request_id", pa.string()),
+                ("detail", pa.string()),
+            ]
+        )
+        self._writer: Any = None
+
+    def begin(self) -> bytes:
+        pa = self._pa
+        out = pa.PythonFile(self._sink, mode="w")
+        if self._fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(out, self._schema, compression="zstd")
+        else:
+            options = pa.ipc.IpcWriteOptions(compression="zstd")
+            self._writer = pa.ipc.new_stream(out, self._schema, options=options)
+        return self._sink.drain()
+
+    def encode(self, batch: Sequence[Sequence[Any]]) -> bytes:
+        if not batch:
+            return b""
+        created_at, action, actor_id, resource_type, resource_id, ip, request_id, detail = zip(
+            *batch, strict=True
+        )
+        record_batch = self._pa.record_batch(
+            [
+                self._pa.array(created_at, type=self._schema.field("created_at").type),
+                self._pa.array(action, type=self._pa.string()),
+                self._pa.array([str(v) if v else None for v in actor_id], type=self._pa.string()),
+                self._pa.array(resource_type, type=self._pa.string()),
+                self._pa.array(resource_id, type=self._pa.string()),
+                self._pa.array(ip, type=self._pa.string()),
+                self._pa.array(request_id, type=self._pa.string()),
+                self._pa.array([_json_detail(v) for v in detail], type=self._pa.string()),
+            ],
+            schema=self._schema,
+        )
+        self._writer.write_batch(record_batch)
+        return self._sink.drain()
+
+    def finish(self, *, truncated_at: int | None) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+class GzipStream:
+    """Incremental gzip member; each ``compress`` call returns a decodable prefix."""
+
+    def __init__(self, level: int = 6) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if not data:
+            return b""
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise AppException(
+            "Columnar exports require pyarrow (install the 'export' extra)",
+            code=COLUMNAR_UNAVAILABLE_CODE,
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        ) from exc
+    return pyarrow
+
+
+def check_export_format(fmt: ExportFormat, gzip: bool) -> None:
+    if gzip and EXPORT_FORMATS[fmt].columnar:
+        raise AppException(
+            f"{fmt} exports are already compressed; gzip applies to csv and ndjson only",
+            code=40008,
+        )
+    if EXPORT_FORMATS[fmt].columnar:
+        _require_pyarrow()
+
+
+def make_encoder(fmt: ExportFormat) -> ExportEncoder:
+    if fmt == "csv":
+        return CsvEncoder()
+    if fmt == "ndjson":
+        return NdjsonEncoder()
+    return ColumnarEncoder(fmt)
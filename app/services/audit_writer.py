@@ -0,0 +1,195 @@
+import asyncio
+import time
+from typing import Any
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.config import Settings
+from app.core.logging import get_logger
+from app.models.audit_log import AuditLog
+
+logger = get_logger(__name__)
+
+PENDING_AUDIT_KEY = "pending_audit_events"
+
+AUDIT_EVENTS = Counter(
+    "audit_events_total",
+    "Audit events by how they were written",
+    ["mode"],
+)
+AUDIT_EVENTS_DROPPED = Counter(
+    "audit_events_dropped_total",
+    "Buffered audit events that could not be inserted",
+)
+AUDIT_FLUSH_SECONDS = Histogram(
+    "audit_buffer_flush_seconds",
+    "Time to bulk-insert one batch of buffered audit events",
+)
+
+
+class AuditWriter:
+    """Bulk-inserts buffered audit events from a background task.
+
+    A batch is written once it reaches ``max_batch`` events or its oldest event has
+    waited ``max_latency_seconds``. Events are lost if the process dies before their
+    batch is written, which is why ``sync_actions`` never come through here.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        max_batch: int = 500,
+        max_latency_seconds: float = 0.2,
+        max_pending: int = 10_000,
+        sync_actions: frozenset[str] = frozenset(),
+        retries: int = 3,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.max_latency_seconds = max_latency_seconds
+        self.max_pending = max_pending
+        self.sync_actions = sync_actions
+        self.retries = retries
+        # Unbounded so close() can always enqueue its sentinel; accepts() bounds it.
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._batch_ready = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(
+        cls, session_factory: async_sessionmaker[AsyncSession], settings: Settings
+    ) -> "AuditWriter":
+        return cls(
+            session_factory,
+            max_batch=settings.audit_buffer_max_batch,
+            max_latency_seconds=settings.audit_buffer_max_latency_ms / 1000,
+            max_pending=settings.audit_buffer_max_pending,
+            sync_actions=frozenset(settings.audit_sync_actions),
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def accepts(self, action: str) -> bool:
+        """False for compliance-critical actions and when the buffer is full."""
+        return (
+            self._task is not None
+            and action not in self.sync_actions
+            and self._queue.qsize() < self.max_pending
+        )
+
+    def submit(self, values: dict[str, Any]) -> None:
+        self._queue.put_nowait(values)
+        if self._queue.qsize() >= self.max_batch:
+            self._batch_ready.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="audit-writer")
+
+    async def close(self) -> None:
+        """Write everything already submitted, then stop."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        self._closing = True
+        self._queue.put_nowait(None)
+        self._batch_ready.set()
+        await task
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            # Wait out the latency budget unless a full batch is already queued.
+            self._batch_ready.clear()
+            if not self._closing and self._queue.qsize() + 1 < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.max_latency_seconds)
+                except TimeoutError:
+                    pass
+            batch = [first]
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        for attempt in range(1, self.retries + 1):
+            started = time.perf_counter()
+            try:
+                async with self.session_factory() as session:
+                    await session.execute(insert(AuditLog), batch)
+                    await session.commit()
+            except Exception:
+                logger.warning("audit_flush_failed", attempt=attempt, events=len(batch))
+                if attempt < self.retries:
+                    await asyncio.sleep(0.1 * 2**attempt)
+                continue
+            AUDIT_FLUSH_SECONDS.observe(time.perf_counter() - started)
+            AUDIT_EVENTS.labels(mode="buffered").inc(len(batch))
+            return
+        AUDIT_EVENTS_DROPPED.inc(len(batch))
+        for values in batch:
+            # Last resort: keep the event in the application log.
+            logger.error("audit_event_dropped", **{k: str(v) for k, v in values.items()})
+
+
+_audit_writer: AuditWriter | None = None
+
+
+def get_audit_writer() -> AuditWriter | None:
+    """The running writer, or ``None`` when audit events are written synchronously."""
+    return _audit_writer
+
+
+def start_audit_writer(
+    session_factory: async_sessionmaker[AsyncSession], settings: Settings
+) -> AuditWriter:
+    global _audit_writer
+    if _audit_writer is None:
+        _audit_writer = AuditWriter.from_settings(session_factory, settings)
+        _audit_writer.start()
+    return _audit_writer
+
+
+async def close_audit_writer() -> None:
+    global _audit_writer
+    writer, _audit_writer = _audit_writer, None
+    if writer is not None:
+        await writer.close()
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_pending_audit(session: Session) -> None:
+    events = session.info.pop(PENDING_AUDIT_KEY, None)
+    if not events:
+        return
+    writer = _audit_writer
+    for values in events:
+        if writer is None:
+            AUDIT_EVENTS_DROPPED.inc()
+            logger.error("audit_event_dropped", **{k: str(v) for k, v in values.items()})
+        else:
+            writer.submit(values)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_audit(session: Session, transaction: SessionTransaction) -> None:
+    # Reached without after_commit only when the outer transaction rolled back.
+    if transaction.parent is None:
+        session.info.pop(PENDING_AUDIT_KEY, None)
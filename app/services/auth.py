@@ -5,12 +5,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
 from app.core.exceptions import AppException
+from app.core.password_hasher import get_password_hasher
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
     get_subject_from_token,
-    verify_password,
 )
 from app.repositories.user import UserRepository
 from app.schemas.auth import AuthResponse, RegisterRequest, TokenPair
@@ -22,6 +21,7 @@ class AuthService:
         self.session = session
         self.settings = settings or get_settings()
         self.users = UserRepository(session)
+        self.hasher = get_password_hasher(self.settings)
 
     async def register(self, payload: RegisterRequest) -> AuthResponse:
         email = payload.email.lower()
@@ -31,7 +31,7 @@ class AuthService:
 
         user = await self.users.create(
             email=email,
-            hashed_password=get_password_hash(payload.password),
+            hashed_password=await self.hasher.hash(payload.password),
         )
         tokens = self._build_tokens(user.id)
 
@@ -42,7 +42,7 @@ class AuthService:
 
     async def login(self, email: str, password: str) -> AuthResponse:
         user = await self.users.get_by_email(email.lower())
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await self.hasher.verify(password, user.hashed_password):
             raise AppException("Invalid email or password", code=40101, status_code=401)
         if not user.is_active:
             raise AppException("User is inactive", code=40102, status_code=403)
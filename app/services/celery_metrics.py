@@ -0,0 +1,186 @@
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+import redis
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily, HistogramMetricFamily, Metric
+from prometheus_client.registry import Collector
+from redis.asyncio import Redis
+
+from app.core.celery_keys import CELERY_TASK_METRICS_NAMES_KEY, CELERY_TASK_METRICS_PREFIX
+from app.core.config import Settings
+from app.core.logging import get_logger
+from app.schemas.admin import CeleryQueueInfo, CeleryTaskTiming
+from app.tasks.celery_app import celery_app
+from app.tasks.instrumentation import TASK_TIMING_BUCKETS
+
+logger = get_logger(__name__)
+
+# kombu's Redis transport keeps priorities 3, 6 and 9 in "<queue>\x06\x16<priority>" lists.
+_PRIORITY_SUFFIXES = ("", "\x06\x163", "\x06\x166", "\x06\x169")
+_BUCKET_LABELS = (*(str(bound) for bound in TASK_TIMING_BUCKETS), "+Inf")
+
+_registered = False
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def queue_names() -> list[str]:
+    names = {celery_app.conf.task_default_queue}
+    names.update(queue.name for queue in celery_app.conf.task_queues or ())
+    return sorted(names)
+
+
+def _queue_keys() -> list[tuple[str, str]]:
+    return [(name, f"{name}{suffix}") for name in queue_names() for suffix in _PRIORITY_SUFFIXES]
+
+
+def _queue_totals(keys: list[tuple[str, str]], lengths: list[int]) -> dict[str, int]:
+    totals = dict.fromkeys(queue_names(), 0)
+    for (name, _key), length in zip(keys, lengths, strict=True):
+        totals[name] += int(length)
+    return totals
+
+
+@dataclass(frozen=True)
+class Histogram:
+    buckets: list[tuple[str, int]]  # cumulative, ending with +Inf
+    count: int
+    sum: float
+
+    @property
+    def average(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile (None past the last bound)."""
+        if not self.count:
+            return None
+        for label, cumulative in self.buckets:
+            if cumulative >= q * self.count:
+                return None if label == "+Inf" else float(label)
+        return None
+
+
+def parse_histogram(fields: Mapping[str, str], kind: str) -> Histogram:
+    cumulative = 0
+    buckets: list[tuple[str, int]] = []
+    for label in _BUCKET_LABELS:
+        cumulative += int(fields.get(f"{kind}_le_{label}", 0))
+        buckets.append((label, cumulative))
+    return Histogram(
+        buckets=buckets,
+        count=int(fields.get(f"{kind}_count", 0)),
+        sum=float(fields.get(f"{kind}_sum", 0.0)),
+    )
+
+
+def _timing(name: str, fields: Mapping[str, str]) -> CeleryTaskTiming:
+    wait = parse_histogram(fields, "wait")
+    runtime = parse_histogram(fields, "runtime")
+    return CeleryTaskTiming(
+        name=name,
+        count=runtime.count,
+        wait_avg_seconds=wait.average,
+        wait_p95_seconds=wait.quantile(0.95),
+        runtime_avg_seconds=runtime.average,
+        runtime_p95_seconds=runtime.quantile(0.95),
+    )
+
+
+async def read_queue_lengths(client: Redis) -> list[CeleryQueueInfo]:
+    keys = _queue_keys()
+    async with client.pipeline(transaction=False) as pipe:
+        for _name, key in keys:
+            pipe.llen(key)
+        lengths = await pipe.execute()
+    totals = _queue_totals(keys, lengths)
+    return [CeleryQueueInfo(name=name, length=length) for name, length in totals.items()]
+
+
+async def read_task_timings(client: Redis) -> list[CeleryTaskTiming]:
+    names = sorted(_text(name) for name in await client.smembers(CELERY_TASK_METRICS_NAMES_KEY))
+    if not names:
+        return []
+    async with client.pipeline(transaction=False) as pipe:
+        for name in names:
+            pipe.hgetall(f"{CELERY_TASK_METRICS_PREFIX}{name}")
+        rows = await pipe.execute()
+    return [_timing(name, fields) for name, fields in zip(names, rows, strict=True)]
+
+
+class CeleryMetricsCollector(Collector):
+    """Broker queue lengths and the task timings workers aggregate in Redis, read per scrape.
+
+    The values are cluster-wide, so every API replica reports the same series.
+    """
+
+    def __init__(self, client: redis.Redis) -> None:
+        # Hash fields are parsed as text, so the client needs decode_responses=True.
+        self.client = client
+
+    def describe(self) -> Iterator[Metric]:
+        # Lets the registry check names without a Redis round trip.
+        yield self._queue_family()
+        yield from self._timing_families().values()
+
+    def collect(self) -> Iterator[Metric]:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            keys = _queue_keys()
+            for _name, key in keys:
+                pipe.llen(key)
+            lengths = pipe.execute()
+            names = sorted(
+                _text(name) for name in self.client.smembers(CELERY_TASK_METRICS_NAMES_KEY)
+            )
+            pipe = self.client.pipeline(transaction=False)
+            for name in names:
+                pipe.hgetall(f"{CELERY_TASK_METRICS_PREFIX}{name}")
+            rows = pipe.execute()
+        except redis.RedisError:
+            logger.warning("celery_metrics_collect_failed")
+            return
+
+        queues = self._queue_family()
+        for name, length in _queue_totals(keys, lengths).items():
+            queues.add_metric([name], length)
+        yield queues
+
+        families = self._timing_families()
+        for name, fields in zip(names, rows, strict=True):
+            for kind, family in families.items():
+                histogram = parse_histogram(fields, kind)
+                family.add_metric([name], histogram.buckets, histogram.sum)
+        yield from families.values()
+
+    @staticmethod
+    def _queue_family() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "celery_queue_length", "Messages waiting in the broker queue", labels=["queue"]
+        )
+
+    @staticmethod
+    def _timing_families() -> dict[str, HistogramMetricFamily]:
+        return {
+            "wait": HistogramMetricFamily(
+                "celery_task_queue_wait_seconds",
+                "Time from publish to a worker starting the task (ETA tasks excluded)",
+                labels=["task"],
+            ),
+            "runtime": HistogramMetricFamily(
+                "celery_task_runtime_seconds", "Task execution time", labels=["task"]
+            ),
+        }
+
+
+def register_celery_metrics(settings: Settings) -> None:
+    """Add the collector to the default registry once per process."""
+    global _registered
+    if _registered or not settings.celery_task_metrics_enabled:
+        return
+    client = redis.from_url(str(settings.redis_url), decode_responses=True, socket_timeout=1.0)
+    REGISTRY.register(CeleryMetricsCollector(client))
+    _registered = True
@@ -0,0 +1,146 @@
+import ast
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import redis
+from celery import Celery
+from celery.events.state import State, Task
+from prometheus_client import Counter
+
+from app.core.celery_keys import CELERY_STATE_REDIS_KEY
+from app.core.config import Settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CELERY_STATE_EVENTS = Counter(
+    "celery_state_events_total",
+    "Celery events consumed by the state aggregator",
+    ["type"],
+)
+CELERY_STATE_PUBLISHES = Counter(
+    "celery_state_publishes_total",
+    "Celery state snapshots written to Redis",
+    ["outcome"],
+)
+
+
+def _task_args(raw: object) -> list[Any]:
+    """Events carry ``repr(args)``; recover the list when it is a plain literal."""
+    if isinstance(raw, (list, tuple)):
+        return list(raw)
+    if not isinstance(raw, str) or not raw:
+        return []
+    try:
+        value = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return [raw]
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _task_entry(task: Task) -> dict[str, Any]:
+    return {
+        "worker": task.worker.hostname,
+        "task_id": task.uuid,
+        "name": task.name or "unknown",
+        "args": _task_args(task.args),
+    }
+
+
+class CeleryStateAggregator:
+    """Consumes Celery worker events and keeps a worker/task snapshot in Redis.
+
+    Run a single instance (``python -m app.tasks.events``); ``AdminCeleryService`` reads
+    the snapshot instead of broadcasting ``inspect`` to every worker. Workers must send
+    task events, which ``celery_app`` enables.
+    """
+
+    def __init__(
+        self,
+        app: Celery,
+        client: redis.Redis,
+        settings: Settings,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.app = app
+        self.client = client
+        self.settings = settings
+        self.clock = clock
+        self.state: State = app.events.State(max_tasks_in_memory=settings.celery_state_max_tasks)
+        self._published_at = 0.0
+
+    def on_event(self, event: dict[str, Any]) -> None:
+        self.state.event(event)
+        CELERY_STATE_EVENTS.labels(type=event.get("type", "unknown")).inc()
+        if self.clock() - self._published_at >= self.settings.celery_state_publish_interval_seconds:
+            self.publish()
+
+    def snapshot(self) -> dict[str, Any]:
+        workers = {name: worker for name, worker in self.state.workers.items() if worker.alive}
+        active: list[dict[str, Any]] = []
+        reserved: list[dict[str, Any]] = []
+        scheduled: list[dict[str, Any]] = []
+        for task in list(self.state.tasks.values()):
+            if task.worker is None or task.worker.hostname not in workers:
+                continue
+            if task.state == "STARTED":
+                active.append(_task_entry(task))
+            elif task.state == "RECEIVED":
+                (scheduled if task.eta else reserved).append(_task_entry(task))
+
+        active_counts: dict[str, int] = {}
+        for entry in active:
+            active_counts[entry["worker"]] = active_counts.get(entry["worker"], 0) + 1
+        return {
+            "updated_at": self.clock(),
+            "workers": [
+                {
+                    "name": name,
+                    "status": "online",
+                    # Tasks started before this consumer only show up in heartbeats.
+                    "active_tasks": max(active_counts.get(name, 0), worker.active or 0),
+                    "processed": worker.processed,
+                }
+                for name, worker in sorted(workers.items())
+            ],
+            "active_tasks": active,
+            "reserved_tasks": reserved,
+            "scheduled_tasks": scheduled,
+        }
+
+    def publish(self) -> None:
+        self._published_at = self.clock()
+        expire = max(int(self.settings.celery_state_max_age_seconds * 2), 1)
+        try:
+            self.client.set(CELERY_STATE_REDIS_KEY, json.dumps(self.snapshot()), ex=expire)
+        except redis.RedisError:
+            CELERY_STATE_PUBLISHES.labels(outcome="error").inc()
+            logger.warning("celery_state_publish_failed")
+            return
+        CELERY_STATE_PUBLISHES.labels(outcome="ok").inc()
+
+    def run(self) -> None:
+        """Consume events until interrupted, reconnecting to the broker on failure."""
+        interval = self.settings.celery_state_publish_interval_seconds
+        while True:
+            try:
+                with self.app.connection_for_read() as connection:
+                    receiver = self.app.events.Receiver(connection, handlers={"*": self.on_event})
+                    # Ask already-running workers to start sending events, and for a
+                    # heartbeat so they are listed without waiting a full interval.
+                    self.app.control.enable_events()
+                    wakeup = True
+                    logger.info("celery_state_consuming")
+                    while True:
+                        try:
+                            receiver.capture(limit=None, timeout=interval, wakeup=wakeup)
+                        except TimeoutError:
+                            wakeup = False
+                            # No events (e.g. no workers): republish so workers age out.
+                            self.publish()
+            except Exception:
+                logger.exception("celery_state_connection_lost")
+                time.sleep(interval)
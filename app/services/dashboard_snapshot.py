@@ -0,0 +1,218 @@
+import asyncio
+import json
+import math
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any, get_args
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError, RedisError
+
+from app.core.config import Settings
+from app.core.dashboard_keys import DASHBOARD_LOCK_PREFIX, DASHBOARD_SNAPSHOT_PREFIX
+from app.core.logging import get_logger
+from app.db.session import get_session_factory
+from app.schemas.admin import DashboardStats
+from app.services.admin_dashboard import AdminDashboardService, DashboardComponent
+
+logger = get_logger(__name__)
+
+COMPONENTS: tuple[DashboardComponent, ...] = get_args(DashboardComponent)
+# Read from this process's Prometheus registry, so only API processes may compute it;
+# a Celery worker's registry has none of the request, cache or audit series.
+PROCESS_LOCAL_COMPONENTS: frozenset[DashboardComponent] = frozenset({"metrics"})
+
+DASHBOARD_SNAPSHOT_LOOKUPS = Counter(
+    "admin_dashboard_snapshot_lookups_total",
+    "Dashboard snapshot component reads by freshness",
+    ["component", "result"],
+)
+DASHBOARD_SNAPSHOT_REFRESHES = Counter(
+    "admin_dashboard_snapshot_refreshes_total",
+    "Dashboard snapshot components recomputed in the background",
+    ["component", "outcome"],
+)
+
+ServiceFactory = Callable[[], AbstractAsyncContextManager[AdminDashboardService]]
+
+# At most one background refresh per component in this process.
+_refreshing: dict[DashboardComponent, asyncio.Task[None]] = {}
+
+
+class DashboardSnapshot:
+    """Dashboard components cached in Redis with stale-while-revalidate.
+
+    A component is fresh for its own TTL. Past that, readers keep getting the stored
+    value for ``admin_dashboard_stale_seconds`` while whichever replica takes the
+    component's Redis lock recomputes it in the background. Only a missing component is
+    computed during the request, and concurrent readers wait on the same lock rather
+    than each computing it. ``refresh_expired`` does the same recomputation from the
+    beat schedule, so a dashboard nobody has read for a while still opens on fresh data;
+    it leaves ``metrics`` to the API processes that own those series.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        settings: Settings,
+        *,
+        background: ServiceFactory | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.redis = redis
+        self.settings = settings
+        self.background = background or (lambda: _background_service(redis, settings))
+        self.clock = clock
+
+    def ttl(self, component: DashboardComponent) -> float:
+        settings = self.settings
+        return {
+            "users": settings.admin_dashboard_users_ttl_seconds,
+            "services": settings.admin_dashboard_services_ttl_seconds,
+            "metrics": settings.admin_dashboard_metrics_ttl_seconds,
+            "system": settings.admin_dashboard_system_ttl_seconds,
+        }[component]
+
+    async def get_stats(self, service: AdminDashboardService) -> DashboardStats:
+        values = await self.load(service, COMPONENTS)
+        return DashboardStats(
+            **values["users"],
+            service_status=values["services"],
+            metrics_summary=values["metrics"],
+            system=values["system"],
+        )
+
+    async def get_metrics_summary(self, service: AdminDashboardService) -> dict[str, float]:
+        values = await self.load(service, ("metrics",))
+        return dict(values["metrics"])
+
+    async def load(
+        self, service: AdminDashboardService, components: Sequence[DashboardComponent]
+    ) -> dict[DashboardComponent, Any]:
+        """Stored values for ``components``; ``service`` computes only the missing ones."""
+        if not self.settings.admin_dashboard_cache_enabled:
+            return {component: await service.compute(component) for component in components}
+        try:
+            entries = await self.redis.mget([self._key(component) for component in components])
+        except RedisError:
+            logger.warning("dashboard_snapshot_read_failed")
+            return {component: await service.compute(component) for component in components}
+
+        values: dict[DashboardComponent, Any] = {}
+        now = self.clock()
+        for component, entry in zip(components, entries, strict=True):
+            if entry is None:
+                DASHBOARD_SNAPSHOT_LOOKUPS.labels(component=component, result="miss").inc()
+                values[component] = await self._fill(service, component)
+                continue
+            stored = json.loads(entry)
+            if now - stored["computed_at"] < self.ttl(component):
+                DASHBOARD_SNAPSHOT_LOOKUPS.labels(component=component, result="fresh").inc()
+            else:
+                DASHBOARD_SNAPSHOT_LOOKUPS.labels(component=component, result="stale").inc()
+                self._revalidate(component)
+            values[component] = stored["value"]
+        return values
+
+    async def refresh_expired(self) -> list[DashboardComponent]:
+        """Recompute every missing or expired shared component; returns the ones attempted."""
+        if not self.settings.admin_dashboard_cache_enabled:
+            return []
+        shared = [c for c in COMPONENTS if c not in PROCESS_LOCAL_COMPONENTS]
+        entries = await self.redis.mget([self._key(component) for component in shared])
+        now = self.clock()
+        expired = [
+            component
+            for component, entry in zip(shared, entries, strict=True)
+            if entry is None or now - json.loads(entry)["computed_at"] >= self.ttl(component)
+        ]
+        for component in expired:
+            await self._refresh(component)
+        return expired
+
+    async def invalidate(self) -> None:
+        await self.redis.delete(*(self._key(component) for component in COMPONENTS))
+
+    async def _fill(self, service: AdminDashboardService, component: DashboardComponent) -> Any:
+        lock = self._lock(component)
+        try:
+            acquired = await lock.acquire(
+                blocking_timeout=self.settings.admin_dashboard_lock_seconds
+            )
+        except RedisError:
+            return await service.compute(component)
+        try:
+            if acquired:
+                # The previous holder has usually just stored it.
+                entry = await self.redis.get(self._key(component))
+                if entry is not None:
+                    return json.loads(entry)["value"]
+            return await self._compute_and_store(service, component)
+        finally:
+            if acquired:
+                await _release(lock)
+
+    def _revalidate(self, component: DashboardComponent) -> None:
+        running = _refreshing.get(component)
+        if running is None or running.done():
+            _refreshing[component] = asyncio.create_task(
+                self._refresh(component), name=f"dashboard-refresh-{component}"
+            )
+
+    async def _refresh(self, component: DashboardComponent) -> None:
+        lock = self._lock(component)
+        try:
+            if not await lock.acquire(blocking=False):
+                # Another replica is already recomputing it.
+                return
+            try:
+                async with self.background() as service:
+                    await self._compute_and_store(service, component)
+            finally:
+                await _release(lock)
+        except Exception:
+            logger.exception("dashboard_snapshot_refresh_failed", component=component)
+            DASHBOARD_SNAPSHOT_REFRESHES.labels(component=component, outcome="error").inc()
+            return
+        DASHBOARD_SNAPSHOT_REFRESHES.labels(component=component, outcome="ok").inc()
+
+    async def _compute_and_store(
+        self, service: AdminDashboardService, component: DashboardComponent
+    ) -> Any:
+        value = await service.compute(component)
+        entry = json.dumps({"value": value, "computed_at": self.clock()})
+        expire = math.ceil(self.ttl(component)) + self.settings.admin_dashboard_stale_seconds
+        try:
+            await self.redis.set(self._key(component), entry, ex=max(expire, 1))
+        except RedisError:
+            logger.warning("dashboard_snapshot_write_failed", component=component)
+        return value
+
+    def _key(self, component: DashboardComponent) -> str:
+        return f"{DASHBOARD_SNAPSHOT_PREFIX}{component}"
+
+    def _lock(self, component: DashboardComponent) -> Lock:
+        return self.redis.lock(
+            f"{DASHBOARD_LOCK_PREFIX}{component}",
+            timeout=self.settings.admin_dashboard_lock_seconds,
+        )
+
+
+async def _release(lock: Lock) -> None:
+    try:
+        await lock.release()
+    except (LockError, RedisError):
+        # Expired mid-computation; the next holder simply recomputes.
+        pass
+
+
+@asynccontextmanager
+async def _background_service(
+    redis: Redis, settings: Settings
+) -> AsyncIterator[AdminDashboardService]:
+    # Runs after the triggering request has returned, so it needs its own session.
+    async with get_session_factory(settings)() as session:
+        yield AdminDashboardService(session, redis, settings)
@@ -0,0 +1,326 @@
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from fastapi import status
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Settings
+from app.core.exceptions import AppException
+from app.core.export_keys import EXPORT_DEDUPE_PREFIX, EXPORT_JOB_PREFIX
+from app.core.logging import get_logger
+from app.repositories.audit_log import AuditLogRepository
+from app.repositories.counting import RowCounter
+from app.services.admin_audit import AdminAuditService
+from app.services.audit_export import EXPORT_FORMATS, ExportFormat, check_export_format
+from app.services.export_storage import ExportStorage
+
+logger = get_logger(__name__)
+
+STALE_JOB_ERROR = "Export worker stopped reporting progress"
+
+ExportJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+EXPORT_JOBS = Counter(
+    "admin_export_jobs_total",
+    "Background audit export jobs by outcome",
+    ["outcome"],
+)
+
+
+def normalize_filters(filters: dict[str, object]) -> dict[str, str]:
+    """Drop unset filters and render the rest as strings, the form jobs are keyed by."""
+    normalized: dict[str, str] = {}
+    for key, value in sorted(filters.items()):
+        if value is None or value == "":
+            continue
+        normalized[key] = value.isoformat() if isinstance(value, datetime) else str(value)
+    return normalized
+
+
+def dedupe_key(fmt: ExportFormat, gzip: bool, filters: dict[str, str]) -> str:
+    raw = json.dumps({"format": fmt, "gzip": gzip, "filters": filters}, sort_keys=True)
+    return f"{EXPORT_DEDUPE_PREFIX}{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+class _JobTakenOver(Exception):
+    """Another run claimed the job after this one's heartbeat went stale."""
+
+
+def _job_not_found() -> AppException:
+    return AppException("Export job not found", code=40402, status_code=status.HTTP_404_NOT_FOUND)
+
+
+@dataclass
+class ExportJob:
+    id: str
+    format: ExportFormat
+    gzip: bool
+    filters: dict[str, str]
+    status: ExportJobStatus = "queued"
+    rows: int = 0
+    bytes: int = 0
+    total_estimate: int | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+    error: str | None = None
+    owner: str | None = None  # token of the run currently writing the artifact
+
+    @property
+    def filename(self) -> str:
+        name = f"audit-logs.{EXPORT_FORMATS[self.format].extension}"
+        return name + ".gz" if self.gzip else name
+
+    @property
+    def artifact_key(self) -> str:
+        return f"{self.id}-{self.filename}"
+
+    @property
+    def media_type(self) -> str:
+        return "application/gzip" if self.gzip else EXPORT_FORMATS[self.format].media_type
+
+    @property
+    def progress(self) -> float | None:
+        if self.status == "succeeded":
+            return 1.0
+        if not self.total_estimate:
+            return None
+        # The total is a planner estimate; never report done before the worker is.
+        return min(self.rows / self.total_estimate, 0.99)
+
+    def is_stale(self, stale_seconds: float, now: datetime | None = None) -> bool:
+        """A running job whose worker has not saved progress for ``stale_seconds``."""
+        if self.status != "running":
+            return False
+        age = (now or datetime.now(UTC)) - self.updated_at
+        return age.total_seconds() > stale_seconds
+
+    def filter_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = dict(self.filters)
+        if "actor_id" in kwargs:
+            kwargs["actor_id"] = uuid.UUID(kwargs["actor_id"])
+        for key in ("since", "until"):
+            if key in kwargs:
+                kwargs[key] = datetime.fromisoformat(kwargs[key])
+        return kwargs
+
+    def to_mapping(self) -> dict[str, str]:
+        return {
+            "id": self.id,
+            "format": self.format,
+            "gzip": "1" if self.gzip else "0",
+            "filters": json.dumps(self.filters, sort_keys=True),
+            "status": self.status,
+            "rows": str(self.rows),
+            "bytes": str(self.bytes),
+            "total_estimate": "" if self.total_estimate is None else str(self.total_estimate),
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else "",
+            "error": self.error or "",
+            "owner": self.owner or "",
+        }
+
+    @classmethod
+    def from_mapping(cls, data: dict[Any, Any]) -> "ExportJob":
+        return cls(
+            id=data["id"],
+            format=data["format"],
+            gzip=data["gzip"] == "1",
+            filters=json.loads(data["filters"]),
+            status=data["status"],
+            rows=int(data["rows"]),
+            bytes=int(data["bytes"]),
+            total_estimate=int(data["total_estimate"]) if data["total_estimate"] else None,
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data.get("updated_at") or data["created_at"]),
+            finished_at=(
+                datetime.fromisoformat(data["finished_at"]) if data["finished_at"] else None
+            ),
+            error=data["error"] or None,
+            owner=data.get("owner") or None,
+        )
+
+
+class ExportJobService:
+    """Background audit exports: job state in Redis hashes, artifacts in ``ExportStorage``.
+
+    Identical format and filter sets map to one job for ``admin_export_dedupe_seconds``,
+    so repeated requests reuse a running or finished export instead of starting another.
+    Every save is a heartbeat: a running job left without one for
+    ``admin_export_stale_seconds`` (its worker died) reads as failed, is never reused,
+    and a later ``run`` of the same job takes it over. Each run claims the job with an
+    owner token and checks it before every save and before the artifact is put in
+    place, so a slow run that was taken over stops instead of racing its successor.
+    """
+
+    def __init__(self, redis: Redis, settings: Settings) -> None:
+        self.redis = redis
+        self.settings = settings
+
+    async def create(
+        self, *, fmt: ExportFormat, gzip: bool, filters: dict[str, object]
+    ) -> tuple[ExportJob, bool]:
+        """Return ``(job, reused)``; only a new job needs enqueuing."""
+        check_export_format(fmt, gzip)
+        job = ExportJob(
+            id=uuid.uuid4().hex, format=fmt, gzip=gzip, filters=normalize_filters(filters)
+        )
+        dedupe_seconds = self.settings.admin_export_dedupe_seconds
+        if dedupe_seconds <= 0:
+            await self._save(job)
+            EXPORT_JOBS.labels(outcome="created").inc()
+            return job, False
+
+        key = dedupe_key(fmt, gzip, job.filters)
+        existing = await self._reusable(await self.redis.get(key))
+        if existing is not None:
+            EXPORT_JOBS.labels(outcome="reused").inc()
+            return existing, True
+
+        await self._save(job)
+        if not await self.redis.set(key, job.id, nx=True, ex=dedupe_seconds):
+            # Lost a race with an identical request; prefer its job if it is usable.
+            existing = await self._reusable(await self.redis.get(key))
+            if existing is not None:
+                await self.redis.delete(f"{EXPORT_JOB_PREFIX}{job.id}")
+                EXPORT_JOBS.labels(outcome="reused").inc()
+                return existing, True
+            await self.redis.set(key, job.id, ex=dedupe_seconds)
+        EXPORT_JOBS.labels(outcome="created").inc()
+        return job, False
+
+    async def get(self, job_id: str) -> ExportJob | None:
+        job = await self._load(job_id)
+        if job is not None and job.is_stale(self.settings.admin_export_stale_seconds):
+            job.status = "failed"
+            job.error = STALE_JOB_ERROR
+        return job
+
+    async def require(self, job_id: str) -> ExportJob:
+        job = await self.get(job_id)
+        if job is None:
+            raise _job_not_found()
+        return job
+
+    async def run(self, job_id: str, *, session: AsyncSession, storage: ExportStorage) -> ExportJob:
+        """Write the artifact for a queued job, recording progress as it goes."""
+        job = await self._load(job_id)
+        if job is None:
+            raise _job_not_found()
+        if job.is_stale(self.settings.admin_export_stale_seconds):
+            logger.warning("export_job_taken_over", job_id=job.id, rows=job.rows)
+            EXPORT_JOBS.labels(outcome="taken_over").inc()
+            job.rows = job.bytes = 0
+        elif job.status != "queued":
+            # Redelivered task; the first delivery owns the job while it keeps reporting.
+            return job
+        job.status = "running"
+        job.owner = uuid.uuid4().hex
+        await self._save(job)
+
+        rows = 0
+
+        def on_rows(count: int) -> None:
+            nonlocal rows
+            rows = count
+
+        interval = self.settings.admin_export_progress_interval_seconds
+        filters = job.filter_kwargs()
+        try:
+            estimate = await AuditLogRepository(session).count_matching(
+                RowCounter(session, strategy="estimate"), **filters
+            )
+            max_rows = self.settings.admin_audit_export_max_rows
+            job.total_estimate = (
+                estimate.value if max_rows is None else min(estimate.value, max_rows)
+            )
+            await self._save_owned(job)
+            stream = AdminAuditService(session, self.settings).export(
+                fmt=job.format, gzip=job.gzip, on_rows=on_rows, **filters
+            )
+
+            async def tracked() -> AsyncIterator[bytes]:
+                reported = time.monotonic()
+                async for chunk in stream:
+                    yield chunk
+                    job.bytes += len(chunk)
+                    if time.monotonic() - reported >= interval:
+                        job.rows = rows
+                        await self._save_owned(job)
+                        reported = time.monotonic()
+                # The storage renames the finished file into place once this returns.
+                if not await self._owns(job):
+                    raise _JobTakenOver(job.id)
+
+            job.bytes = await storage.write(job.artifact_key, tracked())
+        except _JobTakenOver:
+            return await self._superseded(job)
+        except Exception as exc:
+            logger.exception("export_job_failed", job_id=job.id)
+            if not await self._owns(job):
+                return await self._superseded(job)
+            job.status = "failed"
+            job.error = str(exc)[:500] or type(exc).__name__
+            job.finished_at = datetime.now(UTC)
+            await self._save(job)
+            await self._release_dedupe(job)
+            EXPORT_JOBS.labels(outcome="failed").inc()
+            return job
+
+        job.rows = rows
+        job.status = "succeeded"
+        job.finished_at = datetime.now(UTC)
+        try:
+            await self._save_owned(job)
+        except _JobTakenOver:
+            return await self._superseded(job)
+        EXPORT_JOBS.labels(outcome="succeeded").inc()
+        logger.info("export_job_succeeded", job_id=job.id, rows=job.rows, bytes=job.bytes)
+        return job
+
+    async def _load(self, job_id: str) -> ExportJob | None:
+        data = await self.redis.hgetall(f"{EXPORT_JOB_PREFIX}{job_id}")
+        return ExportJob.from_mapping(data) if data else None
+
+    async def _owns(self, job: ExportJob) -> bool:
+        owner = await self.redis.hget(f"{EXPORT_JOB_PREFIX}{job.id}", "owner")
+        return owner == job.owner
+
+    async def _save_owned(self, job: ExportJob) -> None:
+        if not await self._owns(job):
+            raise _JobTakenOver(job.id)
+        await self._save(job)
+
+    async def _superseded(self, job: ExportJob) -> ExportJob:
+        logger.warning("export_job_superseded", job_id=job.id)
+        EXPORT_JOBS.labels(outcome="superseded").inc()
+        return await self.require(job.id)
+
+    async def _reusable(self, job_id: str | bytes | None) -> ExportJob | None:
+        if not job_id:
+            return None
+        job = await self.get(job_id.decode() if isinstance(job_id, bytes) else job_id)
+        return job if job is not None and job.status != "failed" else None
+
+    async def _release_dedupe(self, job: ExportJob) -> None:
+        key = dedupe_key(job.format, job.gzip, job.filters)
+        if await self.redis.get(key) == job.id:
+            await self.redis.delete(key)
+
+    async def _save(self, job: ExportJob) -> None:
+        key = f"{EXPORT_JOB_PREFIX}{job.id}"
+        job.updated_at = datetime.now(UTC)
+        mapping: dict[Any, Any] = job.to_mapping()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self.settings.admin_export_job_ttl_seconds)
+            await pipe.execute()
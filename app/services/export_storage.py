@@ -0,0 +1,147 @@
+import asyncio
+import os
+import re
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from pathlib import Path
+from typing import Protocol
+
+from app.core.config import ExportStorageBackend, Settings
+
+_KEY_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class ExportStorage(Protocol):
+    """Where background export artifacts live. Keys are flat file names."""
+
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> int:
+        """Store ``chunks`` under ``key`` and return the size; readers never see a partial file."""
+        ...
+
+    async def size(self, key: str) -> int | None: ...
+
+    def read(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        """Yield bytes ``start`` through ``end`` inclusive."""
+        ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def purge_older_than(self, seconds: int) -> int: ...
+
+
+class LocalExportStorage:
+    """Artifacts as files in one directory, each written to its own ``.part`` file and renamed."""
+
+    def __init__(self, root: str | Path, *, chunk_bytes: int = 64 * 1024) -> None:
+        self.root = Path(root)
+        self.chunk_bytes = chunk_bytes
+
+    def _path(self, key: str) -> Path:
+        if not _KEY_PATTERN.match(key):
+            raise ValueError(f"invalid export storage key: {key!r}")
+        return self.root / key
+
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> int:
+        path = self._path(key)
+        # Per write, so a writer that lost its job never shares a file with its successor.
+        partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.part")
+        await asyncio.to_thread(self.root.mkdir, parents=True, exist_ok=True)
+        handle = await asyncio.to_thread(partial.open, "wb")
+        size = 0
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(handle.write, chunk)
+                size += len(chunk)
+            await asyncio.to_thread(handle.flush)
+            await asyncio.to_thread(os.fsync, handle.fileno())
+        except BaseException:
+            handle.close()
+            partial.unlink(missing_ok=True)
+            raise
+        handle.close()
+        await asyncio.to_thread(os.replace, partial, path)
+        return size
+
+    async def size(self, key: str) -> int | None:
+        try:
+            return (await asyncio.to_thread(self._path(key).stat)).st_size
+        except FileNotFoundError:
+            return None
+
+    async def read(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        handle = await asyncio.to_thread(self._path(key).open, "rb")
+        try:
+            await asyncio.to_thread(handle.seek, start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await asyncio.to_thread(handle.read, min(self.chunk_bytes, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            handle.close()
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    async def purge_older_than(self, seconds: int) -> int:
+        def purge() -> int:
+            if not self.root.is_dir():
+                return 0
+            cutoff = time.time() - seconds
+            removed = 0
+            for path in self.root.iterdir():
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+            return removed
+
+        return await asyncio.to_thread(purge)
+
+
+_BACKENDS: dict[ExportStorageBackend, Callable[[Settings], ExportStorage]] = {
+    "local": lambda settings: LocalExportStorage(
+        settings.admin_export_storage_dir,
+        chunk_bytes=settings.admin_audit_export_chunk_bytes,
+    ),
+}
+
+
+def get_export_storage(settings: Settings) -> ExportStorage:
+    return _BACKENDS[settings.admin_export_storage_backend](settings)
+
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+
+def parse_byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Resolve a single ``Range: bytes=`` spec to inclusive offsets.
+
+    Returns ``None`` when the whole body should be sent: no header, a malformed spec,
+    a unit other than bytes, or a multi-range request (servers may answer those with
+    the full body).
+    """
+    if not header:
+        return None
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the final N bytes.
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, min(int(last), size - 1) if last else size - 1
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from prometheus_client import Counter, Histogram
+from redis.asyncio import Redis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.celery_keys import BEAT_HEARTBEAT_REDIS_KEY
+from app.core.config import Settings
+from app.core.logging import get_logger
+from app.db.session import get_engine
+from app.services.admin_celery import AdminCeleryService
+from app.services.migration_status import get_migration_status
+
+logger = get_logger(__name__)
+
+ProbeName = Literal["database", "redis", "beat", "migration", "celery"]
+
+HEALTH_PROBE_SECONDS = Histogram(
+    "health_probe_duration_seconds",
+    "Time taken by one health probe",
+    ["probe"],
+)
+HEALTH_PROBE_FAILURES = Counter(
+    "health_probe_failures_total",
+    "Health probes that errored or timed out",
+    ["probe", "reason"],
+)
+
+
+@dataclass(frozen=True)
+class MigrationStatus:
+    at_head: bool
+    current: str | None
+    head: str | None
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """One round of probe results. Fields of probes that were not run keep their defaults."""
+
+    database: str = "unknown"
+    redis: str = "unknown"
+    beat: str = "unknown"
+    beat_last_seen: datetime | None = None
+    migration: MigrationStatus | None = None
+    worker_count: int | None = None
+
+    @property
+    def database_ok(self) -> bool:
+        return self.database == "ok"
+
+    @property
+    def redis_ok(self) -> bool:
+        return self.redis == "ok"
+
+    @property
+    def beat_ok(self) -> bool:
+        return self.beat == "ok"
+
+
+class HealthProbes:
+    """Runs health probes concurrently, each at most once per instance.
+
+    Make one per request or check (``get_health_probes`` does this for routes) so every
+    consumer in it shares the same results. Each probe has its own timeout; a probe that
+    fails or times out reports ``error`` (``unknown`` for beat) rather than raising.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: Redis,
+        settings: Settings,
+        engine: AsyncEngine | None = None,
+    ) -> None:
+        self.session = session
+        self.redis = redis
+        self.settings = settings
+        self.engine = engine
+        self._results: dict[ProbeName, asyncio.Task[Any]] = {}
+        # Migration probes can share the session with a caller; it allows one query at a time.
+        self._session_lock = asyncio.Lock()
+
+    async def snapshot(self, *probes: ProbeName) -> HealthSnapshot:
+        for probe in probes:
+            if probe not in self._results:
+                self._results[probe] = asyncio.create_task(self._run(probe))
+        await asyncio.gather(*(self._results[probe] for probe in probes))
+
+        fields: dict[str, Any] = {}
+        for probe, task in self._results.items():
+            if not task.done():
+                continue
+            result = task.result()
+            if probe == "beat":
+                fields["beat"], fields["beat_last_seen"] = result
+            elif probe == "celery":
+                fields["worker_count"] = result
+            else:
+                fields[probe] = result
+        return HealthSnapshot(**fields)
+
+    async def _run(self, probe: ProbeName) -> Any:
+        checks: dict[ProbeName, tuple[Callable[[], Awaitable[Any]], Any]] = {
+            "database": (self._database, "error"),
+            "redis": (self._redis, "error"),
+            "beat": (self._beat, ("unknown", None)),
+            "migration": (self._migration, None),
+            "celery": (self._celery, 0),
+        }
+        check, failed = checks[probe]
+        timeout = (
+            self.settings.celery_inspect_overall_timeout
+            if probe == "celery"
+            else self.settings.health_probe_timeout_seconds
+        )
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(check(), timeout)
+        except TimeoutError:
+            HEALTH_PROBE_FAILURES.labels(probe=probe, reason="timeout").inc()
+            logger.warning("health_probe_timed_out", probe=probe, timeout=timeout)
+            return failed
+        except Exception:
+            HEALTH_PROBE_FAILURES.labels(probe=probe, reason="error").inc()
+            return failed
+        finally:
+            HEALTH_PROBE_SECONDS.labels(probe=probe).observe(time.perf_counter() - started)
+
+    async def _database(self) -> str:
+        # A timeout cancels the query mid-flight, so keep it off the caller's session.
+        engine = self.engine or get_engine(self.settings)
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return "ok"
+
+    async def _redis(self) -> str:
+        return "ok" if await self.redis.ping() is True else "error"
+
+    async def _beat(self) -> tuple[str, datetime | None]:
+        try:
+            raw = await self.redis.get(BEAT_HEARTBEAT_REDIS_KEY)
+        except Exception:
+            return "unknown", None
+
+        if not raw:
+            return "unknown", None
+
+        text_value = raw.decode() if isinstance(raw, bytes) else str(raw)
+        try:
+            last_seen = datetime.fromisoformat(text_value)
+            if last_seen.tzinfo is None:
+                last_seen = last_seen.replace(tzinfo=UTC)
+        except ValueError:
+            return "unknown", None
+
+        age_seconds = (datetime.now(UTC) - last_seen).total_seconds()
+        max_age = self.settings.celery_beat_heartbeat_interval_seconds * 2
+        if age_seconds <= max_age:
+            return "ok", last_seen
+        return "stale", last_seen
+
+    async def _migration(self) -> MigrationStatus:
+        async with self._session_lock:
+            at_head, current, head = await get_migration_status(
+                self.session, max_age=self.settings.migration_status_cache_seconds
+            )
+        return MigrationStatus(at_head=at_head, current=current, head=head)
+
+    async def _celery(self) -> int:
+        overview = await AdminCeleryService(self.settings, self.redis).get_overview(
+            include_metrics=False
+        )
+        return len(overview.workers)
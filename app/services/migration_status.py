@@ -1,24 +1,71 @@
+import os
+import time
 from pathlib import Path
 
 from alembic.config import Config
 from alembic.script import ScriptDirectory
+from prometheus_client import Gauge
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+_ROOT = Path(__file__).resolve().parents[2]
+_VERSIONS_DIR = _ROOT / "alembic" / "versions"
 
-def _alembic_head_revision() -> str | None:
-    root = Path(__file__).resolve().parents[2]
-    config = Config(str(root / "alembic.ini"))
-    script = ScriptDirectory.from_config(config)
-    return script.get_current_head()
+MIGRATION_AT_HEAD = Gauge(
+    "db_migration_at_head",
+    "1 when the database is at the Alembic head revision, 0 when it is not",
+)
 
+# (versions mtime, head) and (monotonic read time, alembic_version) for this process.
+_head: tuple[float, str | None] | None = None
+_current: tuple[float, str | None] | None = None
 
-async def get_migration_status(session: AsyncSession) -> tuple[bool, str | None, str | None]:
-    head = _alembic_head_revision()
+
+def _versions_mtime() -> float:
     try:
-        result = await session.execute(text("SELECT version_num FROM alembic_version"))
-        current = result.scalar_one_or_none()
-    except Exception:
-        return False, None, head
+        mtimes = [_VERSIONS_DIR.stat().st_mtime]
+        mtimes.extend(
+            entry.stat().st_mtime
+            for entry in os.scandir(_VERSIONS_DIR)
+            if entry.name.endswith(".py")
+        )
+    except FileNotFoundError:
+        return 0.0
+    return max(mtimes)
+
+
+def alembic_head_revision() -> str | None:
+    """Head of the migration scripts; they are only re-parsed after one of them changes."""
+    global _head
+    mtime = _versions_mtime()
+    if _head is None or _head[0] != mtime:
+        config = Config(str(_ROOT / "alembic.ini"))
+        script = ScriptDirectory.from_config(config)
+        _head = (mtime, script.get_current_head())
+    return _head[1]
+
+
+def reset_migration_status_cache() -> None:
+    global _current
+    _current = None
+
+
+async def get_migration_status(
+    session: AsyncSession, *, max_age: float = 0
+) -> tuple[bool, str | None, str | None]:
+    """``(at_head, current, head)``, reusing an ``alembic_version`` read up to ``max_age`` old."""
+    global _current
+    head = alembic_head_revision()
+    now = time.monotonic()
+    if _current is not None and now - _current[0] < max_age:
+        current = _current[1]
+    else:
+        try:
+            result = await session.execute(text("SELECT version_num FROM alembic_version"))
+            current = result.scalar_one_or_none()
+        except Exception:
+            return False, None, head
+        _current = (now, current)
     at_head = current is not None and head is not None and current == head
+    MIGRATION_AT_HEAD.set(1 if at_head else 0)
     return at_head, current, head
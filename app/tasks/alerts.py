@@ -0,0 +1,61 @@
+from typing import Any
+
+from celery import Task
+
+from app.core.logging import get_logger
+from app.tasks.celery_app import celery_app
+from app.tasks.runtime import run_async
+
+logger = get_logger(__name__)
+
+
+@celery_app.task(  # type: ignore[untyped-decorator]
+    name="app.tasks.alerts.deliver_alert",
+    bind=True,
+    acks_late=True,
+    max_retries=None,
+)
+def deliver_alert(
+    self: Task,
+    dispatch_id: str,
+    destination: str,
+    event_type: str,
+    payload: dict[str, Any],
+) -> dict[str, str]:
+    """Deliver one alert to one destination, retrying with backoff until it lands or dead-letters.
+
+    Retries are counted by ``AlertDispatcher`` against ``alert_delivery_max_attempts``;
+    ``max_retries=None`` only stops Celery from giving up first.
+    """
+    from app.cache.redis import get_redis_client
+    from app.core.config import get_settings
+    from app.db.session import get_session_factory
+    from app.services.alert_dispatch import AlertDispatcher, backoff_seconds
+
+    settings = get_settings()
+    attempt = self.request.retries + 1
+
+    async def _run() -> str:
+        async with get_session_factory(settings)() as session:
+            outcome = await AlertDispatcher(session, get_redis_client(), settings).deliver(
+                dispatch_id=dispatch_id,
+                destination_key=destination,
+                event_type=event_type,
+                payload=payload,
+                attempt=attempt,
+            )
+            await session.commit()
+            return outcome
+
+    outcome = run_async(_run())
+    if outcome == "retry":
+        countdown = backoff_seconds(attempt, settings)
+        logger.info(
+            "alert_delivery_retry_scheduled",
+            dispatch_id=dispatch_id,
+            destination=destination,
+            attempt=attempt,
+            countdown=round(countdown, 1),
+        )
+        raise self.retry(countdown=countdown)
+    return {"status": outcome}
@@ -4,10 +4,11 @@ from celery.signals import beat_init, worker_process_init
 
 from app.core.config import Settings, get_settings
 from app.core.logging import setup_logging
+from app.tasks import instrumentation, runtime  # noqa: F401  (connect their worker signals)
 
 
 def _beat_schedule(settings: Settings) -> dict[str, dict[str, object]]:
-    return {
+    schedule: dict[str, dict[str, object]] = {
         "heartbeat": {
             "task": "app.tasks.scheduled.heartbeat",
             "schedule": settings.celery_beat_heartbeat_interval_seconds,
@@ -25,6 +26,12 @@ def _beat_schedule(settings: Settings) -> dict[str, dict[str, object]]:
             "schedule": settings.alert_check_interval_seconds,
         },
     }
+    if settings.admin_dashboard_refresh_interval_seconds:
+        schedule["dashboard-snapshot-refresh"] = {
+            "task": "app.tasks.scheduled.refresh_dashboard_snapshot",
+            "schedule": settings.admin_dashboard_refresh_interval_seconds,
+        }
+    return schedule
 
 
 @worker_process_init.connect
@@ -43,7 +50,7 @@ celery_app = Celery(
     "fastapi_kit",
     broker=str(settings.redis_url),
     backend=str(settings.redis_url),
-    include=["app.tasks.example", "app.tasks.scheduled"],
+    include=["app.tasks.alerts", "app.tasks.example", "app.tasks.exports", "app.tasks.scheduled"],
 )
 
 celery_app.conf.update(
@@ -53,6 +60,7 @@ celery_app.conf.update(
     timezone=settings.celery_timezone,
     enable_utc=True,
     task_track_started=True,
+    worker_send_task_events=True,
     beat_schedule=_beat_schedule(settings),
     beat_schedule_filename=settings.celery_beat_schedule_file,
 )
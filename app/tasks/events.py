@@ -0,0 +1,25 @@
+"""Celery event consumer that feeds the admin Celery overview.
+
+Run exactly one: ``python -m app.tasks.events``.
+"""
+
+import redis
+
+from app.core.config import get_settings
+from app.core.logging import setup_logging
+from app.services.celery_state import CeleryStateAggregator
+from app.tasks.celery_app import celery_app
+
+
+def main() -> None:
+    settings = get_settings()
+    setup_logging(settings)
+    with redis.from_url(str(settings.redis_url)) as client:
+        try:
+            CeleryStateAggregator(celery_app, client, settings).run()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from app.core.logging import get_logger
+from app.tasks.celery_app import celery_app
+from app.tasks.runtime import run_async
+
+logger = get_logger(__name__)
+
+
+@celery_app.task(  # type: ignore[untyped-decorator]
+    name="app.tasks.exports.run_audit_export",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def run_audit_export(job_id: str) -> dict[str, str]:
+    """Run one export job.
+
+    Acknowledged only once it returns, so the broker redelivers the job after a worker
+    dies mid-export; the redelivery takes over once the job's heartbeat goes stale.
+    """
+    from app.cache.redis import get_redis_client
+    from app.core.config import get_settings
+    from app.db.session import get_replica_session_factory, get_session_factory
+    from app.services.export_jobs import ExportJobService
+    from app.services.export_storage import get_export_storage
+
+    async def _run() -> str:
+        settings = get_settings()
+        # Exports tolerate replica lag, so prefer the replica when one is configured.
+        factory = get_replica_session_factory(settings) or get_session_factory(settings)
+        async with factory() as session:
+            job = await ExportJobService(get_redis_client(), settings).run(
+                job_id, session=session, storage=get_export_storage(settings)
+            )
+            await session.rollback()
+        return job.status
+
+    status = run_async(_run())
+    logger.info("export_job_finished", job_id=job_id, status=status)
+    return {"status": status}
@@ -0,0 +1,87 @@
+"""Queue wait and runtime of every task, aggregated in Redis across worker processes.
+
+``before_task_publish`` stamps the enqueue time on the message; the worker adds each
+task's timings to a per-task-name histogram hash in one pipeline after it runs. The API
+exports them (``app.services.celery_metrics``) since prefork children cannot be scraped.
+"""
+
+import os
+import time
+from typing import Any
+
+import redis
+from celery.signals import before_task_publish, task_postrun, task_prerun
+
+from app.core.celery_keys import CELERY_TASK_METRICS_NAMES_KEY, CELERY_TASK_METRICS_PREFIX
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+TASK_TIMING_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+# task id -> (perf_counter at prerun, queue wait); prerun and postrun run in one process.
+_started: dict[str, tuple[float, float | None]] = {}
+_client: tuple[int, redis.Redis] | None = None
+
+
+def bucket_label(seconds: float) -> str:
+    for bound in TASK_TIMING_BUCKETS:
+        if seconds <= bound:
+            return str(bound)
+    return "+Inf"
+
+
+def _redis() -> redis.Redis:
+    # One client per process; a client inherited across fork is not reused.
+    global _client
+    if _client is None or _client[0] != os.getpid():
+        client = redis.from_url(str(get_settings().redis_url), socket_timeout=1.0)
+        _client = (os.getpid(), client)
+    return _client[1]
+
+
+def record_task_timing(
+    client: redis.Redis, name: str, *, wait: float | None, runtime: float
+) -> None:
+    key = f"{CELERY_TASK_METRICS_PREFIX}{name}"
+    pipe = client.pipeline(transaction=False)
+    pipe.sadd(CELERY_TASK_METRICS_NAMES_KEY, name)
+    for kind, seconds in (("wait", wait), ("runtime", runtime)):
+        if seconds is None:
+            continue
+        pipe.hincrby(key, f"{kind}_le_{bucket_label(seconds)}", 1)
+        pipe.hincrby(key, f"{kind}_count", 1)
+        pipe.hincrbyfloat(key, f"{kind}_sum", seconds)
+    pipe.execute()
+
+
+@before_task_publish.connect  # type: ignore[untyped-decorator]
+def stamp_enqueued_at(headers: dict[str, Any] | None = None, **_kwargs: object) -> None:
+    if headers is not None:
+        headers[ENQUEUED_AT_HEADER] = time.time()
+
+
+@task_prerun.connect  # type: ignore[untyped-decorator]
+def start_task_timer(task_id: str, task: Any, **_kwargs: object) -> None:
+    if not get_settings().celery_task_metrics_enabled:
+        return
+    wait = None
+    enqueued_at = getattr(task.request, ENQUEUED_AT_HEADER, None)
+    # Time spent waiting for an ETA or countdown is not queueing delay.
+    if isinstance(enqueued_at, (int, float)) and not task.request.eta:
+        wait = max(time.time() - enqueued_at, 0.0)
+    _started[task_id] = (time.perf_counter(), wait)
+
+
+@task_postrun.connect  # type: ignore[untyped-decorator]
+def record_task_timer(task_id: str, task: Any, **_kwargs: object) -> None:
+    started = _started.pop(task_id, None)
+    if started is None:
+        return
+    began, wait = started
+    try:
+        record_task_timing(_redis(), task.name, wait=wait, runtime=time.perf_counter() - began)
+    except redis.RedisError:
+        logger.warning("celery_task_timing_write_failed", task=task.name)
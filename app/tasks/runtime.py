@@ -0,0 +1,95 @@
+"""One event loop per worker process for async task bodies.
+
+The SQLAlchemy engine, the Redis pool and the HTTP clients are bound to the loop that
+created them, so ``asyncio.run`` per task forces fresh pools and connections every time.
+A prefork child instead keeps one loop (with its pools) from
+``worker_process_init`` until it exits, and ``run_async`` runs every task body on it.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.cache.redis import close_redis_pool, init_redis_pool
+from app.core.config import Settings, get_settings
+from app.core.http_client import close_http_clients, start_http_clients
+from app.core.logging import get_logger
+from app.db.session import dispose_engine
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def _open(settings: Settings) -> None:
+    await init_redis_pool(settings)
+    start_http_clients(settings)
+
+
+async def _close() -> None:
+    await close_http_clients()
+    await close_redis_pool()
+    await dispose_engine()
+
+
+def start_worker_runtime(settings: Settings | None = None) -> None:
+    global _loop
+    if _loop is not None:
+        return
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(_open(settings or get_settings()))
+    _loop = loop
+
+
+def close_worker_runtime() -> None:
+    global _loop
+    if _loop is None:
+        return
+    loop, _loop = _loop, None
+    try:
+        loop.run_until_complete(_close())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a task body on this process's loop, reusing its engine and Redis pool.
+
+    Outside a prefork worker (solo/threads pools, eager tasks, tests) there is no shared
+    loop, so the body runs on a throwaway one that opens and closes its own pools.
+    """
+    if _loop is not None:
+        return _loop.run_until_complete(coro)
+    return asyncio.run(_standalone(coro))
+
+
+async def _standalone(coro: Coroutine[Any, Any, T]) -> T:
+    await _open(get_settings())
+    try:
+        return await coro
+    finally:
+        await _close()
+
+
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _start_on_worker_process_init(**_kwargs: object) -> None:
+    try:
+        start_worker_runtime()
+    except Exception:
+        # Tasks then fall back to a loop per run rather than the child failing to start.
+        logger.exception("worker_runtime_start_failed")
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+def _close_on_worker_process_shutdown(**_kwargs: object) -> None:
+    try:
+        close_worker_runtime()
+    except Exception:
+        logger.exception("worker_runtime_close_failed")
@@ -3,6 +3,7 @@ from datetime import UTC, datetime
 from app.core.celery_keys import BEAT_HEARTBEAT_REDIS_KEY
 from app.core.logging import get_logger
 from app.tasks.celery_app import celery_app
+from app.tasks.runtime import run_async
 
 logger = get_logger(__name__)
 
@@ -43,35 +44,87 @@ def ping_redis() -> dict[str, str]:
 
 @celery_app.task(name="app.tasks.scheduled.nightly_maintenance")  # type: ignore[untyped-decorator]
 def nightly_maintenance() -> dict[str, str]:
-    logger.info("scheduled_nightly_maintenance")
+    from app.core.config import get_settings
+    from app.db.partitions import audit_log_partitions
+    from app.db.session import get_engine
+    from app.services.export_storage import get_export_storage
+
+    settings = get_settings()
+
+    async def _partitions() -> tuple[list[str], list[str]]:
+        async with get_engine(settings).begin() as conn:
+            if not await audit_log_partitions.is_partitioned(conn):
+                return [], []
+            created = await audit_log_partitions.ensure_months(
+                conn, months_ahead=settings.audit_partition_months_ahead
+            )
+            expired: list[str] = []
+            if settings.audit_retention_months is not None:
+                expired = await audit_log_partitions.apply_retention(
+                    conn,
+                    keep_months=settings.audit_retention_months,
+                    action=settings.audit_retention_action,
+                )
+            return created, expired
+
+    status = "ok"
+    created: list[str] = []
+    expired: list[str] = []
+    try:
+        created, expired = run_async(_partitions())
+    except Exception:
+        status = "error"
+        logger.exception("audit_partition_maintenance_failed")
+
+    purged = 0
+    try:
+        storage = get_export_storage(settings)
+        purged = run_async(storage.purge_older_than(settings.admin_export_job_ttl_seconds))
+    except Exception:
+        logger.exception("export_artifact_purge_failed")
+    logger.info(
+        "scheduled_nightly_maintenance",
+        partitions_created=created,
+        partitions_expired=expired,
+        export_artifacts_purged=purged,
+    )
+    return {"status": status}
+
+
+@celery_app.task(name="app.tasks.scheduled.refresh_dashboard_snapshot")  # type: ignore[untyped-decorator]
+def refresh_dashboard_snapshot() -> dict[str, str]:
+    from app.cache.redis import get_redis_client
+    from app.core.config import get_settings
+    from app.services.dashboard_snapshot import DashboardSnapshot
+
+    async def _run() -> list[str]:
+        snapshot = DashboardSnapshot(get_redis_client(), get_settings())
+        return list(await snapshot.refresh_expired())
+
+    try:
+        refreshed = run_async(_run())
+    except Exception:
+        logger.exception("scheduled_dashboard_refresh_failed")
+        return {"status": "error"}
+    logger.info("scheduled_dashboard_refresh", components=refreshed)
     return {"status": "ok"}
 
 
 @celery_app.task(name="app.tasks.scheduled.check_and_send_alerts")  # type: ignore[untyped-decorator]
 def check_and_send_alerts() -> dict[str, str]:
-    import asyncio
-
-    from app.cache.redis import close_redis_pool, init_redis_pool
+    from app.cache.redis import get_redis_client
     from app.core.config import get_settings
-    from app.db.session import dispose_engine, get_session_factory
+    from app.db.session import get_session_factory
     from app.services.alert_monitor import AlertMonitorService
 
     async def _run() -> None:
-        from app.cache.redis import get_redis_client
-
         settings = get_settings()
-        await init_redis_pool(settings)
-        try:
-            factory = get_session_factory(settings)
-            async with factory() as session:
-                await AlertMonitorService(session, get_redis_client(), settings).run_check()
-                await session.commit()
-        finally:
-            await close_redis_pool()
-            await dispose_engine()
+        async with get_session_factory(settings)() as session:
+            await AlertMonitorService(session, get_redis_client(), settings).run_check()
+            await session.commit()
 
     try:
-        asyncio.run(_run())
+        run_async(_run())
     except Exception:
         logger.exception("scheduled_alert_check_failed")
     return {"status": "ok"}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark the audit CSV export: server-side streaming vs materializing every row.
+
+Seeds ``--rows`` synthetic audit logs into DATABASE_URL (start it with
+scripts/init_dev.sh and run migrations first), then runs each export mode in a
+fresh subprocess and reports time to first byte, total time, output size and peak
+RSS. Seeded rows use the ``bench.export`` action and are deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import io
+import os
+import resource
+import subprocess
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import delete, insert, select  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.db.session import dispose_engine, get_session_factory  # noqa: E402
+from app.models.audit_log import AuditLog  # noqa: E402
+from app.services.admin_audit import AdminAuditService  # noqa: E402
+from app.services.audit_export import EXPORT_HEADER  # noqa: E402
+
+ACTION = "bench.export"
+
+
+async def _seed(rows: int, batch: int = 5000) -> None:
+    start = datetime.now(UTC)
+    async with get_session_factory()() as session:
+        for offset in range(0, rows, batch):
+            values = [
+                {
+                    "id": uuid.uuid4(),
+                    "action": ACTION,
+                    "resource_type": "user",
+                    "resource_id": str(i),
+                    "ip": "127.0.0.1",
+                    "detail": {"changes": {"is_active": [True, False]}},
+                    "created_at": start - timedelta(milliseconds=i),
+                }
+                for i in range(offset, min(offset + batch, rows))
+            ]
+            await session.execute(insert(AuditLog), values)
+        await session.commit()
+
+
+async def _stream() -> tuple[float, int]:
+    async with get_session_factory()() as session:
+        service = AdminAuditService(session, get_settings())
+        first_byte = 0.0
+        size = 0
+        start = time.perf_counter()
+        async for chunk in service.export(action=ACTION):
+            if not first_byte:
+                first_byte = time.perf_counter() - start
+            size += len(chunk)
+    return first_byte, size
+
+
+async def _materialize() -> tuple[float, int]:
+    """The previous implementation: load every row, then write CSV one row at a time."""
+    async with get_session_factory()() as session:
+        start = time.perf_counter()
+        result = await session.execute(
+            select(AuditLog).where(AuditLog.action == ACTION).order_by(AuditLog.created_at.desc())
+        )
+        logs = result.scalars().all()
+        first_byte = time.perf_counter() - start
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_HEADER)
+        size = 0
+        for log in logs:
+            writer.writerow(
+                [
+                    log.created_at.isoformat(),
+                    log.action,
+                    str(log.actor_id) if log.actor_id else "",
+                    log.resource_type,
+                    log.resource_id or "",
+                    log.ip or "",
+                    log.request_id or "",
+                    str(log.detail) if log.detail else "",
+                ]
+            )
+            size += len(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate(0)
+    return first_byte, size
+
+
+async def _run_mode(mode: str) -> None:
+    start = time.perf_counter()
+    try:
+        first_byte, size = await (_stream() if mode == "stream" else _materialize())
+    finally:
+        await dispose_engine()
+    total = time.perf_counter() - start
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mib = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    print(
+        f"{mode:>12}: ttfb {first_byte * 1000:8.1f} ms  total {total:6.2f} s  "
+        f"{size / 1e6:8.1f} MB  peak RSS {peak_mib:7.1f} MiB"
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--mode", choices=["stream", "materialize"])
+    args = parser.parse_args()
+
+    if args.mode:
+        await _run_mode(args.mode)
+        return 0
+
+    await _seed(args.rows)
+    try:
+        for mode in ("stream", "materialize"):
+            subprocess.run([sys.executable, __file__, "--mode", mode], check=True)
+    finally:
+        async with get_session_factory()() as session:
+            await session.execute(delete(AuditLog).where(AuditLog.action == ACTION))
+            await session.commit()
+        await dispose_engine()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark audit log inserts/sec: flush-per-event vs sync vs buffered writes.
+
+Each event runs like an admin request: its own session, one audit record, one commit,
+with ``--concurrency`` requests in flight. ``flush`` is the previous behaviour (add,
+flush and refresh per event); ``sync`` stages the row for the caller's commit;
+``buffered`` hands it to the AuditWriter after commit and includes the final drain.
+Needs DATABASE_URL (start it with scripts/init_dev.sh and run migrations first).
+Rows use the ``bench.audit`` action and are deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import delete  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.db.session import dispose_engine, get_session_factory  # noqa: E402
+from app.models.audit_log import AuditLog  # noqa: E402
+from app.repositories.audit_log import AuditLogRepository  # noqa: E402
+from app.services.audit import AuditService  # noqa: E402
+from app.services.audit_writer import close_audit_writer, start_audit_writer  # noqa: E402
+
+ACTION = "bench.audit"
+MODES = ("flush", "sync", "buffered")
+
+
+async def _event(mode: str, n: int) -> None:
+    async with get_session_factory()() as session:
+        if mode == "flush":
+            await AuditLogRepository(session).create(
+                AuditLog(action=ACTION, resource_type="bench", resource_id=str(n))
+            )
+        else:
+            await AuditService(session).record(
+                actor_id=None, action=ACTION, resource_type="bench", resource_id=str(n)
+            )
+        await session.commit()
+
+
+async def _run_mode(mode: str, events: int, concurrency: int) -> float:
+    if mode == "buffered":
+        start_audit_writer(get_session_factory(), get_settings())
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(n: int) -> None:
+        async with semaphore:
+            await _event(mode, n)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(events)))
+    await close_audit_writer()
+    return time.perf_counter() - start
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        for mode in MODES:
+            elapsed = await _run_mode(mode, args.events, args.concurrency)
+            print(f"{mode:>9}: {args.events / elapsed:10.0f} inserts/s  ({elapsed:6.2f} s)")
+    finally:
+        async with get_session_factory()() as session:
+            await session.execute(delete(AuditLog).where(AuditLog.action == ACTION))
+            await session.commit()
+        await dispose_engine()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
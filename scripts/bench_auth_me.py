@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark GET /api/v1/auth/me with and without the principal cache.
+
+Runs the app in-process against DATABASE_URL / REDIS_URL (start them with
+scripts/init_dev.sh first) and reports requests/sec for each mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", str(10**9))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.cache.principal import get_principal_cache  # noqa: E402
+from app.cache.redis import close_redis_pool, init_redis_pool  # noqa: E402
+from app.db.session import dispose_engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+
+
+async def _run(client: AsyncClient, token: str, *, requests: int, concurrency: int) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get("/api/v1/auth/me", headers=headers)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    await init_redis_pool()
+    app = create_app()
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            register = await client.post(
+                "/api/v1/auth/register",
+                json={"email": f"bench-{uuid.uuid4().hex}@example.com", "password": "benchpass123"},
+            )
+            register.raise_for_status()
+            token = register.json()["data"]["tokens"]["access_token"]
+
+            cache = get_principal_cache()
+            for enabled in (False, True):
+                cache.enabled = enabled
+                cache.clear()
+                await _run(client, token, requests=200, concurrency=args.concurrency)
+                rps = await _run(
+                    client, token, requests=args.requests, concurrency=args.concurrency
+                )
+                label = "cache on " if enabled else "cache off"
+                print(f"{label}: {rps:,.0f} req/s ({args.requests} requests)")
+    finally:
+        await close_redis_pool()
+        await dispose_engine()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Measure /health and /auth/me latency while /auth/login is being hammered.
+
+With bcrypt on the password-hash pool, p99 of the probe endpoints should stay
+flat under login load. Runs the app in-process against DATABASE_URL / REDIS_URL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", str(10**9))
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.cache.redis import close_redis_pool, init_redis_pool  # noqa: E402
+from app.core.password_hasher import close_password_hasher  # noqa: E402
+from app.db.session import dispose_engine  # noqa: E402
+from app.main import create_app  # noqa: E402
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _probe(
+    client: AsyncClient, path: str, headers: dict[str, str], samples: int
+) -> list[float]:
+    latencies: list[float] = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        await client.get(path, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def _hammer_login(
+    client: AsyncClient, credentials: dict[str, str], stop: asyncio.Event
+) -> None:
+    while not stop.is_set():
+        await client.post("/api/v1/auth/login", json=credentials)
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:<28} p50={statistics.median(latencies):7.2f}ms "
+        f"p99={_percentile(latencies, 99):7.2f}ms"
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--login-concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    await init_redis_pool()
+    app = create_app()
+    transport = ASGITransport(app=app)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            credentials = {
+                "email": f"bench-{uuid.uuid4().hex}@example.com",
+                "password": "benchpass123",
+            }
+            register = await client.post("/api/v1/auth/register", json=credentials)
+            register.raise_for_status()
+            token = register.json()["data"]["tokens"]["access_token"]
+            auth = {"Authorization": f"Bearer {token}"}
+
+            for phase in ("idle", "login load"):
+                stop = asyncio.Event()
+                load: list[asyncio.Task[None]] = []
+                if phase == "login load":
+                    load = [
+                        asyncio.create_task(_hammer_login(client, credentials, stop))
+                        for _ in range(args.login_concurrency)
+                    ]
+                    await asyncio.sleep(0.5)
+                health = await _probe(client, "/health", {}, args.samples)
+                me = await _probe(client, "/api/v1/auth/me", auth, args.samples)
+                stop.set()
+                await asyncio.gather(*load)
+                _report(f"/health ({phase})", health)
+                _report(f"/auth/me ({phase})", me)
+    finally:
+        await close_redis_pool()
+        await dispose_engine()
+        await close_password_hasher()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
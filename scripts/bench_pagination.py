@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark audit log page latency by depth: OFFSET paging vs (created_at, id) cursors.
+
+Seeds ``--rows`` synthetic audit logs into DATABASE_URL (start it with
+scripts/init_dev.sh and run migrations first), then times fetching page N in
+each mode. Offset latency grows with N; cursor latency should stay flat.
+Seeded rows use the ``bench.pagination`` action and are deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import delete, insert, select  # noqa: E402
+
+from app.db.session import dispose_engine, get_session_factory  # noqa: E402
+from app.models.audit_log import AuditLog  # noqa: E402
+from app.repositories.audit_log import AuditLogRepository  # noqa: E402
+from app.repositories.pagination import Cursor, newest_first  # noqa: E402
+
+ACTION = "bench.pagination"
+
+
+async def _seed(rows: int, batch: int = 5000) -> None:
+    start = datetime.now(UTC)
+    async with get_session_factory()() as session:
+        for offset in range(0, rows, batch):
+            values = [
+                {
+                    "id": uuid.uuid4(),
+                    "action": ACTION,
+                    "resource_type": "bench",
+                    "created_at": start - timedelta(milliseconds=i),
+                }
+                for i in range(offset, min(offset + batch, rows))
+            ]
+            await session.execute(insert(AuditLog), values)
+        await session.commit()
+
+
+async def _cursor_for_page(page: int, page_size: int) -> Cursor | None:
+    if page == 1:
+        return None
+    async with get_session_factory()() as session:
+        query = newest_first(
+            select(AuditLog).where(AuditLog.action == ACTION), AuditLog.created_at, AuditLog.id
+        )
+        row = await session.scalar(query.offset((page - 1) * page_size - 1).limit(1))
+    return Cursor.after(row) if row is not None else None
+
+
+async def _time(page: int, page_size: int, cursor: Cursor | None, repeat: int) -> float:
+    samples = []
+    async with get_session_factory()() as session:
+        repo = AuditLogRepository(session)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if cursor is None:
+                await repo.list_paginated(page=page, page_size=page_size, action=ACTION)
+            else:
+                await repo.list_after(cursor=cursor, page_size=page_size, action=ACTION)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100, 1000, 5000])
+    args = parser.parse_args()
+
+    await _seed(args.rows)
+    try:
+        print(f"{'page':>8}  {'offset ms':>10}  {'cursor ms':>10}")
+        for page in args.pages:
+            if (page - 1) * args.page_size >= args.rows:
+                break
+            offset_ms = await _time(page, args.page_size, None, args.repeat)
+            cursor = await _cursor_for_page(page, args.page_size)
+            cursor_ms = (
+                await _time(page, args.page_size, cursor, args.repeat)
+                if cursor is not None
+                else offset_ms
+            )
+            print(f"{page:>8}  {offset_ms:>10.2f}  {cursor_ms:>10.2f}")
+    finally:
+        async with get_session_factory()() as session:
+            await session.execute(delete(AuditLog).where(AuditLog.action == ACTION))
+            await session.commit()
+        await dispose_engine()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
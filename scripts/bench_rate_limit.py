@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Compare the legacy INCR + EXPIRE limiter with the single-round-trip Lua limiters.
+
+Runs against REDIS_URL and reports Redis round trips per request and throughput.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+
+from app.cache.rate_limiter import RedisRateLimiter
+from app.core.config import RateLimitAlgorithm, get_settings
+
+
+async def _legacy_hit(redis: Redis, key: str, limit: int) -> bool:
+    count = await redis.incr(key)
+    if count == 1:
+        await redis.expire(key, 60)
+    return bool(count <= limit)
+
+
+async def _measure(
+    hit: Callable[[int], Awaitable[object]], requests: int, concurrency: int
+) -> float:
+    counter = 0
+
+    async def worker() -> None:
+        nonlocal counter
+        while counter < requests:
+            counter += 1
+            await hit(counter)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--clients", type=int, default=1000, help="distinct limiter keys")
+    args = parser.parse_args()
+
+    redis = Redis.from_url(get_settings().redis_url, decode_responses=True)
+    prefix = f"bench:rate_limit:{uuid.uuid4().hex}"
+    limiter = RedisRateLimiter()
+    limit = 10**9
+
+    try:
+        rps = await _measure(
+            lambda i: _legacy_hit(redis, f"{prefix}:legacy:{i % args.clients}", limit),
+            args.requests,
+            args.concurrency,
+        )
+        print(f"{'incr+expire (legacy)':<22} round trips/request=2*  {rps:>10,.0f} req/s")
+
+        algorithms: tuple[RateLimitAlgorithm, ...] = (
+            "fixed_window",
+            "sliding_window",
+            "token_bucket",
+        )
+        for algorithm in algorithms:
+            rps = await _measure(
+                lambda i, alg=algorithm: limiter.hit(  # type: ignore[misc]
+                    redis,
+                    f"{prefix}:{alg}:{i % args.clients}",
+                    algorithm=alg,
+                    limit=limit,
+                    window_seconds=60,
+                ),
+                args.requests,
+                args.concurrency,
+            )
+            print(f"{algorithm:<22} round trips/request=1   {rps:>10,.0f} req/s")
+        print("* first request per window; subsequent requests in the window take 1")
+    finally:
+        keys = [key async for key in redis.scan_iter(f"{prefix}:*")]
+        if keys:
+            await redis.delete(*keys)
+        await redis.aclose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark admin email search: unindexed ILIKE vs trigram and prefix index paths.
+
+Seeds ``--rows`` synthetic users into DATABASE_URL (start it with scripts/init_dev.sh
+and run migrations first), then times each search term three ways: the old
+``email ILIKE '%term%'`` filter (a sequential scan), the trigram-ranked
+``UserRepository.search_by_email`` and its prefix fast path. Seeded users use the
+``bench-search.invalid`` domain and are deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("DB_ECHO", "false")
+
+from sqlalchemy import delete, select, text  # noqa: E402
+
+from app.db.session import dispose_engine, get_session_factory  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.repositories.user import UserRepository  # noqa: E402
+
+DOMAIN = "bench-search.invalid"
+
+# Set-based insert: seeding millions of rows through the ORM would dominate the run.
+_SEED_SQL = text(
+    "INSERT INTO users (id, email, hashed_password, is_active, role)"
+    " SELECT gen_random_uuid(), 'user' || n || '.' || md5(n::text) || '@' || :domain,"
+    " 'x', true, 'user' FROM generate_series(:start, :stop) AS n"
+)
+
+
+async def _seed(rows: int, batch: int = 500_000) -> None:
+    async with get_session_factory()() as session:
+        for start in range(0, rows, batch):
+            stop = min(start + batch, rows) - 1
+            await session.execute(_SEED_SQL, {"start": start, "stop": stop, "domain": DOMAIN})
+        await session.commit()
+        await session.execute(text("ANALYZE users"))
+
+
+async def _time(search: Callable[[UserRepository], Awaitable[object]], repeat: int) -> float:
+    samples = []
+    async with get_session_factory()() as session:
+        repo = UserRepository(session)
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await search(repo)
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def _ilike(term: str, limit: int) -> Callable[[UserRepository], Awaitable[object]]:
+    async def search(repo: UserRepository) -> object:
+        query = select(User).where(User.email.ilike(f"%{term}%")).limit(limit)
+        return (await repo.session.scalars(query)).all()
+
+    return search
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--terms", nargs="+", default=["user4242", "4242.", "c0ffee", "zzzq"])
+    args = parser.parse_args()
+
+    await _seed(args.rows)
+    try:
+        print(f"{'term':>12}  {'ilike ms':>10}  {'trigram ms':>10}  {'prefix ms':>10}")
+        for term in args.terms:
+            ilike_ms = await _time(_ilike(term, args.limit), args.repeat)
+            trigram_ms = await _time(
+                lambda repo, term=term: repo.search_by_email(term, limit=args.limit),
+                args.repeat,
+            )
+            prefix_ms = await _time(
+                lambda repo, term=term: repo.search_by_email(term, limit=args.limit, prefix=True),
+                args.repeat,
+            )
+            print(f"{term:>12}  {ilike_ms:>10.2f}  {trigram_ms:>10.2f}  {prefix_ms:>10.2f}")
+    finally:
+        async with get_session_factory()() as session:
+            await session.execute(delete(User).where(User.email.like(f"%@{DOMAIN}")))
+            await session.commit()
+        await dispose_engine()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -7,6 +7,8 @@ import argparse
 import asyncio
 import sys
 
+from app.cache.principal import get_principal_cache
+from app.cache.redis import close_redis_pool, init_redis_pool
 from app.core.roles import ADMIN
 from app.core.security import get_password_hash
 from app.db.session import dispose_engine, get_session_factory
@@ -35,6 +37,9 @@ async def main() -> int:
             else:
                 await repo.promote_to_admin(user)
                 await session.commit()
+                await init_redis_pool()
+                await get_principal_cache().invalidate(user.id)
+                await close_redis_pool()
                 print(f"Promoted existing user {email} to admin")
         else:
             await repo.create(
@@ -74,7 +74,7 @@ async def test_alert_update_and_deliveries(
         return 200
 
     monkeypatch.setattr(
-        "app.services.admin_alerts.post_webhook",
+        "app.services.alert_dispatch.post_webhook",
         fake_post,
     )
 
@@ -0,0 +1,109 @@
+import csv
+import io
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.cache.redis import get_redis_client
+from app.core.config import Settings
+from app.models.audit_log import AuditLog
+from app.repositories.user import UserRepository
+from app.services.export_jobs import ExportJobService
+from app.services.export_storage import get_export_storage
+
+
+async def _admin_headers(client: AsyncClient, db_engine, email: str) -> dict[str, str]:
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "password": "securepass123"},
+    )
+    assert response.status_code == 201
+    token = response.json()["data"]["tokens"]["access_token"]
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as session:
+        repo = UserRepository(session)
+        user = await repo.get_by_email(email)
+        assert user is not None
+        await repo.promote_to_admin(user)
+        await session.commit()
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_export_job_dedupe_progress_and_ranged_download(
+    client: AsyncClient,
+    db_engine,
+    test_settings: Settings,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(test_settings, "admin_export_storage_dir", str(tmp_path))
+    enqueued: list[str] = []
+    monkeypatch.setattr(
+        "app.api.v1.admin.audit.run_audit_export.delay", lambda job_id: enqueued.append(job_id)
+    )
+    headers = await _admin_headers(client, db_engine, "export-jobs-admin@example.com")
+    session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all(
+            [
+                AuditLog(action="export.job.test", resource_type="user", resource_id=str(i))
+                for i in range(3)
+            ]
+        )
+        await session.commit()
+    payload = {"format": "csv", "action": "export.job.test"}
+
+    created = await client.post(
+        "/api/v1/admin/audit-logs/export-jobs", json=payload, headers=headers
+    )
+    assert created.status_code == 202
+    job = created.json()["data"]
+    assert job["status"] == "queued"
+    assert job["reused"] is False
+    assert enqueued == [job["id"]]
+
+    again = await client.post("/api/v1/admin/audit-logs/export-jobs", json=payload, headers=headers)
+    assert again.json()["data"]["id"] == job["id"]
+    assert again.json()["data"]["reused"] is True
+    assert enqueued == [job["id"]]
+
+    early = await client.get(
+        f"/api/v1/admin/audit-logs/export-jobs/{job['id']}/download", headers=headers
+    )
+    assert early.status_code == 409
+
+    async with session_factory() as session:
+        finished = await ExportJobService(get_redis_client(), test_settings).run(
+            job["id"], session=session, storage=get_export_storage(test_settings)
+        )
+    assert finished.status == "succeeded"
+
+    status_response = await client.get(
+        f"/api/v1/admin/audit-logs/export-jobs/{job['id']}", headers=headers
+    )
+    data = status_response.json()["data"]
+    assert data["progress"] == 1.0
+    assert data["rows"] == 3
+
+    full = await client.get(data["download_url"], headers=headers)
+    assert full.status_code == 200
+    assert full.headers["accept-ranges"] == "bytes"
+    rows = list(csv.DictReader(io.StringIO(full.text)))
+    assert len(rows) == 3
+    assert all(row["action"] == "export.job.test" for row in rows)
+
+    partial = await client.get(data["download_url"], headers={**headers, "Range": "bytes=10-"})
+    assert partial.status_code == 206
+    assert (
+        partial.headers["content-range"] == f"bytes 10-{len(full.content) - 1}/{len(full.content)}"
+    )
+    assert partial.content == full.content[10:]
+
+    beyond = await client.get(
+        data["download_url"], headers={**headers, "Range": f"bytes={len(full.content)}-"}
+    )
+    assert beyond.status_code == 416
+    assert beyond.headers["content-range"] == f"bytes */{len(full.content)}"
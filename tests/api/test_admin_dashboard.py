@@ -8,7 +8,8 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 from app.cache.redis import get_redis_client
 from app.core.celery_keys import BEAT_HEARTBEAT_REDIS_KEY
 from app.repositories.user import UserRepository
-from app.services.migration_status import _alembic_head_revision
+from app.services.dashboard_snapshot import DashboardSnapshot
+from app.services.migration_status import alembic_head_revision, reset_migration_status_cache
 
 
 async def _register(client: AsyncClient, email: str) -> str:
@@ -61,12 +62,13 @@ async def test_admin_dashboard(client: AsyncClient, db_engine) -> None:
 async def test_admin_dashboard_ready_degraded_when_migration_not_at_head(
     client: AsyncClient,
     db_engine,
+    test_settings,
 ) -> None:
     admin_email = "dash-migrate@example.com"
     admin_token = await _register(client, admin_email)
     await _make_admin(db_engine, admin_email)
 
-    head = _alembic_head_revision()
+    head = alembic_head_revision()
     assert head is not None
 
     session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
@@ -79,6 +81,9 @@ async def test_admin_dashboard_ready_degraded_when_migration_not_at_head(
             text("INSERT INTO alembic_version (version_num) VALUES ('stale-revision')")
         )
         await session.commit()
+    # The snapshot and the revision cache may still hold a previous test's reading.
+    await DashboardSnapshot(get_redis_client(), test_settings).invalidate()
+    reset_migration_status_cache()
 
     response = await client.get(
         "/api/v1/admin/dashboard",
@@ -106,6 +111,7 @@ async def test_admin_dashboard_ready_degraded_when_beat_stale(
     )
     redis = get_redis_client()
     await redis.set(BEAT_HEARTBEAT_REDIS_KEY, stale.isoformat())
+    await DashboardSnapshot(redis, test_settings).invalidate()
 
     response = await client.get(
         "/api/v1/admin/dashboard",
@@ -116,3 +122,23 @@ async def test_admin_dashboard_ready_degraded_when_beat_stale(
     assert system["beat_status"] == "stale"
     assert system["ready_status"] == "degraded"
     assert "beat" in (system["ready_message"] or "").lower()
+
+
+@pytest.mark.asyncio
+async def test_admin_dashboard_serves_snapshot_until_ttl(
+    client: AsyncClient,
+    db_engine,
+    test_settings,
+) -> None:
+    admin_email = "dash-snapshot@example.com"
+    admin_token = await _register(client, admin_email)
+    await _make_admin(db_engine, admin_email)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    await DashboardSnapshot(get_redis_client(), test_settings).invalidate()
+
+    first = await client.get("/api/v1/admin/dashboard", headers=headers)
+    await _register(client, "dash-snapshot-later@example.com")
+    second = await client.get("/api/v1/admin/dashboard", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json()["data"]["user_count"] == first.json()["data"]["user_count"]
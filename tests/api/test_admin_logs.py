@@ -88,7 +88,7 @@ async def test_logs_query_with_mock_loki(
         async def get(self, url: str, params: dict) -> FakeResponse:
             return FakeResponse()
 
-    monkeypatch.setattr("app.services.admin_logs.httpx.AsyncClient", lambda **kwargs: FakeClient())
+    monkeypatch.setattr("app.services.admin_logs.http_client", lambda *args: FakeClient())
 
     response = await client.get(
         "/api/v1/admin/logs?request_id=abc-123",
@@ -154,7 +154,7 @@ async def test_logs_pagination_second_page(
             assert params["limit"] == 500
             return FakeResponse()
 
-    monkeypatch.setattr("app.services.admin_logs.httpx.AsyncClient", lambda **kwargs: FakeClient())
+    monkeypatch.setattr("app.services.admin_logs.http_client", lambda *args: FakeClient())
 
     response = await client.get(
         "/api/v1/admin/logs?page=2&page_size=50",
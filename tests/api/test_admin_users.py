@@ -72,6 +72,36 @@ async def test_admin_users_list_and_update(client: AsyncClient, db_engine) -> No
     assert updated.json()["data"]["is_active"] is False
 
 
+@pytest.mark.asyncio
+async def test_deactivated_user_loses_access_despite_cached_principal(
+    client: AsyncClient,
+    db_engine,
+) -> None:
+    admin_token = await _register(client, "cache-admin@example.com")
+    await _make_admin(db_engine, "cache-admin@example.com")
+    user_token = await _register(client, "cache-user@example.com")
+
+    me = await client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": f"Bearer {user_token}"},
+    )
+    assert me.status_code == 200
+    user_id = me.json()["data"]["id"]
+
+    updated = await client.patch(
+        f"/api/v1/admin/users/{user_id}",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        json={"is_active": False},
+    )
+    assert updated.status_code == 200
+
+    after = await client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": f"Bearer {user_token}"},
+    )
+    assert after.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_admin_cannot_deactivate_self(client: AsyncClient, db_engine) -> None:
     admin_email = "self@example.com"
@@ -294,3 +324,78 @@ async def test_can_demote_inactive_admin_when_one_active_admin_remains(
     )
     assert block_self.status_code == 400
     assert block_self.json()["code"] == 40004
+
+
+@pytest.mark.asyncio
+async def test_admin_users_cursor_pagination_walks_every_user(
+    client: AsyncClient,
+    db_engine,
+) -> None:
+    admin_email = "cursor-admin@example.com"
+    admin_token = await _register(client, admin_email)
+    await _make_admin(db_engine, admin_email)
+    for index in range(4):
+        await _register(client, f"cursor-user-{index}@example.com")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    first = await client.get("/api/v1/admin/users?page_size=2", headers=headers)
+    assert first.status_code == 200
+    body = first.json()["data"]
+    assert body["total"] == 5
+    seen = [item["email"] for item in body["items"]]
+    cursor = body["next_cursor"]
+
+    while cursor is not None:
+        page = await client.get(
+            "/api/v1/admin/users",
+            params={"page_size": 2, "cursor": cursor},
+            headers=headers,
+        )
+        assert page.status_code == 200
+        data = page.json()["data"]
+        assert data["total"] is None
+        assert data["page"] is None
+        seen.extend(item["email"] for item in data["items"])
+        cursor = data["next_cursor"]
+
+    assert len(seen) == 5
+    assert set(seen) == {admin_email, *(f"cursor-user-{i}@example.com" for i in range(4))}
+
+
+@pytest.mark.asyncio
+async def test_admin_users_rejects_malformed_cursor(client: AsyncClient, db_engine) -> None:
+    admin_email = "bad-cursor-admin@example.com"
+    admin_token = await _register(client, admin_email)
+    await _make_admin(db_engine, admin_email)
+
+    response = await client.get(
+        "/api/v1/admin/users?cursor=not-a-cursor",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 400
+    assert response.json()["code"] == 40007
+
+
+@pytest.mark.asyncio
+async def test_admin_users_search_ranks_and_prefix_matches(client: AsyncClient, db_engine) -> None:
+    admin_email = "search-admin@example.com"
+    admin_token = await _register(client, admin_email)
+    await _make_admin(db_engine, admin_email)
+    for email in ("alice@example.com", "malice@example.com", "bob_alice@example.com"):
+        await _register(client, email)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    ranked = await client.get("/api/v1/admin/users/search", params={"q": "Alice@"}, headers=headers)
+    assert ranked.status_code == 200
+    emails = [item["email"] for item in ranked.json()["data"]]
+    assert emails[0] == "alice@example.com"
+    assert set(emails) == {"alice@example.com", "malice@example.com", "bob_alice@example.com"}
+
+    prefix = await client.get(
+        "/api/v1/admin/users/search", params={"q": "al", "prefix": "true"}, headers=headers
+    )
+    assert [item["email"] for item in prefix.json()["data"]] == ["alice@example.com"]
+
+    # "_" is literal, not a single-character wildcard.
+    literal = await client.get("/api/v1/admin/users/search", params={"q": "b_a"}, headers=headers)
+    assert [item["email"] for item in literal.json()["data"]] == ["bob_alice@example.com"]
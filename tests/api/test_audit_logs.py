@@ -112,7 +112,7 @@ async def test_audit_log_request_id_on_alert_test_send(
     ) -> int:
         return 200
 
-    monkeypatch.setattr("app.services.admin_alerts.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     await client.patch(
         "/api/v1/admin/alerts/settings",
@@ -2,7 +2,8 @@ import pytest
 from httpx import AsyncClient
 
 from app.cache.redis import get_redis_client
-from app.core.config import Settings
+from app.core.config import RateLimitRule, Settings
+from app.core.security import create_access_token
 
 
 @pytest.mark.asyncio
@@ -20,6 +21,9 @@ async def test_rate_limit(client: AsyncClient, test_settings: Settings) -> None:
     assert body["code"] == 42900
     assert body["message"] == "Rate limit exceeded"
     assert blocked.headers.get("X-Request-ID")
+    assert blocked.headers["X-RateLimit-Limit"] == "2"
+    assert blocked.headers["X-RateLimit-Remaining"] == "0"
+    assert int(blocked.headers["Retry-After"]) >= 1
 
 
 @pytest.mark.asyncio
@@ -30,11 +34,11 @@ async def test_rate_limit_redis_unavailable_returns_503(
 ) -> None:
     test_settings.rate_limit_per_minute = 2
 
-    async def failing_incr(_key: str) -> int:
+    async def failing_evalsha(*_args: object) -> list[int]:
         raise ConnectionError("redis unavailable")
 
     redis = get_redis_client()
-    monkeypatch.setattr(redis, "incr", failing_incr)
+    monkeypatch.setattr(redis, "evalsha", failing_evalsha)
 
     response = await client.get("/api/v1/auth/me")
     assert response.status_code == 503
@@ -91,3 +95,60 @@ async def test_rate_limit_uses_forwarded_for_when_trust_proxy(
         headers={"X-Forwarded-For": "198.51.100.2"},
     )
     assert still_ok_second_ip.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_sets_headers_on_allowed_response(
+    client: AsyncClient,
+    test_settings: Settings,
+) -> None:
+    test_settings.rate_limit_per_minute = 5
+    await get_redis_client().flushdb()
+
+    response = await client.get("/api/v1/auth/me")
+    assert response.status_code == 401
+    assert response.headers["X-RateLimit-Limit"] == "5"
+    assert response.headers["X-RateLimit-Remaining"] == "4"
+    assert "Retry-After" not in response.headers
+
+
+@pytest.mark.parametrize("algorithm", ["sliding_window", "token_bucket"])
+@pytest.mark.asyncio
+async def test_rate_limit_algorithms_block_after_limit(
+    client: AsyncClient,
+    test_settings: Settings,
+    monkeypatch: pytest.MonkeyPatch,
+    algorithm: str,
+) -> None:
+    monkeypatch.setattr(test_settings, "rate_limit_per_minute", 3)
+    monkeypatch.setattr(test_settings, "rate_limit_algorithm", algorithm)
+    await get_redis_client().flushdb()
+
+    statuses = [(await client.get("/api/v1/auth/me")).status_code for _ in range(4)]
+    assert statuses == [401, 401, 401, 429]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rule_scoped_to_principal(
+    client: AsyncClient,
+    test_settings: Settings,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        test_settings,
+        "rate_limit_rules",
+        [RateLimitRule(prefix="/api/v1/auth", limit=1, scope="principal")],
+    )
+    await get_redis_client().flushdb()
+
+    first = create_access_token("00000000-0000-0000-0000-000000000001", test_settings)
+    second = create_access_token("00000000-0000-0000-0000-000000000002", test_settings)
+
+    assert (
+        await client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {first}"})
+    ).status_code == 404
+    assert (
+        await client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {second}"})
+    ).status_code == 404
+    blocked = await client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {first}"})
+    assert blocked.status_code == 429
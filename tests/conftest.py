@@ -6,6 +6,7 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.cache.principal import reset_principal_cache
 from app.cache.redis import close_redis_pool, init_redis_pool
 from app.core.config import Settings, get_settings
 from app.db.session import get_db
@@ -14,6 +15,8 @@ from app.models import Base
 
 os.environ.setdefault("ENVIRONMENT", "test")
 os.environ.setdefault("JWT_SECRET", "test-secret-key-for-jwt-signing-32chars")
+# Deliver alerts during the check so tests can assert on them without a worker.
+os.environ.setdefault("ALERT_DELIVERY_MODE", "inline")
 
 
 def _docker_available() -> bool:
@@ -100,6 +103,7 @@ def mock_celery_task(monkeypatch: pytest.MonkeyPatch) -> None:
 @pytest_asyncio.fixture
 async def client(test_settings: Settings, db_engine) -> AsyncGenerator[AsyncClient, None]:
     get_settings.cache_clear()
+    reset_principal_cache()
     app = create_app()
 
     session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
@@ -128,5 +132,6 @@ async def client(test_settings: Settings, db_engine) -> AsyncGenerator[AsyncClie
         yield ac
 
     await close_redis_pool()
+    reset_principal_cache()
     get_settings.cache_clear()
     app.dependency_overrides.clear()
@@ -1,3 +1,10 @@
+import csv
+import io
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -6,6 +13,17 @@ from app.services.admin_audit import AdminAuditService
 from app.services.audit import AuditService
 
 
+def _settings(**overrides: Any) -> Settings:
+    values: dict[str, Any] = {
+        "environment": "test",
+        "database_url": "postgresql+asyncpg://unused",
+        "redis_url": "redis://unused",
+        "jwt_secret": "test-secret-key-for-jwt-signing-32chars",
+    }
+    values.update(overrides)
+    return Settings(**values)
+
+
 @pytest.mark.asyncio
 async def test_audit_export_truncates_at_max_rows(db_session: AsyncSession) -> None:
     audit = AuditService(db_session)
@@ -17,19 +35,50 @@ async def test_audit_export_truncates_at_max_rows(db_session: AsyncSession) -> N
         )
     await db_session.commit()
 
-    settings = Settings(
-        environment="test",
-        database_url="postgresql+asyncpg://unused",
-        redis_url="redis://unused",
-        jwt_secret="test-secret-key-for-jwt-signing-32chars",
-        admin_audit_export_max_rows=2,
-    )
+    settings = _settings(admin_audit_export_max_rows=2)
     service = AdminAuditService(db_session, settings)
 
-    chunks: list[str] = []
-    async for chunk in service.iter_export_rows(action="export.test"):
+    chunks: list[bytes] = []
+    async for chunk in service.export(action="export.test"):
         chunks.append(chunk)
 
-    body = "".join(chunks)
+    body = b"".join(chunks).decode()
     assert "created_at" in body.splitlines()[0]
     assert f"# export truncated at {settings.admin_audit_export_max_rows} rows" in body
+
+
+@pytest.mark.asyncio
+async def test_audit_export_is_unbounded_by_default(db_session: AsyncSession) -> None:
+    audit = AuditService(db_session)
+    for _ in range(5):
+        await audit.record(actor_id=None, action="export.all", resource_type="system")
+    await db_session.commit()
+
+    service = AdminAuditService(db_session, _settings(admin_audit_export_batch_size=2))
+    body = b"".join([chunk async for chunk in service.export(action="export.all")]).decode()
+
+    rows = list(csv.reader(io.StringIO(body)))
+    assert len(rows) == 6
+    assert "truncated" not in body
+
+
+@pytest.mark.asyncio
+async def test_audit_export_groups_rows_into_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    row = (created_at, "export.chunk", uuid.uuid4(), "user", "42", "127.0.0.1", "req", None)
+
+    async def batches(**_kwargs: Any) -> AsyncIterator[Sequence[Any]]:
+        for _ in range(10):
+            yield [row] * 50
+
+    settings = _settings(admin_audit_export_chunk_bytes=4096)
+    service = AdminAuditService(None, settings)  # type: ignore[arg-type]
+    monkeypatch.setattr(service.logs, "iter_export_batches", batches)
+    chunks = [chunk async for chunk in service.export()]
+
+    header, *body, tail = chunks
+    assert header.startswith(b"created_at,")
+    assert body
+    assert all(len(chunk) >= 4096 for chunk in body)
+    assert len(list(csv.reader(io.StringIO(b"".join(chunks).decode())))) == 501
+    assert tail
@@ -4,12 +4,7 @@ import pytest
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.cache.redis import close_redis_pool, init_redis_pool
-from app.core.alert_keys import (
-    ALERT_DEDUPE_PREFIX,
-    ALERT_STATE_BEAT,
-    ALERT_STATE_READY,
-    ALERT_WORKER_ZERO_SINCE,
-)
+from app.core.alert_keys import ALERT_STATE_KEY
 from app.core.config import get_settings
 from app.repositories.alert import AlertSettingsRepository
 from app.services.alert_monitor import AlertMonitorService
@@ -54,15 +49,15 @@ async def test_alert_monitor_ready_failed(
         sent.append(payload["event"])
         return 200
 
-    monkeypatch.setattr("app.services.alert_monitor.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     async def fake_snapshot(self):  # type: ignore[no-untyped-def]
         from app.services.alert_monitor import HealthSnapshot
 
         return HealthSnapshot(
-            database_ok=False,
-            redis_ok=True,
-            beat_ok=True,
+            database="error",
+            redis="ok",
+            beat="ok",
             worker_count=1,
         )
 
@@ -82,7 +77,7 @@ async def test_alert_monitor_ready_failed(
             await session.commit()
 
             assert "ready_failed" in sent
-            state = await redis.get(ALERT_STATE_READY)
+            state = await redis.hget(ALERT_STATE_KEY, "ready")
             assert state == "failed"
     finally:
         await close_redis_pool()
@@ -105,15 +100,15 @@ async def test_alert_monitor_ready_recovered_after_failure(
         sent.append(payload["event"])
         return 200
 
-    monkeypatch.setattr("app.services.alert_monitor.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     async def healthy_snapshot(self):  # type: ignore[no-untyped-def]
         from app.services.alert_monitor import HealthSnapshot
 
         return HealthSnapshot(
-            database_ok=True,
-            redis_ok=True,
-            beat_ok=True,
+            database="ok",
+            redis="ok",
+            beat="ok",
             worker_count=1,
         )
 
@@ -130,13 +125,13 @@ async def test_alert_monitor_ready_recovered_after_failure(
             row.recovery_notifications_enabled = True
             await session.commit()
 
-            await redis.set(ALERT_STATE_READY, "failed")
+            await redis.hset(ALERT_STATE_KEY, "ready", "failed")
 
             await AlertMonitorService(session, redis, settings).run_check()
             await session.commit()
 
             assert "ready_recovered" in sent
-            state = await redis.get(ALERT_STATE_READY)
+            state = await redis.hget(ALERT_STATE_KEY, "ready")
             assert state == "ok"
     finally:
         await close_redis_pool()
@@ -159,15 +154,15 @@ async def test_alert_monitor_beat_missing(
         sent.append(payload["event"])
         return 200
 
-    monkeypatch.setattr("app.services.alert_monitor.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     async def beat_missing_snapshot(self):  # type: ignore[no-untyped-def]
         from app.services.alert_monitor import HealthSnapshot
 
         return HealthSnapshot(
-            database_ok=True,
-            redis_ok=True,
-            beat_ok=False,
+            database="ok",
+            redis="ok",
+            beat="stale",
             worker_count=1,
         )
 
@@ -187,7 +182,7 @@ async def test_alert_monitor_beat_missing(
             await session.commit()
 
             assert "beat_missing" in sent
-            state = await redis.get(ALERT_STATE_BEAT)
+            state = await redis.hget(ALERT_STATE_KEY, "beat")
             assert state == "missing"
     finally:
         await close_redis_pool()
@@ -210,15 +205,15 @@ async def test_alert_monitor_beat_recovered_after_missing(
         sent.append(payload["event"])
         return 200
 
-    monkeypatch.setattr("app.services.alert_monitor.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     async def healthy_snapshot(self):  # type: ignore[no-untyped-def]
         from app.services.alert_monitor import HealthSnapshot
 
         return HealthSnapshot(
-            database_ok=True,
-            redis_ok=True,
-            beat_ok=True,
+            database="ok",
+            redis="ok",
+            beat="ok",
             worker_count=1,
         )
 
@@ -235,13 +230,13 @@ async def test_alert_monitor_beat_recovered_after_missing(
             row.recovery_notifications_enabled = True
             await session.commit()
 
-            await redis.set(ALERT_STATE_BEAT, "missing")
+            await redis.hset(ALERT_STATE_KEY, "beat", "missing")
 
             await AlertMonitorService(session, redis, settings).run_check()
             await session.commit()
 
             assert "beat_recovered" in sent
-            state = await redis.get(ALERT_STATE_BEAT)
+            state = await redis.hget(ALERT_STATE_KEY, "beat")
             assert state == "ok"
     finally:
         await close_redis_pool()
@@ -265,15 +260,15 @@ async def test_alert_monitor_dedupe_skips_repeat_ready_failed(
         call_count += 1
         return 200
 
-    monkeypatch.setattr("app.services.alert_monitor.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     async def unhealthy_snapshot(self):  # type: ignore[no-untyped-def]
         from app.services.alert_monitor import HealthSnapshot
 
         return HealthSnapshot(
-            database_ok=False,
-            redis_ok=True,
-            beat_ok=True,
+            database="error",
+            redis="ok",
+            beat="ok",
             worker_count=1,
         )
 
@@ -295,8 +290,7 @@ async def test_alert_monitor_dedupe_skips_repeat_ready_failed(
             await session.commit()
 
             assert call_count == 1
-            dedupe = await redis.get(f"{ALERT_DEDUPE_PREFIX}ready_failed")
-            assert dedupe == "1"
+            assert await redis.hexists(ALERT_STATE_KEY, "dedupe:ready_failed")
     finally:
         await close_redis_pool()
         get_settings.cache_clear()
@@ -320,15 +314,15 @@ async def test_alert_monitor_workers_missing_after_duration(
         sent.append(payload["event"])
         return 200
 
-    monkeypatch.setattr("app.services.alert_monitor.post_webhook", fake_post)
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
 
     async def no_workers_snapshot(self):  # type: ignore[no-untyped-def]
         from app.services.alert_monitor import HealthSnapshot
 
         return HealthSnapshot(
-            database_ok=True,
-            redis_ok=True,
-            beat_ok=True,
+            database="ok",
+            redis="ok",
+            beat="ok",
             worker_count=0,
         )
 
@@ -344,14 +338,14 @@ async def test_alert_monitor_workers_missing_after_duration(
             row.webhook_url = "https://example.com/hook"
             await session.commit()
 
-            since = (datetime.now(UTC) - timedelta(seconds=120)).isoformat()
-            await redis.set(ALERT_WORKER_ZERO_SINCE, since)
+            since = (datetime.now(UTC) - timedelta(seconds=120)).timestamp()
+            await redis.hset(ALERT_STATE_KEY, "workers:zero_since", str(since))
 
             await AlertMonitorService(session, redis, settings).run_check()
             await session.commit()
 
             assert "workers_missing" in sent
-            state = await redis.get("alert:state:workers")
+            state = await redis.hget(ALERT_STATE_KEY, "workers")
             assert state == "missing"
     finally:
         await close_redis_pool()
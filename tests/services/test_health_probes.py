@@ -0,0 +1,211 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.redis import close_redis_pool, init_redis_pool
+from app.core.celery_keys import BEAT_HEARTBEAT_REDIS_KEY
+from app.core.config import Settings
+from app.services.health_probes import HealthProbes
+
+
+@pytest.fixture
+async def probes(
+    db_session: AsyncSession,
+    test_settings: Settings,
+) -> HealthProbes:
+    await init_redis_pool(test_settings)
+    from app.cache.redis import get_redis_client
+
+    return HealthProbes(db_session, get_redis_client(), test_settings)
+
+
+@pytest.fixture(autouse=True)
+async def _redis_cleanup() -> None:
+    yield
+    await close_redis_pool()
+
+
+@pytest.mark.asyncio
+async def test_beat_status_unknown_when_missing(probes: HealthProbes) -> None:
+    status, last_seen = await probes._beat()
+    assert status == "unknown"
+    assert last_seen is None
+
+
+@pytest.mark.asyncio
+async def test_beat_status_ok_for_recent_heartbeat(
+    probes: HealthProbes,
+) -> None:
+    redis = probes.redis
+    recent = datetime.now(UTC).isoformat()
+    await redis.set(BEAT_HEARTBEAT_REDIS_KEY, recent)
+
+    status, last_seen = await probes._beat()
+    assert status == "ok"
+    assert last_seen is not None
+    assert last_seen.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_beat_status_stale_for_old_heartbeat(
+    probes: HealthProbes,
+    test_settings: Settings,
+) -> None:
+    redis = probes.redis
+    interval = test_settings.celery_beat_heartbeat_interval_seconds
+    old = datetime.now(UTC) - timedelta(seconds=interval * 2 + 1)
+    await redis.set(BEAT_HEARTBEAT_REDIS_KEY, old.isoformat())
+
+    status, last_seen = await probes._beat()
+    assert status == "stale"
+    assert last_seen is not None
+
+
+@pytest.mark.asyncio
+async def test_beat_status_parses_bytes_timestamp(
+    probes: HealthProbes,
+) -> None:
+    redis = probes.redis
+    recent = datetime.now(UTC).isoformat().encode()
+    await redis.set(BEAT_HEARTBEAT_REDIS_KEY, recent)
+
+    status, _ = await probes._beat()
+    assert status == "ok"
+
+
+@pytest.mark.asyncio
+async def test_beat_status_naive_datetime_treated_as_utc(
+    probes: HealthProbes,
+) -> None:
+    redis = probes.redis
+    naive_recent = datetime.now(UTC).replace(tzinfo=None).isoformat()
+    await redis.set(BEAT_HEARTBEAT_REDIS_KEY, naive_recent)
+
+    status, last_seen = await probes._beat()
+    assert status == "ok"
+    assert last_seen is not None
+    assert last_seen.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_beat_status_unknown_for_invalid_timestamp(
+    probes: HealthProbes,
+) -> None:
+    redis = probes.redis
+    await redis.set(BEAT_HEARTBEAT_REDIS_KEY, "not-a-timestamp")
+
+    status, last_seen = await probes._beat()
+    assert status == "unknown"
+    assert last_seen is None
+
+
+class FakeResult:
+    def scalar_one_or_none(self) -> str | None:
+        return None
+
+
+class FakeSession:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.statements: list[str] = []
+
+    async def execute(self, statement: object) -> FakeResult:
+        self.statements.append(str(statement))
+        await asyncio.sleep(self.delay)
+        return FakeResult()
+
+
+class FakeEngine:
+    """Hands out short-lived connections that run statements like FakeSession."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.connection = FakeSession(delay)
+        self.open_connections = 0
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator[FakeSession]:
+        self.open_connections += 1
+        try:
+            yield self.connection
+        finally:
+            self.open_connections -= 1
+
+
+class FakeRedis:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.pings = 0
+
+    async def ping(self) -> bool:
+        self.pings += 1
+        await asyncio.sleep(self.delay)
+        return True
+
+    async def get(self, _key: str) -> None:
+        return None
+
+
+def _probes(
+    session: FakeSession,
+    redis: FakeRedis,
+    engine: FakeEngine | None = None,
+    **settings: object,
+) -> HealthProbes:
+    return HealthProbes(
+        session,  # type: ignore[arg-type]
+        redis,  # type: ignore[arg-type]
+        Settings(**settings),
+        engine or FakeEngine(),  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_probes_run_once_per_instance() -> None:
+    session, redis, engine = FakeSession(), FakeRedis(), FakeEngine()
+    probes = _probes(session, redis, engine)
+
+    services = await probes.snapshot("database", "redis")
+    overview = await probes.snapshot("database", "redis", "beat", "migration")
+
+    assert services.database_ok and services.redis_ok
+    assert overview.beat == "unknown"
+    assert overview.migration is not None and not overview.migration.at_head
+    assert redis.pings == 1
+    assert engine.connection.statements == ["SELECT 1"]
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently() -> None:
+    probes = _probes(FakeSession(), FakeRedis(delay=0.2), FakeEngine(delay=0.2))
+
+    started = time.perf_counter()
+    await probes.snapshot("database", "redis")
+
+    assert time.perf_counter() - started < 0.35
+
+
+@pytest.mark.asyncio
+async def test_probe_timeout_reports_error() -> None:
+    probes = _probes(FakeSession(), FakeRedis(delay=1.0), health_probe_timeout_seconds=0.05)
+
+    health = await probes.snapshot("database", "redis")
+
+    assert health.database == "ok"
+    assert health.redis == "error"
+
+
+@pytest.mark.asyncio
+async def test_database_probe_timeout_leaves_the_session_alone() -> None:
+    session, engine = FakeSession(), FakeEngine(delay=1.0)
+    probes = _probes(session, FakeRedis(), engine, health_probe_timeout_seconds=0.05)
+
+    health = await probes.snapshot("database")
+
+    assert health.database == "error"
+    assert session.statements == []
+    assert engine.open_connections == 0
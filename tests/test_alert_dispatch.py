@@ -0,0 +1,357 @@
+import json
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.cache.rate_limiter import RateLimitResult
+from app.core.alert_keys import ALERT_DEAD_LETTER_KEY, ALERT_SUPPRESSED_PREFIX
+from app.core.config import Settings
+from app.models.alert_delivery import AlertDelivery
+from app.services.alert_dispatch import (
+    PRIMARY_DESTINATION,
+    AlertDispatcher,
+    AttemptResult,
+    backoff_seconds,
+)
+from app.services.alert_webhook import build_alert_payload, build_digest_payload
+
+
+class FakeSession:
+    """Holds added rows and serves alert destinations by id."""
+
+    def __init__(self, destinations: list[Any] | None = None) -> None:
+        self.destinations = destinations or []
+        self.added: list[Any] = []
+
+    def add(self, row: Any) -> None:
+        self.added.append(row)
+
+    async def flush(self) -> None:
+        return None
+
+    async def refresh(self, _row: Any) -> None:
+        return None
+
+    async def get(self, _model: Any, row_id: uuid.UUID) -> Any:
+        return next((row for row in self.destinations if row.id == row_id), None)
+
+    async def scalars(self, _statement: Any) -> Any:
+        return SimpleNamespace(all=lambda: list(self.destinations))
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def lpush(self, *args: Any) -> None:
+        self.ops.append(("lpush", args))
+
+    def ltrim(self, *args: Any) -> None:
+        self.ops.append(("ltrim", args))
+
+    def incrby(self, *args: Any) -> None:
+        self.ops.append(("incrby", args))
+
+    def expire(self, *args: Any) -> None:
+        self.ops.append(("expire", args))
+
+    async def execute(self) -> None:
+        for name, args in self.ops:
+            await getattr(self.redis, name)(*args)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.values: dict[str, str] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def lpush(self, key: str, value: str) -> None:
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def ltrim(self, key: str, start: int, stop: int) -> None:
+        self.lists[key] = self.lists.get(key, [])[start : stop + 1]
+
+    async def lrange(self, key: str, start: int, stop: int) -> list[str]:
+        items = self.lists.get(key, [])
+        return items[start:] if stop == -1 else items[start : stop + 1]
+
+    async def incrby(self, key: str, amount: int) -> None:
+        self.values[key] = str(int(self.values.get(key, 0)) + amount)
+
+    async def expire(self, _key: str, _seconds: int) -> None:
+        return None
+
+    async def getdel(self, key: str) -> str | None:
+        return self.values.pop(key, None)
+
+    async def lrem(self, key: str, _count: int, value: str) -> int:
+        items = self.lists.get(key, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+
+class FakeRateLimiter:
+    """Allows the first ``limit`` hits per key."""
+
+    def __init__(self) -> None:
+        self.hits: dict[str, int] = {}
+
+    async def hit(self, _redis: Any, key: str, *, limit: int, **_kwargs: Any) -> RateLimitResult:
+        self.hits[key] = self.hits.get(key, 0) + 1
+        allowed = self.hits[key] <= limit
+        return RateLimitResult(allowed, limit, max(limit - self.hits[key], 0), 0, 0)
+
+
+def _dispatcher(
+    session: FakeSession, redis: FakeRedis | None = None, **overrides: Any
+) -> AlertDispatcher:
+    settings = Settings(alert_webhook_url="https://example.com/hook", **overrides)
+    return AlertDispatcher(
+        session,  # type: ignore[arg-type]
+        redis or FakeRedis(),  # type: ignore[arg-type]
+        settings,
+        rate_limiter=FakeRateLimiter(),  # type: ignore[arg-type]
+    )
+
+
+def _payload(*event_types: str) -> dict[str, Any]:
+    settings = Settings()
+    events = [build_alert_payload(event_type=name, settings=settings) for name in event_types]
+    return build_digest_payload(events, settings=settings)
+
+
+def _poster(monkeypatch: pytest.MonkeyPatch, outcome: int | Exception) -> list[str]:
+    calls: list[str] = []
+
+    async def fake_post(*, url: str, payload: dict, secret: str | None, timeout: float) -> int:
+        calls.append(url)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
+    return calls
+
+
+def test_backoff_doubles_up_to_the_cap_with_jitter_in_the_upper_half() -> None:
+    settings = Settings(
+        alert_delivery_backoff_base_seconds=5.0, alert_delivery_backoff_max_seconds=60.0
+    )
+    assert backoff_seconds(1, settings, rng=lambda: 1.0) == 5.0
+    assert backoff_seconds(3, settings, rng=lambda: 1.0) == 20.0
+    assert backoff_seconds(3, settings, rng=lambda: 0.0) == 10.0
+    assert backoff_seconds(10, settings, rng=lambda: 1.0) == 60.0
+
+
+def test_only_transient_failures_are_retryable() -> None:
+    assert AttemptResult(None, "ConnectError").retryable
+    assert AttemptResult(503, "HTTP 503").retryable
+    assert AttemptResult(429, "HTTP 429").retryable
+    assert not AttemptResult(404, "HTTP 404").retryable
+    assert not AttemptResult(200, None).retryable
+
+
+@pytest.mark.asyncio
+async def test_destinations_include_primary_webhook_and_extra_rows() -> None:
+    extra = SimpleNamespace(
+        id=uuid.uuid4(), name="oncall", url="https://oncall", secret="s", rate_limit=None
+    )
+    dispatcher = _dispatcher(FakeSession([extra]))
+
+    destinations = await dispatcher.destinations(None)
+
+    assert [d.key for d in destinations] == [PRIMARY_DESTINATION, str(extra.id)]
+    assert await dispatcher.get_destination(str(extra.id)) == destinations[1]
+
+
+@pytest.mark.asyncio
+async def test_deliver_asks_for_retry_then_dead_letters_at_max_attempts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _poster(monkeypatch, 503)
+    extra = SimpleNamespace(
+        id=uuid.uuid4(), name="oncall", url="https://oncall", secret=None, rate_limit=None
+    )
+    session, redis = FakeSession([extra]), FakeRedis()
+    dispatcher = _dispatcher(session, redis, alert_delivery_max_attempts=2)
+    dispatch_id = str(uuid.uuid4())
+    kwargs: dict[str, Any] = {
+        "dispatch_id": dispatch_id,
+        "destination_key": str(extra.id),
+        "event_type": "ready_failed",
+        "payload": {"event": "ready_failed"},
+    }
+
+    assert await dispatcher.deliver(**kwargs, attempt=1) == "retry"
+    assert await dispatcher.deliver(**kwargs, attempt=2) == "dead_lettered"
+
+    attempts = [row for row in session.added if isinstance(row, AlertDelivery)]
+    assert [(row.attempt, row.http_status, row.destination) for row in attempts] == [
+        (1, 503, "oncall"),
+        (2, 503, "oncall"),
+    ]
+    assert {row.dispatch_id for row in attempts} == {uuid.UUID(dispatch_id)}
+    [entry] = await dispatcher.list_dead_letters()
+    assert (entry["dispatch_id"], entry["attempts"]) == (dispatch_id, 2)
+
+
+@pytest.mark.asyncio
+async def test_permanent_failure_dead_letters_without_retrying(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _poster(monkeypatch, 410)
+    extra = SimpleNamespace(
+        id=uuid.uuid4(), name="oncall", url="https://oncall", secret=None, rate_limit=None
+    )
+    dispatcher = _dispatcher(FakeSession([extra]))
+
+    outcome = await dispatcher.deliver(
+        dispatch_id=str(uuid.uuid4()),
+        destination_key=str(extra.id),
+        event_type="beat_missing",
+        payload={},
+        attempt=1,
+    )
+
+    assert outcome == "dead_lettered"
+
+
+@pytest.mark.asyncio
+async def test_deleted_destination_is_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _poster(monkeypatch, 200)
+    outcome = await _dispatcher(FakeSession()).deliver(
+        dispatch_id=str(uuid.uuid4()),
+        destination_key=str(uuid.uuid4()),
+        event_type="beat_missing",
+        payload={},
+        attempt=1,
+    )
+
+    assert outcome == "dropped"
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_queued_dispatch_enqueues_one_task_per_destination(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.tasks.alerts import deliver_alert
+
+    calls = _poster(monkeypatch, 200)
+    enqueued: list[tuple[Any, ...]] = []
+    monkeypatch.setattr(deliver_alert, "delay", lambda *args: enqueued.append(args))
+    extra = SimpleNamespace(
+        id=uuid.uuid4(), name="oncall", url="https://oncall", secret=None, rate_limit=None
+    )
+    dispatcher = _dispatcher(FakeSession([extra]), alert_delivery_mode="queued")
+
+    await dispatcher.dispatch(await dispatcher.destinations(None), _payload("ready_failed"))
+
+    assert calls == []
+    assert [args[1] for args in enqueued] == [PRIMARY_DESTINATION, str(extra.id)]
+    assert len({args[0] for args in enqueued}) == 2
+
+
+@pytest.mark.asyncio
+async def test_inline_dispatch_posts_to_every_destination(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _poster(monkeypatch, ConnectionError("refused"))
+    extra = SimpleNamespace(
+        id=uuid.uuid4(), name="oncall", url="https://oncall", secret=None, rate_limit=None
+    )
+    session = FakeSession([extra])
+    dispatcher = _dispatcher(session, alert_delivery_mode="inline")
+
+    await dispatcher.dispatch(await dispatcher.destinations(None), _payload("ready_failed"))
+
+    assert sorted(calls) == ["https://example.com/hook", "https://oncall"]
+    assert [row.error for row in session.added] == ["ConnectionError: refused"] * 2
+
+
+@pytest.mark.asyncio
+async def test_requeue_moves_a_dead_letter_back_onto_the_queue(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.tasks.alerts import deliver_alert
+
+    enqueued: list[tuple[Any, ...]] = []
+    monkeypatch.setattr(deliver_alert, "delay", lambda *args: enqueued.append(args))
+    redis = FakeRedis()
+    entry = {
+        "dispatch_id": "d-1",
+        "destination": PRIMARY_DESTINATION,
+        "event_type": "beat_missing",
+        "payload": {"event": "beat_missing"},
+    }
+    redis.lists[ALERT_DEAD_LETTER_KEY] = [json.dumps(entry)]
+    dispatcher = _dispatcher(FakeSession(), redis)
+
+    assert await dispatcher.requeue("d-1")
+    assert not await dispatcher.requeue("d-1")
+    assert enqueued == [("d-1", PRIMARY_DESTINATION, "beat_missing", {"event": "beat_missing"})]
+    assert redis.lists[ALERT_DEAD_LETTER_KEY] == []
+
+
+@pytest.mark.asyncio
+async def test_rate_cap_holds_back_notifications_and_reports_them_on_the_next_send(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sent: list[dict[str, Any]] = []
+
+    async def fake_post(*, url: str, payload: dict, secret: str | None, timeout: float) -> int:
+        sent.append(payload)
+        return 200
+
+    monkeypatch.setattr("app.services.alert_dispatch.post_webhook", fake_post)
+    redis = FakeRedis()
+    dispatcher = _dispatcher(
+        FakeSession(), redis, alert_delivery_mode="inline", alert_destination_rate_limit=1
+    )
+    [primary] = await dispatcher.destinations(None)
+
+    await dispatcher.dispatch([primary], _payload("ready_failed"))
+    await dispatcher.dispatch([primary], _payload("beat_missing", "workers_missing"))
+
+    assert len(sent) == 1
+    assert redis.values[f"{ALERT_SUPPRESSED_PREFIX}{PRIMARY_DESTINATION}"] == "2"
+
+    dispatcher.rate_limiter = FakeRateLimiter()  # type: ignore[assignment]
+    await dispatcher.dispatch([primary], _payload("ready_recovered"))
+
+    assert sent[-1]["suppressed_events"] == 2
+    assert f"{ALERT_SUPPRESSED_PREFIX}{PRIMARY_DESTINATION}" not in redis.values
+
+
+@pytest.mark.asyncio
+async def test_destination_rate_limit_overrides_the_global_cap(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = _poster(monkeypatch, 200)
+    unlimited = SimpleNamespace(
+        id=uuid.uuid4(), name="oncall", url="https://oncall", secret=None, rate_limit=0
+    )
+    dispatcher = _dispatcher(
+        FakeSession([unlimited]), alert_delivery_mode="inline", alert_destination_rate_limit=1
+    )
+    destinations = await dispatcher.destinations(None)
+
+    for _ in range(3):
+        await dispatcher.dispatch(destinations, _payload("ready_failed"))
+
+    assert calls.count("https://oncall") == 3
+    assert calls.count("https://example.com/hook") == 1
@@ -0,0 +1,93 @@
+from typing import Any
+
+import pytest
+
+from app.cache.redis import close_redis_pool, get_redis_client, init_redis_pool
+from app.core.alert_keys import ALERT_GROUP_OPENED_KEY
+from app.core.config import Settings
+from app.services.alert_dispatch import PRIMARY_DESTINATION, Destination
+from app.services.alert_grouping import AlertGrouper
+from app.services.alert_monitor import AlertMonitorService
+from app.services.alert_webhook import DIGEST_EVENT, build_alert_payload
+
+
+@pytest.fixture
+async def redis_client(test_settings: Settings):
+    await init_redis_pool(test_settings)
+    client = get_redis_client()
+    await client.flushdb()
+    yield client
+    await close_redis_pool()
+
+
+def _event(name: str) -> dict[str, Any]:
+    return build_alert_payload(event_type=name, settings=Settings())
+
+
+@pytest.mark.asyncio
+async def test_zero_window_passes_events_through_without_redis() -> None:
+    grouper = AlertGrouper(None, Settings(alert_group_window_seconds=0))  # type: ignore[arg-type]
+    events = [_event("ready_failed")]
+
+    assert await grouper.add(events) == events
+
+
+@pytest.mark.asyncio
+async def test_group_is_held_until_its_window_closes(redis_client) -> None:
+    grouper = AlertGrouper(redis_client, Settings(alert_group_window_seconds=60))
+
+    assert await grouper.add([_event("ready_failed")]) == []
+    assert await grouper.add([_event("beat_missing")]) == []
+
+    await redis_client.set(ALERT_GROUP_OPENED_KEY, 0)
+    flushed = await grouper.add([])
+
+    assert [event["event"] for event in flushed] == ["ready_failed", "beat_missing"]
+    assert await grouper.add([]) == []
+
+
+def _monitor(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings, dispatched: list[dict[str, Any]]
+) -> AlertMonitorService:
+    async def fake_dispatch(_self: Any, _destinations: Any, payload: dict[str, Any]) -> None:
+        dispatched.append(payload)
+
+    monkeypatch.setattr("app.services.alert_dispatch.AlertDispatcher.dispatch", fake_dispatch)
+    service = AlertMonitorService(None, None, settings)  # type: ignore[arg-type]
+    service._destinations = [Destination(PRIMARY_DESTINATION, PRIMARY_DESTINATION, "u", None)]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_monitor_without_a_window_sends_each_alert_on_its_own(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dispatched: list[dict[str, Any]] = []
+    service = _monitor(monkeypatch, Settings(alert_group_window_seconds=0), dispatched)
+
+    service._events = [_event("ready_failed"), _event("beat_missing")]
+    await service._flush()
+
+    assert [payload["event"] for payload in dispatched] == ["ready_failed", "beat_missing"]
+    assert all("occurrences" not in payload for payload in dispatched)
+
+
+@pytest.mark.asyncio
+async def test_monitor_sends_one_digest_per_flushed_group(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dispatched: list[dict[str, Any]] = []
+    service = _monitor(monkeypatch, Settings(alert_group_window_seconds=60), dispatched)
+    flushed = [_event("ready_failed"), _event("beat_missing")]
+
+    async def fake_add(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return flushed if events else []
+
+    monkeypatch.setattr(service.grouper, "add", fake_add)
+
+    service._events = [_event("ready_failed")]
+    await service._flush()
+    await service._flush()
+
+    assert [payload["event"] for payload in dispatched] == [DIGEST_EVENT]
+    assert len(dispatched[0]["details"]["events"]) == 2
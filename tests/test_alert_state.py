@@ -0,0 +1,191 @@
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from redis.exceptions import WatchError
+
+from app.core.alert_keys import (
+    ALERT_STATE_HISTORY_KEY,
+    ALERT_STATE_KEY,
+    LEGACY_ALERT_STATE_KEYS,
+)
+from app.core.config import Settings
+from app.services.alert_state import AlertStateStore, Transition, evaluate
+from app.services.health_probes import HealthSnapshot
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+HEALTHY = HealthSnapshot(database="ok", redis="ok", beat="ok", worker_count=1)
+
+
+def _evaluate(state: dict[str, str], snapshot: HealthSnapshot, **overrides: Any) -> Transition:
+    settings = Settings(**overrides)
+    return evaluate(state, snapshot, settings=settings, recovery_enabled=True, now=NOW)
+
+
+class FakePipeline:
+    """Records one WATCH / HGETALL / MULTI ... EXEC cycle against FakeRedis."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    async def watch(self, _key: str) -> None:
+        self.redis.round_trips += 1
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        self.redis.round_trips += 1
+        return dict(self.redis.hashes.get(key, {}))
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self.redis.round_trips += 1
+        return [self.redis.values.get(key) for key in keys]
+
+    def multi(self) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+    async def execute(self) -> None:
+        self.redis.round_trips += 1
+        if self.redis.conflict:
+            raise WatchError
+        for name, args, kwargs in self.ops:
+            getattr(self.redis, name)(*args, **kwargs)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.values: dict[str, str] = {}
+        self.round_trips = 0
+        self.conflict = False
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def hset(self, key: str, mapping: dict[str, str]) -> None:
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hdel(self, key: str, *fields: str) -> None:
+        for name in fields:
+            self.hashes.get(key, {}).pop(name, None)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def lpush(self, key: str, *values: str) -> None:
+        for value in values:
+            self.lists.setdefault(key, []).insert(0, value)
+
+    def ltrim(self, key: str, start: int, stop: int) -> None:
+        self.lists[key] = self.lists.get(key, [])[start : stop + 1]
+
+
+def test_first_healthy_check_sets_a_baseline_without_history() -> None:
+    result = _evaluate({}, HEALTHY)
+
+    assert result.updates["ready"] == "ok"
+    assert result.changes == []
+    assert result.alerts == []
+
+
+def test_failure_alerts_once_per_dedupe_window_and_recovery_always_alerts() -> None:
+    failed = HealthSnapshot(database="error", redis="ok", beat="ok", worker_count=1)
+
+    first = _evaluate({"ready": "ok", "beat": "ok"}, failed, alert_dedupe_seconds=300)
+    assert [event for event, _details in first.alerts] == ["ready_failed"]
+    assert [(c.check, c.previous, c.current) for c in first.changes] == [("ready", "ok", "failed")]
+
+    state = {"ready": "failed", "beat": "ok", **first.updates}
+    assert _evaluate(state, failed).alerts == []
+
+    recovered = _evaluate(state, HEALTHY)
+    assert [event for event, _details in recovered.alerts] == ["ready_recovered"]
+    assert recovered.changes[0].current == "ok"
+
+
+def test_workers_alert_only_after_the_zero_duration() -> None:
+    no_workers = HealthSnapshot(database="ok", redis="ok", beat="ok", worker_count=0)
+    overrides = {"alert_worker_zero_enabled": True, "alert_worker_zero_duration_seconds": 60}
+
+    started = _evaluate({"workers": "ok"}, no_workers, **overrides)
+    assert started.alerts == []
+    assert "workers:zero_since" in started.updates
+
+    recent = {"workers": "ok", "workers:zero_since": str((NOW - timedelta(seconds=30)).timestamp())}
+    assert _evaluate(recent, no_workers, **overrides).alerts == []
+
+    stale = {"workers": "ok", "workers:zero_since": str((NOW - timedelta(seconds=90)).timestamp())}
+    assert [event for event, _ in _evaluate(stale, no_workers, **overrides).alerts] == [
+        "workers_missing"
+    ]
+
+    abandoned = {
+        "workers": "ok",
+        "workers:zero_since": str((NOW - timedelta(seconds=3600)).timestamp()),
+    }
+    restarted = _evaluate(abandoned, no_workers, **overrides)
+    assert restarted.alerts == []
+    assert restarted.updates["workers:zero_since"] == str(NOW.timestamp())
+
+    back = _evaluate({**stale, "workers": "missing"}, HEALTHY, **overrides)
+    assert back.removals == ["workers:zero_since"]
+    assert [event for event, _ in back.alerts] == ["workers_recovered"]
+
+
+@pytest.mark.asyncio
+async def test_store_applies_a_check_in_three_round_trips_and_keeps_history() -> None:
+    redis = FakeRedis()
+    redis.hashes[ALERT_STATE_KEY] = {"ready": "ok", "beat": "ok"}
+    store = AlertStateStore(redis, Settings(alert_state_history_max_entries=10))  # type: ignore[arg-type]
+    down = HealthSnapshot(database="error", redis="ok", beat="stale", worker_count=1)
+
+    result = await store.transition(lambda state: _evaluate(dict(state), down))
+
+    assert result is not None
+    assert redis.round_trips == 3
+    assert redis.hashes[ALERT_STATE_KEY]["ready"] == "failed"
+    assert redis.hashes[ALERT_STATE_KEY]["beat"] == "missing"
+    history = [json.loads(item) for item in redis.lists[ALERT_STATE_HISTORY_KEY]]
+    assert {(h["check"], h["previous"], h["current"]) for h in history} == {
+        ("ready", "ok", "failed"),
+        ("beat", "ok", "missing"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_store_gives_up_when_another_check_changed_the_state() -> None:
+    redis = FakeRedis()
+    redis.conflict = True
+    store = AlertStateStore(redis, Settings())  # type: ignore[arg-type]
+
+    assert await store.transition(lambda state: _evaluate(dict(state), HEALTHY)) is None
+    assert ALERT_STATE_KEY not in redis.hashes
+
+
+@pytest.mark.asyncio
+async def test_first_check_after_upgrade_carries_over_legacy_statuses() -> None:
+    redis = FakeRedis()
+    redis.values = {
+        LEGACY_ALERT_STATE_KEYS["ready"]: "failed",
+        LEGACY_ALERT_STATE_KEYS["beat"]: "ok",
+    }
+    store = AlertStateStore(redis, Settings())  # type: ignore[arg-type]
+
+    result = await store.transition(lambda state: _evaluate(dict(state), HEALTHY))
+
+    assert result is not None
+    assert [event for event, _ in result.alerts] == ["ready_recovered"]
+    assert redis.hashes[ALERT_STATE_KEY]["ready"] == "ok"
+    assert redis.hashes[ALERT_STATE_KEY]["beat"] == "ok"
+    assert redis.values == {}
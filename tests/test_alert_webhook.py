@@ -4,7 +4,13 @@ import hmac
 import pytest
 
 from app.core.config import Settings
-from app.services.alert_webhook import build_alert_payload, sign_payload, validate_webhook_url
+from app.services.alert_webhook import (
+    DIGEST_EVENT,
+    build_alert_payload,
+    build_digest_payload,
+    sign_payload,
+    validate_webhook_url,
+)
 
 
 @pytest.mark.parametrize(
@@ -56,3 +62,28 @@ def test_build_alert_payload_includes_event_metadata() -> None:
     assert payload["summary"] == "Service readiness check failed"
     assert payload["details"] == {"database": "error"}
     assert payload["timestamp"]
+
+
+def test_digest_keeps_a_single_event_as_is() -> None:
+    settings = Settings(environment="test")
+    event = build_alert_payload(event_type="beat_missing", settings=settings)
+
+    assert build_digest_payload([event], settings=settings) is event
+
+
+def test_digest_collapses_repeats_in_order_of_first_appearance() -> None:
+    settings = Settings(environment="test")
+    events = [
+        build_alert_payload(event_type=name, settings=settings, details={"n": n})
+        for n, name in enumerate(["ready_failed", "beat_missing", "ready_failed"])
+    ]
+
+    digest = build_digest_payload(events, settings=settings)
+
+    assert digest["event"] == DIGEST_EVENT
+    combined = digest["details"]["events"]
+    assert [(e["event"], e["occurrences"], e["details"]) for e in combined] == [
+        ("ready_failed", 2, {"n": 2}),
+        ("beat_missing", 1, {"n": 1}),
+    ]
+    assert digest["summary"].startswith("2 alerts: ")
@@ -0,0 +1,146 @@
+import csv
+import gzip
+import io
+import json
+import sys
+import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from app.core.config import Settings
+from app.core.exceptions import AppException
+from app.services.admin_audit import AdminAuditService
+from app.services.audit_export import COLUMNAR_UNAVAILABLE_CODE, EXPORT_HEADER, ExportFormat
+
+START = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+def _rows(count: int) -> list[tuple[Any, ...]]:
+    return [
+        (
+            START - timedelta(seconds=i),
+            "user.update",
+            uuid.UUID(int=i + 1) if i % 2 else None,
+            "user",
+            str(i),
+            "10.0.0.1",
+            f"req-{i}",
+            {"changes": {"is_active": [True, False]}, "n": i} if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def _service(
+    monkeypatch: pytest.MonkeyPatch, rows: list[tuple[Any, ...]], **overrides: Any
+) -> AdminAuditService:
+    values: dict[str, Any] = {
+        "environment": "test",
+        "database_url": "postgresql+asyncpg://unused",
+        "redis_url": "redis://unused",
+        "jwt_secret": "test-secret-key-for-jwt-signing-32chars",
+        "admin_audit_export_chunk_bytes": 1024,
+    }
+    values.update(overrides)
+    service = AdminAuditService(None, Settings(**values))  # type: ignore[arg-type]
+
+    async def batches(**_kwargs: Any) -> AsyncIterator[Sequence[Any]]:
+        for offset in range(0, len(rows), 40):
+            yield rows[offset : offset + 40]
+
+    monkeypatch.setattr(service.logs, "iter_export_batches", batches)
+    return service
+
+
+async def _export(service: AdminAuditService, fmt: ExportFormat, **kwargs: Any) -> bytes:
+    return b"".join([chunk async for chunk in service.export(fmt=fmt, **kwargs)])
+
+
+def _expected(row: tuple[Any, ...]) -> dict[str, Any]:
+    record = dict(zip(EXPORT_HEADER, row, strict=True))
+    record["actor_id"] = str(record["actor_id"]) if record["actor_id"] else None
+    return record
+
+
+async def test_csv_round_trip_keeps_detail_as_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = _rows(100)
+    body = await _export(_service(monkeypatch, rows), "csv")
+
+    parsed = list(csv.DictReader(io.StringIO(body.decode())))
+    assert len(parsed) == len(rows)
+    for line, row in zip(parsed, rows, strict=True):
+        expected = _expected(row)
+        assert datetime.fromisoformat(line["created_at"]) == expected["created_at"]
+        assert (line["actor_id"] or None) == expected["actor_id"]
+        assert (json.loads(line["detail"]) if line["detail"] else None) == expected["detail"]
+
+
+async def test_ndjson_round_trip(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = _rows(100)
+    body = await _export(_service(monkeypatch, rows), "ndjson")
+
+    records = [json.loads(line) for line in body.decode().splitlines()]
+    assert len(records) == len(rows)
+    for record, row in zip(records, rows, strict=True):
+        expected = _expected(row)
+        expected["created_at"] = expected["created_at"].isoformat()
+        assert record == expected
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+async def test_gzip_stream_decompresses_to_plain_export(
+    monkeypatch: pytest.MonkeyPatch, fmt: ExportFormat
+) -> None:
+    rows = _rows(200)
+    plain = await _export(_service(monkeypatch, rows), fmt)
+    chunks = [c async for c in _service(monkeypatch, rows).export(fmt=fmt, gzip=True)]
+
+    assert len(chunks) > 1
+    assert gzip.decompress(b"".join(chunks)) == plain
+    # Every chunk boundary is a sync flush, so a prefix already decodes.
+    prefix = gzip.GzipFile(fileobj=io.BytesIO(b"".join(chunks[:2]))).read1()
+    assert plain.startswith(prefix)
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+async def test_columnar_round_trip(monkeypatch: pytest.MonkeyPatch, fmt: ExportFormat) -> None:
+    pa = pytest.importorskip("pyarrow")
+    rows = _rows(100)
+    body = await _export(_service(monkeypatch, rows), fmt)
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(pa.BufferReader(body))
+        assert parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+    else:
+        table = pa.ipc.open_stream(body).read_all()
+
+    assert table.column_names == EXPORT_HEADER
+    for record, row in zip(table.to_pylist(), rows, strict=True):
+        expected = _expected(row)
+        assert record["created_at"] == expected["created_at"]
+        assert record["actor_id"] == expected["actor_id"]
+        assert (json.loads(record["detail"]) if record["detail"] else None) == expected["detail"]
+
+
+async def test_columnar_export_without_pyarrow_fails_before_streaming(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    service = _service(monkeypatch, _rows(1))
+
+    with pytest.raises(AppException) as exc_info:
+        service.export(fmt="parquet")
+    assert exc_info.value.code == COLUMNAR_UNAVAILABLE_CODE
+    assert exc_info.value.status_code == 501
+
+
+async def test_gzip_rejected_for_columnar_formats(monkeypatch: pytest.MonkeyPatch) -> None:
+    with pytest.raises(AppException) as exc_info:
+        _service(monkeypatch, []).export(fmt="arrow", gzip=True)
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,72 @@
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.db.partitions import add_months, audit_log_partitions
+
+
+@pytest.mark.parametrize(
+    ("start", "months", "expected"),
+    [
+        (date(2026, 1, 15), 1, date(2026, 2, 1)),
+        (date(2026, 11, 1), 3, date(2027, 2, 1)),
+        (date(2026, 3, 31), -3, date(2025, 12, 1)),
+        (date(2026, 1, 1), -12, date(2025, 1, 1)),
+    ],
+)
+def test_add_months(start: date, months: int, expected: date) -> None:
+    assert add_months(start, months) == expected
+
+
+def test_partition_naming() -> None:
+    partition = audit_log_partitions.partition_for(date(2026, 12, 9))
+    assert partition.name == "audit_logs_p2026_12"
+    assert (partition.start, partition.end) == (date(2026, 12, 1), date(2027, 1, 1))
+
+
+@pytest.mark.asyncio
+async def test_maintenance_creates_months_and_moves_stranded_rows(db_engine) -> None:
+    async with db_engine.begin() as conn:
+        assert await audit_log_partitions.is_partitioned(conn)
+        # Lands in the default partition: no monthly partition exists yet.
+        await conn.execute(
+            text(
+                "INSERT INTO audit_logs (id, action, resource_type, created_at)"
+                " VALUES (gen_random_uuid(), 'partition.test', 'system', :at)"
+            ),
+            {"at": datetime(2026, 5, 20, tzinfo=UTC)},
+        )
+
+        created = await audit_log_partitions.ensure_months(
+            conn, months_ahead=2, today=date(2026, 5, 3)
+        )
+        assert created == ["audit_logs_p2026_05", "audit_logs_p2026_06", "audit_logs_p2026_07"]
+        assert (
+            await audit_log_partitions.ensure_months(conn, months_ahead=2, today=date(2026, 5, 3))
+            == []
+        )
+        in_may = await conn.scalar(text("SELECT count(*) FROM audit_logs_p2026_05"))
+        in_default = await conn.scalar(text("SELECT count(*) FROM audit_logs_default"))
+        assert (in_may, in_default) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_retention_detaches_or_drops_expired_months(db_engine) -> None:
+    async with db_engine.begin() as conn:
+        await audit_log_partitions.ensure_months(conn, months_ahead=3, today=date(2026, 1, 1))
+
+        detached = await audit_log_partitions.apply_retention(
+            conn, keep_months=1, action="detach", today=date(2026, 3, 10)
+        )
+        assert detached == ["audit_logs_p2026_01"]
+        assert await conn.scalar(text("SELECT to_regclass('audit_logs_p2026_01') IS NOT NULL"))
+
+        dropped = await audit_log_partitions.apply_retention(
+            conn, keep_months=0, action="drop", today=date(2026, 3, 10)
+        )
+        assert dropped == ["audit_logs_p2026_02"]
+        assert not await conn.scalar(text("SELECT to_regclass('audit_logs_p2026_02') IS NOT NULL"))
+        remaining = [p.name for p in await audit_log_partitions.partitions(conn)]
+        assert remaining == ["audit_logs_p2026_03", "audit_logs_p2026_04"]
+        await conn.execute(text("DROP TABLE audit_logs_p2026_01"))
@@ -0,0 +1,105 @@
+"""EXPLAIN regression harness for the admin audit queries.
+
+Runs each repository call against the test database, captures the SQL it sends and
+re-plans every audit_logs SELECT with sequential scans disabled. A query that still
+plans a Seq Scan on an audit_logs partition has no usable index, so the test fails.
+"""
+
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.repositories.audit_log import AuditLogRepository
+from app.repositories.pagination import Cursor
+
+UNTIL = datetime(2026, 6, 1, tzinfo=UTC)
+SINCE = UNTIL - timedelta(days=30)
+
+
+@asynccontextmanager
+async def captured_selects(engine: AsyncEngine) -> AsyncIterator[list[tuple[str, Any]]]:
+    statements: list[tuple[str, Any]] = []
+
+    def capture(_conn: Any, _cursor: Any, statement: str, parameters: Any, *_args: Any) -> None:
+        if statement.lstrip().upper().startswith("SELECT") and "FROM audit_logs" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+def seq_scans(plan: dict[str, Any]) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name", "").startswith(
+        "audit_logs"
+    ):
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def assert_index_only_plans(
+    engine: AsyncEngine, call: Callable[[AuditLogRepository], Awaitable[Any]]
+) -> None:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with captured_selects(engine) as statements:
+        async with session_factory() as session:
+            await call(AuditLogRepository(session))
+    assert statements, "no audit_logs query was captured"
+
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar_one()[0]["Plan"]
+            assert not seq_scans(plan), f"sequential scan in plan for:\n{statement}"
+
+
+async def _drain_export(repo: AuditLogRepository, **filters: Any) -> None:
+    async for _batch in repo.iter_export_batches(batch_size=10, **filters):
+        pass
+
+
+CALLS: dict[str, Callable[[AuditLogRepository], Awaitable[Any]]] = {
+    "page_by_action": lambda repo: repo.list_paginated(action="user.update", since=SINCE),
+    "page_by_actor": lambda repo: repo.list_paginated(actor_id=uuid.uuid4()),
+    "page_by_resource_type": lambda repo: repo.list_paginated(resource_type="user"),
+    "cursor_page": lambda repo: repo.list_after(
+        cursor=Cursor(UNTIL, uuid.uuid4()), action="user.update"
+    ),
+    "user_timeline": lambda repo: repo.list_for_user(user_id=uuid.uuid4()),
+    "export_by_action": lambda repo: _drain_export(repo, action="user.update", until=UNTIL),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", sorted(CALLS))
+async def test_audit_queries_use_indexes(db_engine: AsyncEngine, name: str) -> None:
+    await assert_index_only_plans(db_engine, CALLS[name])
+
+
+def test_seq_scan_detection_walks_nested_plans() -> None:
+    plan = {
+        "Node Type": "Limit",
+        "Plans": [
+            {
+                "Node Type": "Append",
+                "Plans": [
+                    {"Node Type": "Index Scan", "Relation Name": "audit_logs_p2026_05"},
+                    {"Node Type": "Seq Scan", "Relation Name": "audit_logs_default"},
+                    {"Node Type": "Seq Scan", "Relation Name": "users"},
+                ],
+            }
+        ],
+    }
+    assert seq_scans(plan) == ["audit_logs_default"]
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.audit_writer as audit_writer
+from app.services.audit import AuditService
+from app.services.audit_writer import AuditWriter
+
+
+class FakeSessionFactory:
+    """Records each bulk insert as the list of rows it carried."""
+
+    def __init__(self, *, failures: int = 0) -> None:
+        self.batches: list[list[dict[str, Any]]] = []
+        self.failures = failures
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator["FakeSessionFactory"]:
+        yield self
+
+    async def execute(self, _statement: Any, rows: list[dict[str, Any]]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append(list(rows))
+
+    async def commit(self) -> None:
+        pass
+
+
+def _writer(factory: FakeSessionFactory, **kwargs: Any) -> AuditWriter:
+    options: dict[str, Any] = {"max_batch": 3, "max_latency_seconds": 0.05}
+    options.update(kwargs)
+    return AuditWriter(factory, **options)  # type: ignore[arg-type]
+
+
+async def test_writer_flushes_full_batches_without_waiting() -> None:
+    factory = FakeSessionFactory()
+    writer = _writer(factory, max_latency_seconds=10)
+    writer.start()
+    for i in range(6):
+        writer.submit({"n": i})
+
+    await asyncio.sleep(0.01)
+    assert [len(batch) for batch in factory.batches] == [3, 3]
+    await writer.close()
+
+
+async def test_writer_flushes_partial_batch_after_max_latency() -> None:
+    factory = FakeSessionFactory()
+    writer = _writer(factory)
+    writer.start()
+    writer.submit({"n": 1})
+
+    await asyncio.sleep(0.01)
+    assert factory.batches == []
+    await asyncio.sleep(0.1)
+    assert factory.batches == [[{"n": 1}]]
+    await writer.close()
+
+
+async def test_writer_close_drains_pending_events() -> None:
+    factory = FakeSessionFactory()
+    writer = _writer(factory, max_latency_seconds=10)
+    writer.start()
+    for i in range(4):
+        writer.submit({"n": i})
+
+    await writer.close()
+    assert [row["n"] for batch in factory.batches for row in batch] == [0, 1, 2, 3]
+
+
+async def _no_sleep(_seconds: float) -> None:
+    return None
+
+
+async def test_writer_retries_failed_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(audit_writer.asyncio, "sleep", _no_sleep)
+    factory = FakeSessionFactory(failures=2)
+    writer = _writer(factory)
+    writer.start()
+    writer.submit({"n": 1})
+
+    await writer.close()
+    assert factory.batches == [[{"n": 1}]]
+
+
+def test_writer_refuses_sync_actions_and_overflow() -> None:
+    writer = _writer(FakeSessionFactory(), max_pending=1, sync_actions=frozenset({"user.update"}))
+    assert not writer.accepts("alert.test_send")  # not started
+
+    writer._task = object()  # type: ignore[assignment]
+    assert writer.accepts("alert.test_send")
+    assert not writer.accepts("user.update")
+    writer.submit({"n": 1})
+    assert not writer.accepts("alert.test_send")
+
+
+async def test_buffered_events_are_submitted_only_on_commit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    factory = FakeSessionFactory()
+    writer = _writer(factory)
+    writer._task = object()  # type: ignore[assignment]
+    monkeypatch.setattr(audit_writer, "_audit_writer", writer)
+
+    async with AsyncSession() as session:
+        await session.begin()
+        assert (
+            await AuditService(session).record(
+                actor_id=None, action="alert.test_send", resource_type="alert"
+            )
+            is None
+        )
+        await session.rollback()
+        assert writer.pending == 0
+
+        await session.begin()
+        await AuditService(session).record(
+            actor_id=None, action="alert.test_send", resource_type="alert"
+        )
+        assert writer.pending == 0
+        await session.commit()
+        assert writer.pending == 1
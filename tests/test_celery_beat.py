@@ -15,6 +15,17 @@ def test_beat_schedule_entries() -> None:
     assert schedule["heartbeat"]["schedule"] == 120
     assert schedule["ping-redis-hourly"]["schedule"] == crontab(minute=0)
     assert schedule["nightly-maintenance"]["schedule"] == crontab(hour=3, minute=0)
+    assert schedule["dashboard-snapshot-refresh"]["schedule"] == 60
+
+
+def test_dashboard_refresh_can_be_left_to_readers() -> None:
+    schedule = _beat_schedule(
+        Settings(
+            admin_dashboard_refresh_interval_seconds=0,
+            jwt_secret="test-secret-key-for-jwt-signing-32chars",
+        )
+    )
+    assert "dashboard-snapshot-refresh" not in schedule
 
 
 def test_beat_schedule_file_under_logs() -> None:
@@ -26,6 +37,7 @@ def test_scheduled_tasks_registered() -> None:
     assert "app.tasks.scheduled.ping_redis" in celery_app.tasks
     assert "app.tasks.scheduled.nightly_maintenance" in celery_app.tasks
     assert "app.tasks.scheduled.check_and_send_alerts" in celery_app.tasks
+    assert "app.tasks.scheduled.refresh_dashboard_snapshot" in celery_app.tasks
 
 
 def test_heartbeat_task() -> None:
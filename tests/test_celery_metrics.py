@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from prometheus_client import CollectorRegistry
+
+from app.core.celery_keys import CELERY_TASK_METRICS_PREFIX
+from app.services.celery_metrics import CeleryMetricsCollector, parse_histogram
+from app.tasks import instrumentation
+from app.tasks.instrumentation import (
+    ENQUEUED_AT_HEADER,
+    bucket_label,
+    record_task_timer,
+    record_task_timing,
+    stamp_enqueued_at,
+    start_task_timer,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any) -> "FakePipeline":
+            self.calls.append((name, args))
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.lists: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def sadd(self, key: str, member: str) -> None:
+        self.sets.setdefault(key, set()).add(member)
+
+    def smembers(self, key: str) -> set[str]:
+        return self.sets.get(key, set())
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        row = self.hashes.setdefault(key, {})
+        row[field] = str(int(row.get(field, 0)) + amount)
+
+    def hincrbyfloat(self, key: str, field: str, amount: float) -> None:
+        row = self.hashes.setdefault(key, {})
+        row[field] = str(float(row.get(field, 0)) + amount)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return self.hashes.get(key, {})
+
+    def llen(self, key: str) -> int:
+        return self.lists.get(key, 0)
+
+
+def test_bucket_label_picks_smallest_bound() -> None:
+    assert bucket_label(0.0) == "0.01"
+    assert bucket_label(0.3) == "0.5"
+    assert bucket_label(10_000) == "+Inf"
+
+
+def test_histogram_is_cumulative_with_bucket_quantiles() -> None:
+    redis = FakeRedis()
+    for runtime in (0.02, 0.02, 0.02, 3.0):
+        record_task_timing(redis, "app.tasks.x", wait=None, runtime=runtime)  # type: ignore[arg-type]
+
+    fields = redis.hashes[f"{CELERY_TASK_METRICS_PREFIX}app.tasks.x"]
+    runtime = parse_histogram(fields, "runtime")
+    assert dict(runtime.buckets)["0.05"] == 3
+    assert dict(runtime.buckets)["+Inf"] == 4
+    assert runtime.count == 4
+    assert runtime.quantile(0.5) == 0.05
+    assert runtime.quantile(0.95) == 5.0
+    assert parse_histogram(fields, "wait").count == 0
+
+
+def test_signals_record_queue_wait_and_runtime() -> None:
+    headers: dict[str, Any] = {}
+    stamp_enqueued_at(headers=headers)
+    task = SimpleNamespace(
+        name="app.tasks.example.add",
+        request=SimpleNamespace(eta=None, **{ENQUEUED_AT_HEADER: headers[ENQUEUED_AT_HEADER] - 2}),
+    )
+    redis = FakeRedis()
+
+    with patch.object(instrumentation, "_redis", return_value=redis):
+        start_task_timer(task_id="t1", task=task)
+        record_task_timer(task_id="t1", task=task)
+
+    fields = redis.hashes[f"{CELERY_TASK_METRICS_PREFIX}app.tasks.example.add"]
+    wait = parse_histogram(fields, "wait")
+    assert wait.count == 1
+    assert 2.0 <= wait.sum < 3.0
+    assert parse_histogram(fields, "runtime").count == 1
+    assert "t1" not in instrumentation._started
+
+
+def test_eta_tasks_record_runtime_only() -> None:
+    task = SimpleNamespace(
+        name="app.tasks.example.add",
+        request=SimpleNamespace(eta="2099-01-01T00:00:00+00:00", **{ENQUEUED_AT_HEADER: 1.0}),
+    )
+    redis = FakeRedis()
+
+    with patch.object(instrumentation, "_redis", return_value=redis):
+        start_task_timer(task_id="t2", task=task)
+        record_task_timer(task_id="t2", task=task)
+
+    fields = redis.hashes[f"{CELERY_TASK_METRICS_PREFIX}app.tasks.example.add"]
+    assert parse_histogram(fields, "wait").count == 0
+    assert parse_histogram(fields, "runtime").count == 1
+
+
+def test_collector_exports_queue_lengths_and_histograms() -> None:
+    redis = FakeRedis()
+    redis.lists["celery"] = 4
+    redis.lists["celery\x06\x163"] = 1
+    record_task_timing(redis, "app.tasks.x", wait=0.2, runtime=1.5)  # type: ignore[arg-type]
+    registry = CollectorRegistry()
+    registry.register(CeleryMetricsCollector(redis))  # type: ignore[arg-type]
+
+    assert registry.get_sample_value("celery_queue_length", {"queue": "celery"}) == 5
+    assert (
+        registry.get_sample_value(
+            "celery_task_queue_wait_seconds_bucket", {"task": "app.tasks.x", "le": "0.25"}
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value("celery_task_runtime_seconds_count", {"task": "app.tasks.x"}) == 1
+    )
@@ -0,0 +1,157 @@
+import json
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from app.core.celery_keys import CELERY_STATE_REDIS_KEY
+from app.core.config import Settings
+from app.schemas.admin import CeleryOverview
+from app.services.admin_celery import AdminCeleryService
+from app.services.celery_state import CeleryStateAggregator, _task_args
+from app.tasks.celery_app import celery_app
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+
+
+class FakeAsyncRedis:
+    def __init__(self, values: dict[str, str]) -> None:
+        self.values = values
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+
+_clock = 0
+
+
+def _event(type_: str, **fields: Any) -> dict[str, Any]:
+    global _clock
+    _clock += 1
+    now = time.time()
+    return {"type": type_, "timestamp": now, "local_received": now, "clock": _clock, **fields}
+
+
+def _heartbeat(hostname: str, **fields: Any) -> dict[str, Any]:
+    return _event("worker-heartbeat", hostname=hostname, freq=2.0, **fields)
+
+
+def _aggregator(redis: FakeRedis) -> CeleryStateAggregator:
+    return CeleryStateAggregator(
+        celery_app,
+        redis,  # type: ignore[arg-type]
+        Settings(celery_state_publish_interval_seconds=0),
+    )
+
+
+def test_task_args_parses_event_repr() -> None:
+    assert _task_args("(1, 'a')") == [1, "a"]
+    assert _task_args("[2]") == [2]
+    assert _task_args("<object at 0x1>") == ["<object at 0x1>"]
+    assert _task_args(None) == []
+
+
+def test_events_build_worker_and_task_state() -> None:
+    redis = FakeRedis()
+    aggregator = _aggregator(redis)
+
+    aggregator.on_event(_heartbeat("celery@w1", active=0, processed=7))
+    aggregator.on_event(
+        _event(
+            "task-received",
+            uuid="t1",
+            name="app.tasks.example.add",
+            args="(1, 2)",
+            hostname="celery@w1",
+        )
+    )
+    aggregator.on_event(
+        _event(
+            "task-received",
+            uuid="t2",
+            name="app.tasks.example.add",
+            args="()",
+            eta="2099-01-01T00:00:00+00:00",
+            hostname="celery@w1",
+        )
+    )
+    aggregator.on_event(
+        _event(
+            "task-received",
+            uuid="t3",
+            name="app.tasks.example.add",
+            args="()",
+            hostname="celery@w1",
+        )
+    )
+    aggregator.on_event(_event("task-started", uuid="t1", hostname="celery@w1"))
+
+    state = json.loads(redis.values[CELERY_STATE_REDIS_KEY])
+    assert state["workers"] == [
+        {"name": "celery@w1", "status": "online", "active_tasks": 1, "processed": 7}
+    ]
+    assert [task["task_id"] for task in state["active_tasks"]] == ["t1"]
+    assert state["active_tasks"][0]["args"] == [1, 2]
+    assert [task["task_id"] for task in state["scheduled_tasks"]] == ["t2"]
+    assert [task["task_id"] for task in state["reserved_tasks"]] == ["t3"]
+
+    aggregator.on_event(_event("task-succeeded", uuid="t1", hostname="celery@w1", runtime=0.1))
+    state = json.loads(redis.values[CELERY_STATE_REDIS_KEY])
+    assert state["active_tasks"] == []
+
+
+def test_offline_workers_and_their_tasks_are_dropped() -> None:
+    redis = FakeRedis()
+    aggregator = _aggregator(redis)
+    aggregator.on_event(_heartbeat("celery@w1"))
+    aggregator.on_event(_event("task-received", uuid="t1", name="x", hostname="celery@w1"))
+    aggregator.on_event(_event("worker-offline", hostname="celery@w1"))
+
+    state = json.loads(redis.values[CELERY_STATE_REDIS_KEY])
+    assert state["workers"] == []
+    assert state["reserved_tasks"] == []
+
+
+@pytest.mark.asyncio
+async def test_overview_reads_fresh_state_without_broadcast() -> None:
+    redis = FakeRedis()
+    _aggregator(redis).on_event(_heartbeat("celery@w1", active=0, processed=1))
+    service = AdminCeleryService(Settings(), FakeAsyncRedis(redis.values))  # type: ignore[arg-type]
+
+    with patch.object(AdminCeleryService, "_inspect_sync") as inspect_sync:
+        overview = await service.get_overview(include_metrics=False)
+
+    inspect_sync.assert_not_called()
+    assert overview.status == "ok"
+    assert [worker.name for worker in overview.workers] == ["celery@w1"]
+    assert overview.beat_schedule
+
+
+@pytest.mark.asyncio
+async def test_overview_falls_back_to_broadcast_when_state_is_stale() -> None:
+    state = {
+        "updated_at": time.time() - 60,
+        "workers": [],
+        "active_tasks": [],
+        "reserved_tasks": [],
+        "scheduled_tasks": [],
+    }
+    redis = FakeAsyncRedis({CELERY_STATE_REDIS_KEY: json.dumps(state)})
+    service = AdminCeleryService(
+        Settings(celery_state_max_age_seconds=10),
+        redis,  # type: ignore[arg-type]
+    )
+    broadcast = CeleryOverview(status="ok", workers=[], active_tasks=[], scheduled_tasks=[])
+
+    with patch.object(AdminCeleryService, "_inspect_sync", return_value=broadcast) as inspect_sync:
+        overview = await service.get_overview(include_metrics=False)
+
+    inspect_sync.assert_called_once()
+    assert overview.status == "ok"
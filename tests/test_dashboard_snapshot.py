@@ -0,0 +1,186 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from app.core.config import Settings
+from app.services import dashboard_snapshot
+from app.services.dashboard_snapshot import DashboardSnapshot
+
+
+class FakeLock:
+    def __init__(self, held: set[str], name: str) -> None:
+        self.held = held
+        self.name = name
+
+    async def acquire(self, blocking: bool = True, blocking_timeout: float | None = None) -> bool:
+        if self.name in self.held:
+            return False
+        self.held.add(self.name)
+        return True
+
+    async def release(self) -> None:
+        self.held.discard(self.name)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.held: set[str] = set()
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.values[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def lock(self, name: str, timeout: float | None = None) -> FakeLock:
+        return FakeLock(self.held, name)
+
+
+class FakeService:
+    def __init__(self) -> None:
+        self.computed: list[str] = []
+        self.user_count = 1
+
+    async def compute(self, component: str) -> Any:
+        self.computed.append(component)
+        return {
+            "users": {"user_count": self.user_count, "active_user_count": 1},
+            "services": {"database": "ok", "redis": "ok"},
+            "metrics": {"requests_total": 3.0},
+            "system": {"ready_status": "ok", "migration_at_head": True, "beat_status": "ok"},
+        }[component]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def _no_inflight_refreshes() -> None:
+    dashboard_snapshot._refreshing.clear()
+
+
+def _snapshot(redis: FakeRedis, background: FakeService, clock: Clock) -> DashboardSnapshot:
+    @asynccontextmanager
+    async def open_service() -> AsyncIterator[Any]:
+        yield background
+
+    settings = Settings(
+        admin_dashboard_users_ttl_seconds=60, admin_dashboard_metrics_ttl_seconds=15
+    )
+    return DashboardSnapshot(
+        redis,  # type: ignore[arg-type]
+        settings,
+        background=open_service,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fresh_snapshot_is_computed_once() -> None:
+    redis, request_service, clock = FakeRedis(), FakeService(), Clock()
+    snapshot = _snapshot(redis, FakeService(), clock)
+
+    first = await snapshot.get_stats(request_service)  # type: ignore[arg-type]
+    second = await snapshot.get_stats(request_service)  # type: ignore[arg-type]
+
+    assert first == second
+    assert first.user_count == 1
+    assert request_service.computed == ["users", "services", "metrics", "system"]
+
+
+@pytest.mark.asyncio
+async def test_stale_component_is_served_and_refreshed_in_background() -> None:
+    redis, request_service, background, clock = FakeRedis(), FakeService(), FakeService(), Clock()
+    snapshot = _snapshot(redis, background, clock)
+    await snapshot.get_stats(request_service)  # type: ignore[arg-type]
+
+    clock.now += 30  # past the metrics TTL, within the users TTL
+    background.user_count = 99
+    await snapshot.get_metrics_summary(request_service)  # type: ignore[arg-type]
+    await asyncio.gather(*dashboard_snapshot._refreshing.values())
+
+    assert request_service.computed == ["users", "services", "metrics", "system"]
+    assert background.computed == ["metrics"]
+
+    clock.now += 60
+    stale = await snapshot.get_stats(request_service)  # type: ignore[arg-type]
+    assert stale.user_count == 1
+    await asyncio.gather(*dashboard_snapshot._refreshing.values())
+    refreshed = await snapshot.get_stats(request_service)  # type: ignore[arg-type]
+    assert refreshed.user_count == 99
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_skipped_while_another_replica_holds_the_lock() -> None:
+    redis, request_service, background, clock = FakeRedis(), FakeService(), FakeService(), Clock()
+    snapshot = _snapshot(redis, background, clock)
+    await snapshot.get_metrics_summary(request_service)  # type: ignore[arg-type]
+
+    redis.held.add(snapshot._lock("metrics").name)
+    clock.now += 30
+    await snapshot.get_metrics_summary(request_service)  # type: ignore[arg-type]
+    await asyncio.gather(*dashboard_snapshot._refreshing.values())
+
+    assert background.computed == []
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_computes() -> None:
+    redis, request_service = FakeRedis(), FakeService()
+    snapshot = DashboardSnapshot(
+        redis,  # type: ignore[arg-type]
+        Settings(admin_dashboard_cache_enabled=False),
+    )
+    await snapshot.get_metrics_summary(request_service)  # type: ignore[arg-type]
+    await snapshot.get_metrics_summary(request_service)  # type: ignore[arg-type]
+
+    assert request_service.computed == ["metrics", "metrics"]
+    assert redis.values == {}
+
+
+@pytest.mark.asyncio
+async def test_scheduled_refresh_recomputes_only_expired_components() -> None:
+    redis, request_service, background, clock = FakeRedis(), FakeService(), FakeService(), Clock()
+    snapshot = _snapshot(redis, background, clock)
+    await snapshot.get_metrics_summary(request_service)  # type: ignore[arg-type]
+
+    assert await snapshot.refresh_expired() == ["users", "services", "system"]
+    clock.now += 30  # past the metrics TTL, within the users TTL
+    background.computed.clear()
+    assert await snapshot.refresh_expired() == ["services", "system"]
+    assert background.computed == ["services", "system"]
+
+    await snapshot.get_stats(request_service)  # type: ignore[arg-type]
+    assert request_service.computed == ["metrics"]
+    await asyncio.gather(*dashboard_snapshot._refreshing.values())
+    assert background.computed == ["services", "system", "metrics"]
+
+
+@pytest.mark.asyncio
+async def test_scheduled_refresh_never_touches_metrics() -> None:
+    redis, background, clock = FakeRedis(), FakeService(), Clock()
+    snapshot = _snapshot(redis, background, clock)
+
+    await snapshot.refresh_expired()
+    clock.now += 3600
+    await snapshot.refresh_expired()
+
+    assert "metrics" not in background.computed
+    assert snapshot._key("metrics") not in redis.values
+    assert dashboard_snapshot._refreshing == {}
@@ -4,6 +4,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.core.config import Settings, get_settings
+from app.core.exceptions import AppException
 from app.main import create_app
 
 
@@ -17,6 +18,15 @@ def error_app(test_settings: Settings):
     async def trigger_error() -> None:
         raise RuntimeError("boom")
 
+    @app.get("/test-app-error-headers")
+    async def trigger_app_error() -> None:
+        raise AppException(
+            "Range not satisfiable",
+            code=41601,
+            status_code=416,
+            headers={"Content-Range": "bytes */10"},
+        )
+
     yield app
     get_settings.cache_clear()
     app.dependency_overrides.clear()
@@ -48,3 +58,14 @@ async def test_unhandled_exception_is_logged(error_app, caplog: pytest.LogCaptur
 
     assert "unhandled_exception" in caplog.text
     assert "boom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_app_exception_headers_are_sent(error_app) -> None:
+    transport = ASGITransport(app=error_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/test-app-error-headers")
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */10"
+    assert response.json()["code"] == 41601
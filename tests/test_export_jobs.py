@@ -0,0 +1,165 @@
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from app.core.config import Settings
+from app.core.export_keys import EXPORT_JOB_PREFIX
+from app.repositories.counting import CountResult
+from app.services.export_jobs import STALE_JOB_ERROR, ExportJobService
+from app.tasks.exports import run_audit_export
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def hset(self, key: str, mapping: dict[str, str]) -> None:
+        self.redis.hashes.setdefault(key, {}).update(mapping)
+
+    def expire(self, _key: str, _seconds: int) -> None:
+        return None
+
+    async def execute(self) -> None:
+        return None
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.values: dict[str, str] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hget(self, key: str, name: str) -> str | None:
+        return self.hashes.get(key, {}).get(name)
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+        self.hashes.pop(key, None)
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.artifacts: dict[str, bytes] = {}
+
+    async def write(self, key: str, chunks: AsyncIterable[bytes]) -> int:
+        data = b"".join([chunk async for chunk in chunks])
+        self.artifacts[key] = data
+        return len(data)
+
+
+# Runs between the export's chunks, to act as another worker would meanwhile.
+_between_chunks: list[Callable[[], None]] = []
+
+
+@pytest.fixture
+def stub_export(monkeypatch: pytest.MonkeyPatch) -> None:
+    _between_chunks.clear()
+
+    async def count_matching(_self: Any, _counter: Any, **_filters: Any) -> CountResult:
+        return CountResult(value=2, estimated=True)
+
+    def export(_self: Any, *, on_rows: Any = None, **_kwargs: Any) -> AsyncIterator[bytes]:
+        async def stream() -> AsyncIterator[bytes]:
+            yield b"id,action\n"
+            for hook in _between_chunks:
+                hook()
+            if on_rows is not None:
+                on_rows(2)
+
+        return stream()
+
+    monkeypatch.setattr(
+        "app.services.export_jobs.AuditLogRepository.count_matching", count_matching
+    )
+    monkeypatch.setattr("app.services.export_jobs.AdminAuditService.export", export)
+
+
+def _abandon(redis: FakeRedis, job_id: str, seconds_ago: float) -> None:
+    """Leave the job as a worker that died mid-export would."""
+    heartbeat = datetime.now(UTC) - timedelta(seconds=seconds_ago)
+    redis.hashes[f"{EXPORT_JOB_PREFIX}{job_id}"].update(
+        {"status": "running", "rows": "1", "updated_at": heartbeat.isoformat()}
+    )
+
+
+@pytest.mark.asyncio
+async def test_running_job_with_recent_progress_is_reused_and_left_alone(stub_export) -> None:
+    redis = FakeRedis()
+    service = ExportJobService(redis, Settings(admin_export_stale_seconds=60))  # type: ignore[arg-type]
+    job, _ = await service.create(fmt="csv", gzip=False, filters={"action": "a"})
+    _abandon(redis, job.id, seconds_ago=5)
+
+    again, reused = await service.create(fmt="csv", gzip=False, filters={"action": "a"})
+    redelivered = await service.run(job.id, session=None, storage=FakeStorage())  # type: ignore[arg-type]
+
+    assert reused is True
+    assert again.id == job.id
+    assert redelivered.status == "running"
+
+
+@pytest.mark.asyncio
+async def test_stale_running_job_reads_failed_is_not_reused_and_run_takes_it_over(
+    stub_export,
+) -> None:
+    redis = FakeRedis()
+    storage = FakeStorage()
+    service = ExportJobService(redis, Settings(admin_export_stale_seconds=60))  # type: ignore[arg-type]
+    job, _ = await service.create(fmt="csv", gzip=False, filters={"action": "a"})
+    _abandon(redis, job.id, seconds_ago=120)
+
+    seen = await service.require(job.id)
+    assert seen.status == "failed"
+    assert seen.error == STALE_JOB_ERROR
+
+    fresh, reused = await service.create(fmt="csv", gzip=False, filters={"action": "a"})
+    assert reused is False
+    assert fresh.id != job.id
+
+    finished = await service.run(job.id, session=None, storage=storage)  # type: ignore[arg-type]
+    assert finished.status == "succeeded"
+    assert finished.rows == 2
+    assert storage.artifacts[finished.artifact_key] == b"id,action\n"
+    assert (await service.require(job.id)).status == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_run_that_was_taken_over_stops_without_storing_its_artifact(stub_export) -> None:
+    redis = FakeRedis()
+    storage = FakeStorage()
+    service = ExportJobService(redis, Settings())  # type: ignore[arg-type]
+    job, _ = await service.create(fmt="csv", gzip=False, filters={"action": "a"})
+    key = f"{EXPORT_JOB_PREFIX}{job.id}"
+    _between_chunks.append(lambda: redis.hashes[key].update({"owner": "successor"}))
+
+    result = await service.run(job.id, session=None, storage=storage)  # type: ignore[arg-type]
+
+    assert result.status == "running"
+    assert result.owner == "successor"
+    assert storage.artifacts == {}
+
+
+def test_export_task_is_redelivered_after_a_worker_dies() -> None:
+    assert run_audit_export.acks_late is True
+    assert run_audit_export.reject_on_worker_lost is True
@@ -0,0 +1,114 @@
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from app.services.export_jobs import ExportJob, dedupe_key, normalize_filters
+from app.services.export_storage import LocalExportStorage, RangeNotSatisfiable, parse_byte_range
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=0-1,5-9", None),
+        ("items=0-1", None),
+        ("bytes=9-5", None),
+    ],
+)
+def test_parse_byte_range(header: str | None, expected: tuple[int, int] | None) -> None:
+    assert parse_byte_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+def test_parse_byte_range_unsatisfiable(header: str) -> None:
+    with pytest.raises(RangeNotSatisfiable):
+        parse_byte_range(header, 1000)
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def test_local_storage_round_trip_and_ranges(tmp_path: Path) -> None:
+    storage = LocalExportStorage(tmp_path / "exports", chunk_bytes=4)
+
+    size = await storage.write("job.csv", _chunks(b"0123456789", b"abcdef"))
+
+    assert size == 16
+    assert await storage.size("job.csv") == 16
+    assert b"".join([c async for c in storage.read("job.csv", 0, 15)]) == b"0123456789abcdef"
+    assert b"".join([c async for c in storage.read("job.csv", 8, 11)]) == b"89ab"
+    await storage.delete("job.csv")
+    assert await storage.size("job.csv") is None
+
+
+async def test_local_storage_discards_partial_file_on_failure(tmp_path: Path) -> None:
+    storage = LocalExportStorage(tmp_path)
+
+    async def failing() -> AsyncIterator[bytes]:
+        yield b"partial"
+        raise RuntimeError("cursor lost")
+
+    with pytest.raises(RuntimeError):
+        await storage.write("job.csv", failing())
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_local_storage_rejects_path_keys(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        await LocalExportStorage(tmp_path).size("../secrets")
+
+
+async def test_local_storage_purges_old_artifacts(tmp_path: Path) -> None:
+    storage = LocalExportStorage(tmp_path)
+    await storage.write("old.csv", _chunks(b"x"))
+    await storage.write("new.csv", _chunks(b"y"))
+    stale = time.time() - 7200
+    os.utime(tmp_path / "old.csv", (stale, stale))
+
+    assert await storage.purge_older_than(3600) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["new.csv"]
+
+
+def test_dedupe_key_ignores_unset_filters() -> None:
+    since = datetime(2026, 3, 1, tzinfo=UTC)
+    a = normalize_filters({"action": "user.update", "actor_id": None, "since": since})
+    b = normalize_filters({"since": since, "resource_type": "", "action": "user.update"})
+
+    assert a == b == {"action": "user.update", "since": since.isoformat()}
+    assert dedupe_key("csv", False, a) == dedupe_key("csv", False, b)
+    assert dedupe_key("csv", True, a) != dedupe_key("csv", False, a)
+    assert dedupe_key("ndjson", False, a) != dedupe_key("csv", False, a)
+
+
+def test_export_job_mapping_round_trip() -> None:
+    actor = uuid.uuid4()
+    since = datetime(2026, 3, 1, tzinfo=UTC)
+    job = ExportJob(
+        id="abc",
+        format="ndjson",
+        gzip=True,
+        filters=normalize_filters({"actor_id": actor, "since": since}),
+        status="running",
+        rows=50,
+        total_estimate=200,
+    )
+
+    restored = ExportJob.from_mapping(job.to_mapping())
+
+    assert restored == job
+    assert restored.filter_kwargs() == {"actor_id": actor, "since": since}
+    assert restored.progress == 0.25
+    assert restored.filename == "audit-logs.ndjson.gz"
+    assert restored.media_type == "application/gzip"
@@ -0,0 +1,102 @@
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core import http_client as http_client_module
+from app.core.config import Settings
+from app.core.http_client import (
+    HttpClientRegistry,
+    build_client,
+    close_http_clients,
+    http_client,
+    start_http_clients,
+)
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_destination() -> None:
+    registry = HttpClientRegistry(Settings())
+
+    webhook = registry.get("webhook")
+    assert registry.get("webhook") is webhook
+    assert registry.get("loki") is not webhook
+
+    await registry.aclose()
+    assert webhook.is_closed
+
+
+@pytest.mark.asyncio
+async def test_http_client_uses_running_registry() -> None:
+    registry = start_http_clients(Settings())
+    try:
+        async with http_client("loki") as first, http_client("loki") as second:
+            assert first is second is registry.get("loki")
+    finally:
+        await close_http_clients()
+    assert http_client_module._registry is None
+
+
+@pytest.mark.asyncio
+async def test_http_client_without_registry_closes_one_off_client() -> None:
+    async with http_client("webhook", Settings()) as client:
+        pass
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_clients_record_destination_metrics() -> None:
+    def labels(status: str) -> dict[str, str]:
+        return {"destination": "webhook", "status": status}
+
+    before = REGISTRY.get_sample_value("http_client_requests_total", labels("5xx")) or 0
+    transport = httpx.MockTransport(lambda request: httpx.Response(503))
+
+    async with build_client("webhook", Settings(), transport=transport) as client:
+        response = await client.post("https://hooks.example.com/alert", content=b"{}")
+
+    assert response.status_code == 503
+    assert REGISTRY.get_sample_value("http_client_requests_total", labels("5xx")) == before + 1
+
+    errors = REGISTRY.get_sample_value("http_client_requests_total", labels("error")) or 0
+
+    def time_out(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    async with build_client(
+        "webhook", Settings(), transport=httpx.MockTransport(time_out)
+    ) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            await client.post("https://hooks.example.com/alert", content=b"{}")
+
+    assert REGISTRY.get_sample_value("http_client_requests_total", labels("error")) == errors + 1
+
+
+class _BrokenBody(httpx.AsyncByteStream):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b"{"
+        raise httpx.RemoteProtocolError("peer closed connection")
+
+
+@pytest.mark.asyncio
+async def test_body_read_failure_is_counted_once_as_error() -> None:
+    def count(status: str) -> float:
+        labels = {"destination": "loki", "status": status}
+        return REGISTRY.get_sample_value("http_client_requests_total", labels) or 0
+
+    before = {status: count(status) for status in ("2xx", "error")}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=_BrokenBody()))
+
+    async with build_client("loki", Settings(), transport=transport) as client:
+        with pytest.raises(httpx.RemoteProtocolError):
+            await client.get("https://loki.example.com/loki/api/v1/query_range")
+
+    assert count("2xx") == before["2xx"]
+    assert count("error") == before["error"] + 1
+    assert (
+        REGISTRY.get_sample_value(
+            "http_client_request_duration_seconds_count", {"destination": "webhook"}
+        )
+        or 0
+    ) >= 1
@@ -0,0 +1,95 @@
+import math
+import random
+
+from app.cache.local_rate_limiter import CountMinSketch, LocalPreLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 6000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_count_min_sketch_never_undercounts() -> None:
+    sketch = CountMinSketch(width=64, depth=4)
+    rng = random.Random(7)
+    truth: dict[str, int] = {}
+    for _ in range(5000):
+        key = f"ip:{rng.randrange(500)}"
+        truth[key] = truth.get(key, 0) + 1
+        sketch.add(key)
+
+    assert all(sketch.estimate(key) >= count for key, count in truth.items())
+
+
+def test_count_min_sketch_error_shrinks_with_width() -> None:
+    rng = random.Random(11)
+    keys = [f"ip:{rng.randrange(2000)}" for _ in range(20000)]
+    truth: dict[str, int] = {}
+    for key in keys:
+        truth[key] = truth.get(key, 0) + 1
+
+    def mean_overcount(width: int) -> float:
+        sketch = CountMinSketch(width=width, depth=4)
+        for key in keys:
+            sketch.add(key)
+        return sum(sketch.estimate(key) - count for key, count in truth.items()) / len(truth)
+
+    narrow, wide = mean_overcount(128), mean_overcount(4096)
+    assert wide < narrow
+    assert wide <= math.e * len(keys) / 4096
+
+
+def test_count_min_sketch_memory_is_fixed() -> None:
+    sketch = CountMinSketch(width=2048, depth=4)
+    before = sketch.memory_bytes
+    for index in range(10000):
+        sketch.add(f"ip:{index}")
+    assert sketch.memory_bytes == before == 2048 * 4 * 4
+
+
+def test_pre_limiter_refuses_after_threshold_until_window_ends() -> None:
+    clock = FakeClock()
+    limiter = LocalPreLimiter(threshold=1.0, clock=clock)
+
+    verdicts = [limiter.check("ip:a", limit=3, window_seconds=60) for _ in range(4)]
+    assert verdicts[:3] == [None, None, None]
+    assert verdicts[3] == 60_000
+
+    assert limiter.check("ip:b", limit=3, window_seconds=60) is None
+
+    clock.now += 30
+    assert limiter.check("ip:a", limit=3, window_seconds=60) == 30_000
+
+    clock.now += 30
+    assert limiter.check("ip:a", limit=3, window_seconds=60) is None
+
+
+def test_pre_limiter_default_threshold_tolerates_boundary_bursts() -> None:
+    limiter = LocalPreLimiter(clock=FakeClock())
+    verdicts = [limiter.check("ip:a", limit=3, window_seconds=60) for _ in range(7)]
+    assert verdicts[:6] == [None] * 6
+    assert verdicts[6] is not None
+
+
+def test_pre_limiter_honours_redis_block() -> None:
+    clock = FakeClock()
+    limiter = LocalPreLimiter(clock=clock)
+    assert limiter.check("ip:a", limit=100, window_seconds=60) is None
+
+    limiter.block("ip:a", 1500)
+    assert limiter.check("ip:a", limit=100, window_seconds=60) == 1500
+
+    clock.now += 2
+    assert limiter.check("ip:a", limit=100, window_seconds=60) is None
+
+
+def test_pre_limiter_bounds_blocked_entries() -> None:
+    limiter = LocalPreLimiter(max_blocked=2, clock=FakeClock())
+    for key in ("ip:a", "ip:b", "ip:c"):
+        limiter.block(key, 10_000)
+
+    assert limiter.check("ip:a", limit=100, window_seconds=60) is None
+    assert limiter.check("ip:c", limit=100, window_seconds=60) == 10_000
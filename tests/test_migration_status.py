@@ -1,8 +1,22 @@
+import os
+from pathlib import Path
+
 import pytest
+from prometheus_client import REGISTRY
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.migration_status import _alembic_head_revision, get_migration_status
+from app.services import migration_status
+from app.services.migration_status import (
+    alembic_head_revision,
+    get_migration_status,
+    reset_migration_status_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_revision_cache() -> None:
+    reset_migration_status_cache()
 
 
 @pytest.mark.asyncio
@@ -18,7 +32,7 @@ async def test_migration_status_without_alembic_table(db_session: AsyncSession)
 
 @pytest.mark.asyncio
 async def test_migration_status_at_head_when_revision_matches(db_session: AsyncSession) -> None:
-    head = _alembic_head_revision()
+    head = alembic_head_revision()
     assert head is not None
 
     await db_session.execute(
@@ -39,7 +53,7 @@ async def test_migration_status_at_head_when_revision_matches(db_session: AsyncS
 
 @pytest.mark.asyncio
 async def test_migration_status_not_at_head_when_revision_differs(db_session: AsyncSession) -> None:
-    head = _alembic_head_revision()
+    head = alembic_head_revision()
     assert head is not None
 
     await db_session.execute(
@@ -55,3 +69,70 @@ async def test_migration_status_not_at_head_when_revision_differs(db_session: As
     assert at_head is False
     assert current == "stale-revision"
     assert reported_head == head
+
+
+class FakeScripts:
+    parsed = 0
+
+    @classmethod
+    def from_config(cls, _config: object) -> "FakeScripts":
+        cls.parsed += 1
+        return cls()
+
+    def get_current_head(self) -> str:
+        return "head-rev"
+
+
+class FakeResult:
+    def __init__(self, value: str | None) -> None:
+        self.value = value
+
+    def scalar_one_or_none(self) -> str | None:
+        return self.value
+
+
+class FakeSession:
+    def __init__(self, revision: str | None) -> None:
+        self.revision = revision
+        self.queries = 0
+
+    async def execute(self, _statement: object) -> FakeResult:
+        self.queries += 1
+        return FakeResult(self.revision)
+
+
+@pytest.fixture
+def fake_scripts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    script = tmp_path / "001_initial.py"
+    script.write_text("")
+    FakeScripts.parsed = 0
+    monkeypatch.setattr(migration_status, "ScriptDirectory", FakeScripts)
+    monkeypatch.setattr(migration_status, "_VERSIONS_DIR", tmp_path)
+    monkeypatch.setattr(migration_status, "_head", None)
+    return script
+
+
+def test_head_revision_is_reparsed_only_after_a_script_changes(fake_scripts: Path) -> None:
+    assert alembic_head_revision() == "head-rev"
+    assert alembic_head_revision() == "head-rev"
+    assert FakeScripts.parsed == 1
+
+    later = fake_scripts.stat().st_mtime + 10
+    os.utime(fake_scripts, (later, later))
+    alembic_head_revision()
+    assert FakeScripts.parsed == 2
+
+
+@pytest.mark.asyncio
+async def test_revision_read_is_reused_within_max_age(fake_scripts: Path) -> None:
+    session = FakeSession("head-rev")
+
+    assert (await get_migration_status(session, max_age=30))[0] is True  # type: ignore[arg-type]
+    session.revision = "older-rev"
+    assert (await get_migration_status(session, max_age=30))[0] is True  # type: ignore[arg-type]
+    assert session.queries == 1
+    assert REGISTRY.get_sample_value("db_migration_at_head") == 1
+
+    at_head, current, _ = await get_migration_status(session)  # type: ignore[arg-type]
+    assert (at_head, current) == (False, "older-rev")
+    assert REGISTRY.get_sample_value("db_migration_at_head") == 0
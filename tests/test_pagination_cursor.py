@@ -0,0 +1,67 @@
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import AppException
+from app.models.audit_log import AuditLog
+from app.repositories.pagination import (
+    INVALID_CURSOR_CODE,
+    Cursor,
+    keyset_page,
+    split_page,
+)
+
+
+@dataclass
+class _Row:
+    id: uuid.UUID
+    created_at: datetime
+
+
+def _rows(count: int) -> list[_Row]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [_Row(uuid.uuid4(), start - timedelta(seconds=i)) for i in range(count)]
+
+
+def test_cursor_round_trips() -> None:
+    cursor = Cursor(datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC), uuid.uuid4())
+    token = cursor.encode()
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "WyJ4Il0", "WzEsMl0"])
+def test_cursor_decode_rejects_garbage(token: str) -> None:
+    with pytest.raises(AppException) as exc_info:
+        Cursor.decode(token)
+    assert exc_info.value.code == INVALID_CURSOR_CODE
+    assert exc_info.value.status_code == 400
+
+
+def test_split_page_trims_look_ahead_row() -> None:
+    rows = _rows(3)
+    items, next_cursor = split_page(rows, 2)
+    assert items == rows[:2]
+    assert next_cursor is not None
+    assert Cursor.decode(next_cursor) == Cursor(rows[1].created_at, rows[1].id)
+
+    items, next_cursor = split_page(rows[:2], 2)
+    assert items == rows[:2]
+    assert next_cursor is None
+
+
+def test_keyset_page_seeks_with_row_comparison() -> None:
+    cursor = Cursor(datetime(2026, 1, 1, tzinfo=UTC), uuid.uuid4())
+    query = keyset_page(
+        select(AuditLog), AuditLog.created_at, AuditLog.id, cursor=cursor, page_size=20
+    )
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "(audit_logs.created_at, audit_logs.id) < (" in sql
+    assert "audit_logs.created_at <= " in sql
+    assert "ORDER BY audit_logs.created_at DESC, audit_logs.id DESC" in sql
+    assert "OFFSET" not in sql
+    assert 21 in query.compile(dialect=postgresql.dialect()).params.values()
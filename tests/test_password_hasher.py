@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+from app.core import password_hasher
+from app.core.exceptions import AppException
+from app.core.password_hasher import PASSWORD_HASH_BUSY_CODE, PasswordHasher, close_password_hasher
+
+
+@pytest.fixture
+def hasher():
+    pool = PasswordHasher(workers=1, max_pending=0)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_roundtrip(hasher: PasswordHasher) -> None:
+    hashed = await hasher.hash("securepass123")
+    assert await hasher.verify("securepass123", hashed)
+    assert not await hasher.verify("wrong-password", hashed)
+    assert hasher.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_saturated(hasher: PasswordHasher) -> None:
+    busy = asyncio.create_task(hasher._submit("hash", time.sleep, 0.2))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AppException) as exc_info:
+        await hasher.hash("securepass123")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.code == PASSWORD_HASH_BUSY_CODE
+    await busy
+    assert hasher.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_keeps_event_loop_responsive(hasher: PasswordHasher) -> None:
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    await hasher.hash("securepass123")
+    ticking.cancel()
+
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_running_jobs_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pool = PasswordHasher(workers=1, max_pending=0)
+    monkeypatch.setattr(password_hasher, "_password_hasher", pool)
+    busy = asyncio.create_task(pool._submit("hash", time.sleep, 0.2))
+    await asyncio.sleep(0)
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    await close_password_hasher()
+    ticking.cancel()
+
+    assert busy.done()
+    assert ticks > 1
+    assert password_hasher._password_hasher is None
@@ -0,0 +1,126 @@
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.principal import Principal, PrincipalCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _principal(**overrides: object) -> Principal:
+    values: dict[str, object] = {
+        "id": uuid.uuid4(),
+        "email": "cached@example.com",
+        "is_active": True,
+        "role": "user",
+        "created_at": datetime.now(UTC),
+    }
+    values.update(overrides)
+    return Principal(**values)  # type: ignore[arg-type]
+
+
+def _local_cache(clock: FakeClock, **kwargs: object) -> PrincipalCache:
+    return PrincipalCache(redis_enabled=False, clock=clock, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_hit_after_set() -> None:
+    cache = _local_cache(FakeClock())
+    principal = _principal()
+
+    assert await cache.get(principal.id) is None
+    await cache.set(principal)
+    assert await cache.get(principal.id) == principal
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_entry_expires_after_local_ttl() -> None:
+    clock = FakeClock()
+    cache = _local_cache(clock, local_ttl_seconds=5.0)
+    principal = _principal()
+    await cache.set(principal)
+
+    clock.now += 4.9
+    assert await cache.get(principal.id) == principal
+    clock.now += 0.2
+    assert await cache.get(principal.id) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_evicts_least_recently_used() -> None:
+    cache = _local_cache(FakeClock(), max_entries=2)
+    first, second, third = _principal(), _principal(), _principal()
+    await cache.set(first)
+    await cache.set(second)
+    assert await cache.get(first.id) == first
+
+    await cache.set(third)
+
+    assert await cache.get(second.id) is None
+    assert await cache.get(first.id) == first
+    assert await cache.get(third.id) == third
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidate_drops_entry() -> None:
+    cache = _local_cache(FakeClock())
+    principal = _principal()
+    await cache.set(principal)
+
+    await cache.invalidate(principal.id)
+
+    assert await cache.get(principal.id) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_on_commit_drops_a_principal_cached_before_the_commit() -> None:
+    cache = _local_cache(FakeClock())
+    stale = _principal(role="admin")
+    await cache.set(stale)
+    session = AsyncSession()
+
+    await cache.invalidate_on_commit(session, stale.id)
+    # A concurrent request misses and re-caches the still-committed old row.
+    await cache.set(stale)
+    await session.commit()
+    await asyncio.sleep(0)
+
+    assert await cache.get(stale.id) is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_on_commit_is_discarded_on_rollback() -> None:
+    cache = _local_cache(FakeClock())
+    principal = _principal()
+    session = AsyncSession()
+    await session.begin()
+
+    await cache.invalidate_on_commit(session, principal.id)
+    await session.rollback()
+    await cache.set(principal)
+    await session.commit()
+
+    assert await cache.get(principal.id) == principal
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_disabled_never_stores() -> None:
+    cache = _local_cache(FakeClock(), enabled=False)
+    principal = _principal()
+    await cache.set(principal)
+    assert await cache.get(principal.id) is None
+
+
+def test_principal_cache_payload_roundtrip() -> None:
+    principal = _principal(role="admin", is_active=False)
+    assert Principal.from_cache(principal.to_cache()) == principal
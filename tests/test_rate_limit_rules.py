@@ -0,0 +1,60 @@
+from app.cache.rate_limiter import RateLimitResult
+from app.core.config import RateLimitRule, Settings
+from app.middleware.rate_limit import rate_limit_headers, resolve_rule
+
+
+def _settings(**overrides: object) -> Settings:
+    return Settings(
+        environment="test",
+        database_url="postgresql+asyncpg://unused",
+        redis_url="redis://unused",
+        jwt_secret="test-secret-key-for-jwt-signing-32chars",
+        **overrides,  # type: ignore[arg-type]
+    )
+
+
+def test_resolve_rule_defaults_to_global_limit() -> None:
+    rule = resolve_rule("/api/v1/auth/me", _settings(rate_limit_per_minute=42))
+    assert rule.prefix == "/api/v1"
+    assert rule.limit == 42
+    assert rule.window_seconds == 60
+    assert rule.scope == "ip"
+
+
+def test_resolve_rule_prefers_longest_matching_prefix() -> None:
+    settings = _settings(
+        rate_limit_rules=[
+            RateLimitRule(prefix="/api/v1/auth", limit=50),
+            RateLimitRule(prefix="/api/v1/auth/login", limit=5, algorithm="token_bucket"),
+        ]
+    )
+    assert resolve_rule("/api/v1/auth/login", settings).limit == 5
+    assert resolve_rule("/api/v1/auth/me", settings).limit == 50
+    assert resolve_rule("/api/v1/admin/users", settings).limit == settings.rate_limit_per_minute
+
+
+def test_rate_limit_rules_parse_from_env_json(monkeypatch) -> None:
+    monkeypatch.setenv(
+        "RATE_LIMIT_RULES",
+        '[{"prefix": "/api/v1/admin", "limit": 300, "scope": "principal"}]',
+    )
+    settings = _settings()
+    assert settings.rate_limit_rules == [
+        RateLimitRule(prefix="/api/v1/admin", limit=300, scope="principal")
+    ]
+
+
+def test_rate_limit_headers_include_retry_after_only_when_blocked() -> None:
+    allowed = RateLimitResult(allowed=True, limit=10, remaining=9, retry_after_ms=0, reset_ms=1500)
+    assert rate_limit_headers(allowed) == {
+        "X-RateLimit-Limit": "10",
+        "X-RateLimit-Remaining": "9",
+        "X-RateLimit-Reset": "2",
+    }
+
+    blocked = RateLimitResult(
+        allowed=False, limit=10, remaining=0, retry_after_ms=200, reset_ms=30_000
+    )
+    headers = rate_limit_headers(blocked)
+    assert headers["Retry-After"] == "1"
+    assert headers["X-RateLimit-Reset"] == "30"
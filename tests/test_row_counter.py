@@ -0,0 +1,128 @@
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.audit_log import AuditLog
+from app.repositories import counting
+from app.repositories.counting import RowCounter, _ExplainJson, cache_key
+
+
+class FakeSession:
+    """Answers the three statements RowCounter issues: reltuples, EXPLAIN and count(*)."""
+
+    def __init__(self, *, reltuples: float = -1, plan_rows: int = 0, exact: int = 0) -> None:
+        self.reltuples = reltuples
+        self.plan_rows = plan_rows
+        self.exact = exact
+        self.statements: list[str] = []
+
+    @asynccontextmanager
+    async def begin_nested(self) -> AsyncIterator[None]:
+        yield
+
+    async def scalar(self, statement: Any, _params: Any = None) -> Any:
+        if isinstance(statement, _ExplainJson):
+            self.statements.append("explain")
+            return json.dumps([{"Plan": {"Plan Rows": self.plan_rows}}])
+        if "reltuples" in str(statement):
+            self.statements.append("reltuples")
+            return self.reltuples
+        self.statements.append("count")
+        return self.exact
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: object, ex: int | None = None) -> None:
+        self.values[key] = str(value)
+
+
+@pytest.fixture(autouse=True)
+def forget_table_sizes() -> None:
+    counting._table_rows.clear()
+
+
+def _counter(session: FakeSession, **kwargs: Any) -> RowCounter:
+    return RowCounter(session, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_auto_uses_reltuples_for_large_unfiltered_tables() -> None:
+    session = FakeSession(reltuples=2_500_000, exact=2_500_123)
+    result = await _counter(session, strategy="auto", estimate_threshold=100_000).count(
+        select(AuditLog), table="audit_logs", filters={"action": None}
+    )
+    assert (result.value, result.estimated) == (2_500_000, True)
+    assert session.statements == ["reltuples"]
+
+
+@pytest.mark.asyncio
+async def test_auto_counts_exactly_below_threshold() -> None:
+    session = FakeSession(plan_rows=40, exact=37)
+    query = select(AuditLog).where(AuditLog.action == "user.update")
+    result = await _counter(session, strategy="auto", estimate_threshold=100_000).count(
+        query, table="audit_logs", filters={"action": "user.update"}
+    )
+    assert (result.value, result.estimated) == (37, False)
+    assert session.statements == ["reltuples", "explain", "count"]
+
+
+@pytest.mark.asyncio
+async def test_auto_counts_small_tables_exactly_without_explain() -> None:
+    session = FakeSession(reltuples=800, plan_rows=40, exact=37)
+    counter = _counter(session, strategy="auto", estimate_threshold=100_000)
+    query = select(AuditLog).where(AuditLog.action == "user.update")
+
+    for _ in range(2):
+        result = await counter.count(query, table="audit_logs", filters={"action": "user.update"})
+        assert (result.value, result.estimated) == (37, False)
+    assert session.statements == ["reltuples", "count", "count"]
+
+
+@pytest.mark.asyncio
+async def test_estimate_falls_back_to_exact_for_unanalyzed_table() -> None:
+    session = FakeSession(reltuples=-1, exact=12)
+    result = await _counter(session, strategy="estimate").count(
+        select(AuditLog), table="audit_logs", filters={}
+    )
+    assert (result.value, result.estimated) == (12, False)
+
+
+@pytest.mark.asyncio
+async def test_cached_strategy_reuses_count_per_filter_set() -> None:
+    redis = FakeRedis()
+    session = FakeSession(exact=5)
+    counter = _counter(session, strategy="cached", redis=redis, cache_ttl_seconds=30)
+    query = select(AuditLog)
+
+    first = await counter.count(query, table="audit_logs", filters={"action": "a"})
+    assert (first.value, first.estimated) == (5, False)
+    session.exact = 6
+    hit = await counter.count(query, table="audit_logs", filters={"action": "a"})
+    assert (hit.value, hit.estimated) == (5, True)
+    miss = await counter.count(query, table="audit_logs", filters={"action": "b"})
+    assert (miss.value, miss.estimated) == (6, False)
+    assert session.statements == ["count", "count"]
+
+
+def test_cache_key_ignores_filter_order() -> None:
+    assert cache_key("users", {"role": "admin", "email": "x"}) == cache_key(
+        "users", {"email": "x", "role": "admin"}
+    )
+
+
+def test_explain_wraps_filtered_select() -> None:
+    query = select(AuditLog).where(AuditLog.action == "user.update")
+    sql = str(_ExplainJson(query).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "WHERE audit_logs.action = " in sql
@@ -13,7 +13,7 @@ def test_check_and_send_alerts_runs_twice_without_event_loop_error(
     test_settings,
     monkeypatch,
 ) -> None:
-    """Celery uses asyncio.run per invocation; engine must be disposed between runs."""
+    """Without a worker runtime each run gets its own loop; the engine must not outlive it."""
     get_settings.cache_clear()
     monkeypatch.setattr("app.core.config.get_settings", lambda: test_settings)
     monkeypatch.setattr(AlertMonitorService, "run_check", _noop_run_check)
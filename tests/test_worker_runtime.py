@@ -0,0 +1,56 @@
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+
+from app.cache import redis as redis_cache
+from app.core.config import Settings
+from app.db import session as db_session
+from app.tasks import runtime
+from app.tasks.runtime import close_worker_runtime, run_async, start_worker_runtime
+
+
+async def _resources() -> tuple[asyncio.AbstractEventLoop, object, object]:
+    return (
+        asyncio.get_running_loop(),
+        redis_cache.get_redis_client(),
+        db_session.get_engine(),
+    )
+
+
+@pytest.fixture
+def worker_runtime() -> Iterator[None]:
+    start_worker_runtime(Settings(redis_url="redis://localhost:6399/0"))
+    try:
+        yield
+    finally:
+        close_worker_runtime()
+
+
+def test_runtime_reuses_loop_engine_and_redis_pool(worker_runtime: None) -> None:
+    first = run_async(_resources())
+    second = run_async(_resources())
+
+    assert first == second
+    assert not first[0].is_closed()
+
+
+def test_close_disposes_engine_and_pool(worker_runtime: None) -> None:
+    loop, _redis, _engine = run_async(_resources())
+
+    close_worker_runtime()
+
+    assert runtime._loop is None
+    assert loop.is_closed()
+    assert db_session._engine is None
+    assert redis_cache._redis is None
+
+
+def test_without_runtime_each_run_opens_and_closes_its_own_resources() -> None:
+    first = run_async(_resources())
+    second = run_async(_resources())
+
+    assert first[0] is not second[0]
+    assert first[1] is not second[1]
+    assert db_session._engine is None
+    assert redis_cache._redis is None